@@ -0,0 +1,126 @@
+##
+# File:    CacheFileUtil.py
+# Date:    18-Oct-2026
+#
+#  Updates:
+#  18-Oct-2026  Document that cache lock files persist in the cache directory
+##
+"""
+Cross-process locking and atomic writes for cache files shared by concurrent processes.
+
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+try:
+    import fcntl
+except ImportError:
+    # Windows - cache files are written atomically but rebuilds are not serialized
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class CacheFileUtil(object):
+    """Serialize cache rebuilds across processes and replace cache files atomically.
+
+    Locks are advisory (flock) locks on a companion '<cache file>.lock' file.  They are released
+    when the holder exits (including on a crash), so a failed rebuild never leaves a stale lock.
+    Locking is skipped on platforms without fcntl.
+
+    The (empty) lock files persist in the cache directory.  They are not removed after a rebuild, since
+    a process waiting on a removed lock file would hold a lock that a later process no longer sees.
+    """
+
+    def __init__(self, timeout=3600, pollInterval=0.5):
+        """Cache file utility.
+
+        Args:
+            timeout (int, optional): maximum time (seconds) to wait for a cache lock before proceeding without it. Defaults to 3600.
+            pollInterval (float, optional): lock retry interval (seconds). Defaults to 0.5.
+        """
+        self.__timeout = timeout
+        self.__pollInterval = pollInterval
+
+    @contextmanager
+    def lock(self, filePath):
+        """Hold the exclusive rebuild lock for the input cache file (waiting for any other holder).
+
+        Args:
+            filePath (str): cache file path
+
+        Yields:
+            (bool): True if the lock is held or False if locking is unavailable or timed out
+        """
+        lfh = None
+        locked = False
+        try:
+            if fcntl is not None:
+                try:
+                    lfh = open(filePath + ".lock", "a", encoding="utf-8")  # pylint: disable=consider-using-with
+                    locked = self.__acquire(lfh, filePath)
+                except OSError as e:
+                    logger.warning("Unable to lock %s (%s) - proceeding without lock", filePath, str(e))
+            yield locked
+        finally:
+            if lfh is not None:
+                if locked:
+                    fcntl.flock(lfh.fileno(), fcntl.LOCK_UN)
+                lfh.close()
+
+    def __acquire(self, lfh, filePath):
+        startTime = time.time()
+        waiting = False
+        while True:
+            try:
+                fcntl.flock(lfh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                if waiting:
+                    logger.info("Acquired cache lock for %s after %.2f seconds", filePath, time.time() - startTime)
+                return True
+            except (BlockingIOError, PermissionError):
+                if self.__timeout is not None and time.time() - startTime > self.__timeout:
+                    logger.warning("Timeout waiting %.1f seconds for cache lock for %s - proceeding without lock", self.__timeout, filePath)
+                    return False
+                if not waiting:
+                    logger.info("Waiting for a concurrent rebuild of %s", filePath)
+                    waiting = True
+                time.sleep(self.__pollInterval)
+
+    @staticmethod
+    def isFresh(filePath, sinceTime):
+        """Return True if the input file exists and was (re)written at or after the input time (seconds since the epoch)."""
+        try:
+            return os.stat(filePath).st_mtime >= sinceTime
+        except OSError:
+            return False
+
+    @staticmethod
+    def exportAtomic(filePath, obj, fmt="json", **kwargs):
+        """Export data to a temporary file and rename it into place (readers see either the previous or the new file).
+
+        Args:
+            filePath (str): output file path
+            obj (obj): data to export
+            fmt (str, optional): MarshalUtil export format. Defaults to "json".
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        tmpPath = filePath + ".%d.tmp" % os.getpid()
+        try:
+            ok = MarshalUtil().doExport(tmpPath, obj, fmt=fmt, **kwargs)
+            if ok:
+                os.replace(tmpPath, filePath)
+                return True
+        except Exception as e:
+            logger.exception("Failing exporting %s with %s", filePath, str(e))
+        try:
+            os.remove(tmpPath)
+        except Exception:
+            pass
+        return False
@@ -4,13 +4,44 @@
 #
 # Updates:
 # 21-Jul-2021 jdw  Make this provider a subclass of StashableBase
+# 18-Oct-2026      Add getMedlineJournalIsoAbbreviations() title to ISO abbreviation accessor
+# 18-Oct-2026      Hold Medline and CrossRef journal records in compact ISSN indices (JournalIssnIndex)
+# 18-Oct-2026      Add storageBackend="sqlite" option serving lookups from a shared SQLite file (JournalIssnStore)
+# 18-Oct-2026      Load each reference source lazily on first access, add sources= preload option
+# 18-Oct-2026      Stream CrossRef title list rows skipping empty ISSNs
+# 18-Oct-2026      Fetch and parse reference sources in concurrent workers
+# 18-Oct-2026      Add conditionalRefresh option skipping unchanged sources and applying journal changes incrementally
+# 18-Oct-2026      Add getJournalRecords() bulk lookup of merged Medline and CrossRef records
+# 18-Oct-2026      Add reverse indices from normalized journal titles and abbreviations to ISSNs
+# 18-Oct-2026      Add findJournalCandidates() fuzzy title matching with a character n-gram index
+# 18-Oct-2026      Key journal records by canonical checksum-validated ISSNs and normalize query ISSNs (normalizeIssn())
+# 18-Oct-2026      Add publishSharedTables() and sharedTables= option serving journal indices from shared memory
+# 18-Oct-2026      Serialize cache rebuilds across processes with file locks and write cache files atomically
+# 18-Oct-2026      Resolve Medline journal titles with several ISO abbreviations deterministically in getMedlineJournalIsoAbbreviations()
+# 18-Oct-2026      Compute journal name keys with the shared JournalNameUtil.getNameKey()
+# 18-Oct-2026      Normalize the ISSN keys of journal caches written before canonical ISSNs and rebuild older SQLite stores
+# 18-Oct-2026      Rebuild SQLite stores older than the cached journal records rather than removing them on memory backend rebuilds
 ##
 
 import copy
+import json
 import logging
 import os
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
 
+from rcsb.utils.citation.CacheFileUtil import CacheFileUtil
+from rcsb.utils.citation.JournalIssnIndex import JournalIssnIndex
+from rcsb.utils.citation.JournalIssnStore import JournalIssnStore
+from rcsb.utils.citation.JournalNameUtil import JournalNameUtil
+from rcsb.utils.citation.JournalTitleNgramIndex import JournalTitleNgramIndex
+from rcsb.utils.citation.SourceRefreshUtil import SourceRefreshUtil
 from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.io.IoUtil import IoUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.io.StashableBase import StashableBase
 
@@ -22,8 +53,38 @@ class CitationReferenceProvider(StashableBase):
     mapping between Journal names and ISSN/EISSN identifiers.  Provide accessors
     for searching these mappings.
 
+    Journal records are either held in memory (storageBackend="memory", default) or
+    served by point queries on an indexed SQLite file in the cache directory
+    (storageBackend="sqlite") which is shared by concurrent worker processes.
+
+    Each source (medline, crossref) is loaded on first access.  Sources listed in the
+    sources= option (e.g. sources=["medline"]) are loaded at construction.
+
+    With useCache=False and conditionalRefresh=True, sources that are unchanged upstream
+    (ETag, Last-Modified or content hash) are not downloaded or parsed again, and only
+    added, changed or removed journals are applied to an existing SQLite store.
+
+    Journal indices built once (e.g., in the parent of a worker pool) can be published in shared memory
+    with publishSharedTables().  Providers created with sharedTables=<shared memory name> search the
+    published indices in place without fetching or parsing any reference data.
+
+    Concurrent processes sharing a cache directory rebuild each cache file once: a rebuild holds a lock
+    on the cache file, cache files are replaced atomically, and processes waiting for the lock reuse the
+    rebuilt file (lockTimeout= sets the maximum wait in seconds).
+
+    Medline and CrossRef ISSNs are held in the canonical form 'NNNN-NNNC' (see normalizeIssn()),
+    and ISSN arguments in any accepted form are normalized before lookup.  Malformed ISSNs and
+    ISSNs with an invalid check digit are dropped from the reference data and never match.
     """
 
+    MEDLINE_FIELDS = ["journal_title", "iso_abbrev", "medline_abbrev", "issn_print", "issn_online"]
+    CROSSREF_FIELDS = ["journal_title", "issn_print", "issn_online", "doi"]
+    ISSN_CHECK_CHARS = "0123456789X"
+    # weighted (8, 7, 6, 5) sums of the first four and (4, 3, 2) sums of the next three ISSN digits
+    ISSN_PREFIX_SUMS = {"%04d" % i: 8 * (i // 1000) + 7 * (i // 100 % 10) + 6 * (i // 10 % 10) + 5 * (i % 10) for i in range(10000)}
+    ISSN_SUFFIX_SUMS = {"%03d" % i: 4 * (i // 100) + 3 * (i // 10 % 10) + 2 * (i % 10) for i in range(1000)}
+    SHARED_TABLES_MAGIC = b"CRTABLE1"
+
     def __init__(self, **kwargs):
         dirName = "citation-reference"
         cachePath = kwargs.get("cachePath", ".")
@@ -31,105 +92,575 @@ class CitationReferenceProvider(StashableBase):
 
         urlTargetCrossRef = kwargs.get("urlTargetCrossRef", "http://ftp.crossref.org/titlelist/titleFile.csv")
         urlTargetMedline = kwargs.get("urlTargetMedline", "https://ftp.ncbi.nlm.nih.gov/pubmed/J_Medline.txt")
-        dirPath = os.path.join(cachePath, dirName)
-        useCache = kwargs.get("useCache", True)
-        #
-        self.__mlIssnD, self.__crIssnD = self.__rebuildCache(urlTargetMedline, urlTargetCrossRef, dirPath, useCache)
+        self.__dirPath = os.path.join(cachePath, dirName)
+        self.__useCache = kwargs.get("useCache", True)
+        self.__storageBackend = kwargs.get("storageBackend", "memory")
+        self.__lookupCacheSize = kwargs.get("lookupCacheSize", 10000)
+        self.__conditionalRefresh = kwargs.get("conditionalRefresh", False)
+        # Maximum time (seconds) to wait for a cache rebuild by a concurrent process
+        self.__cfU = CacheFileUtil(timeout=kwargs.get("lockTimeout", 3600))
+        # Name of a shared memory block holding journal indices published by publishSharedTables()
+        self.__sharedTables = kwargs.get("sharedTables", None)
+        self.__shm = None
+        # Journal record changes by source {source: ({issn: record, ...} added or changed, [issn, ...] removed)} from a conditional refresh
+        self.__deltaD = {}
+        # Sources are loaded on first access unless listed in sources=
+        sources = kwargs.get("sources", [])
+        sources = [sources] if isinstance(sources, str) else sources
+        self.__urlTargetD = {"medline": urlTargetMedline, "crossref": urlTargetCrossRef}
+        self.__fieldNameD = {"medline": self.MEDLINE_FIELDS, "crossref": self.CROSSREF_FIELDS}
+        self.__issnIdxD = {}
+        # Reverse indices {(source, fieldName): {normalized name: (issn, ...), ...}, ...} built on first use
+        self.__nameIdxD = {}
+        self.__nameFieldD = {"medline": ["journal_title", "medline_abbrev", "iso_abbrev"], "crossref": ["journal_title"]}
+        # Character n-gram index over the Medline and CrossRef journal titles built on first use
+        self.__titleNgramIdx = None
+        self.__lock = threading.RLock()
+        for source in sources:
+            if source not in self.__urlTargetD:
+                raise ValueError("Unsupported citation reference source %r" % source)
+        self.__loadSources(sources)
+
+    def __getIssnIndex(self, source):
+        """Return the journal ISSN index for the input source loading (or building) it on first access."""
+        issnIdx = self.__issnIdxD.get(source)
+        if issnIdx is None:
+            self.__loadSources([source])
+            issnIdx = self.__issnIdxD[source]
+        return issnIdx
+
+    def __loadSources(self, sourceL):
+        """Load (or build) the journal ISSN indices for the input sources (sources requiring a rebuild are refreshed concurrently)."""
+        with self.__lock:
+            sourceL = [source for source in sourceL if source not in self.__issnIdxD]
+            if not sourceL:
+                return
+            if self.__sharedTables:
+                self.__issnIdxD.update(self.__attachSharedTables(self.__sharedTables))
+                return
+            if self.__storageBackend == "sqlite":
+                # the SQLite store holds all sources
+                self.__issnIdxD.update(self.__openStore(self.__dirPath, self.__useCache, self.__lookupCacheSize))
+                return
+            for source, issnD in self.__rebuildSources(sourceL, self.__dirPath, self.__useCache).items():
+                # Journal records are held once in column form with integer encoded ISSN keys
+                self.__issnIdxD[source] = JournalIssnIndex(issnD, fieldNames=self.__fieldNameD[source])
+                logger.debug("Journal ISSN index %s memory %d (bytes)", source, self.__issnIdxD[source].getMemorySize())
 
     def getMedlineJournalIsoAbbreviation(self, issn):
-        jAbbrev = None
-        try:
-            jAbbrev = self.__mlIssnD[issn]["iso_abbrev"]
-        except Exception:
-            pass
-        return jAbbrev
+        return self.__getJournalField("medline", issn, "iso_abbrev")
 
     def getMedlineJournalAbbreviation(self, issn):
-        jAbbrev = None
-        try:
-            jAbbrev = self.__mlIssnD[issn]["medline_abbrev"]
-        except Exception:
-            pass
-        return jAbbrev
+        return self.__getJournalField("medline", issn, "medline_abbrev")
 
     def getMedlineJournalTitle(self, issn):
-        jT = None
-        try:
-            jT = self.__mlIssnD[issn]["journal_title"]
-        except Exception:
-            pass
-        return jT
+        return self.__getJournalField("medline", issn, "journal_title")
+
+    def __getJournalField(self, source, issn, fieldName):
+        issn = self.normalizeIssn(issn)
+        return self.__getIssnIndex(source).get(issn, fieldName) if issn else None
+
+    def getMedlineJournalIsoAbbreviations(self):
+        """Return the Medline ISO abbreviations for all journal titles.
+
+        Journal titles shared by Medline journals with different ISO abbreviations are logged
+        and take the first of their abbreviations in sorted order (independent of the record order).
+
+        Returns:
+            (dict): {journal title: ISO abbreviation, ...}
+        """
+        abbrevD = {}
+        for dD in self.__getIssnIndex("medline").iterRecords():
+            if "journal_title" in dD and "iso_abbrev" in dD:
+                abbrevD.setdefault(dD["journal_title"], set()).add(dD["iso_abbrev"])
+        rD = {}
+        numShared = 0
+        for title, abbrevS in abbrevD.items():
+            abbrevL = sorted(abbrevS)
+            if len(abbrevL) > 1:
+                numShared += 1
+                logger.debug("Medline journal title %r has ISO abbreviations %r - using %r", title, abbrevL, abbrevL[0])
+            rD[title] = abbrevL[0]
+        if numShared:
+            logger.warning("Medline journal titles with more than one ISO abbreviation %d", numShared)
+        return rD
 
     def getCrossRefJournalTitle(self, issn):
-        jT = None
+        return self.__getJournalField("crossref", issn, "journal_title")
+
+    @staticmethod
+    def normalizeIssn(issn):
+        """Return the canonical form 'NNNN-NNNC' of the input ISSN or None if it is malformed or its check digit is invalid.
+
+        Surrounding whitespace and hyphens are ignored, a lower case check character 'x' is accepted and
+        leading zeros may be omitted (e.g. '219258', '00219258' and '0021-9258' are all '0021-9258').
+
+        Args:
+            issn (str): ISSN
+
+        Returns:
+            (str): canonical ISSN or None
+        """
+        if not isinstance(issn, str):
+            return None
+        tS = issn.strip().replace("-", "").upper()
+        if not 0 < len(tS) <= 8:
+            return None
+        body = tS[:-1].zfill(7)
+        if not (body.isascii() and body.isdigit()) or body == "0000000":
+            return None
+        # check digit - the weighted (8, 7, ..., 2) digit sum and check value are 0 modulo 11
+        num = int(body)
+        total = 0
+        for wt in range(2, 9):
+            num, digit = divmod(num, 10)
+            total += wt * digit
+        if tS[-1] != CitationReferenceProvider.ISSN_CHECK_CHARS[-total % 11]:
+            return None
+        return body[:4] + "-" + body[4:] + tS[-1]
+
+    def __normalizeIssnFields(self, tD):
+        """Replace the ISSN fields of the input journal record with canonical ISSNs dropping malformed values.
+
+        Returns:
+            (list): distinct canonical ISSNs of the journal
+        """
+        issnL = []
+        for fN in ["issn_print", "issn_online"]:
+            if fN not in tD:
+                continue
+            issn = self.normalizeIssn(tD[fN])
+            if issn:
+                tD[fN] = issn
+                issnL.append(issn)
+            else:
+                if tD[fN]:
+                    logger.debug("Rejecting malformed ISSN %r (%s)", tD[fN], tD.get("journal_title"))
+                del tD[fN]
+        return list(dict.fromkeys(issnL))
+
+    def getMedlineIssnsByTitle(self, title):
+        """Return the ISSNs of Medline journals with the input title (ignoring case, punctuation and diacritics)."""
+        return self.__getIssnsByName("medline", "journal_title", title)
+
+    def getMedlineIssnsByAbbreviation(self, abbrev):
+        """Return the ISSNs of Medline journals with the input Medline abbreviation (ignoring case, punctuation and diacritics)."""
+        return self.__getIssnsByName("medline", "medline_abbrev", abbrev)
+
+    def getMedlineIssnsByIsoAbbreviation(self, abbrev):
+        """Return the ISSNs of Medline journals with the input ISO abbreviation (ignoring case, punctuation and diacritics)."""
+        return self.__getIssnsByName("medline", "iso_abbrev", abbrev)
+
+    def getCrossRefIssnsByTitle(self, title):
+        """Return the ISSNs of CrossRef journals with the input title (ignoring case, punctuation and diacritics)."""
+        return self.__getIssnsByName("crossref", "journal_title", title)
+
+    def findJournalCandidates(self, title, k=10):
+        """Return the ISSNs of the Medline and CrossRef journals with titles most similar to the input title.
+
+        Normalized titles are compared as sets of character n-grams (Dice coefficient) so that misspelled
+        or truncated titles are matched approximately.
+
+        Args:
+            title (str): journal title
+            k (int, optional): maximum number of ISSNs. Defaults to 10.
+
+        Returns:
+            (list): [(issn, score), ...] in order of decreasing score (1.0 for an exact normalized title match)
+        """
+        if self.__titleNgramIdx is None:
+            with self.__lock:
+                if self.__titleNgramIdx is None:
+                    for source in self.__nameFieldD:
+                        if (source, "journal_title") not in self.__nameIdxD:
+                            self.__nameIdxD.update(self.__buildNameIndices(source))
+                    titleItems = [tup for source in self.__nameFieldD for tup in self.__nameIdxD[(source, "journal_title")].items()]
+                    self.__titleNgramIdx = JournalTitleNgramIndex(titleItems)
+                    logger.info("Journal title n-gram index titles %d postings memory %d (bytes)", self.__titleNgramIdx.getTitleCount(), self.__titleNgramIdx.getMemorySize())
+        rD = {}
+        for score, _, issnT in self.__titleNgramIdx.search(self.getJournalNameKey(title), k=k):
+            for issn in issnT:
+                if issn not in rD:
+                    rD[issn] = score
+        return list(rD.items())[:k]
+
+    @staticmethod
+    def getJournalNameKey(name):
+        """Return the normalized lookup key for a journal title or abbreviation.
+
+        Keys are computed with JournalNameUtil.getNameKey() and so match the title keys of JournalTitleAbbreviationProvider.
+
+        Args:
+            name (str): journal title or abbreviation
+
+        Returns:
+            (str): normalized key or None
+        """
+        return JournalNameUtil.getNameKey(name)
+
+    def __getIssnsByName(self, source, fieldName, name):
+        nameIdx = self.__nameIdxD.get((source, fieldName))
+        if nameIdx is None:
+            with self.__lock:
+                if (source, fieldName) not in self.__nameIdxD:
+                    self.__nameIdxD.update(self.__buildNameIndices(source))
+                nameIdx = self.__nameIdxD[(source, fieldName)]
+        return list(nameIdx.get(self.getJournalNameKey(name), ()))
+
+    def __buildNameIndices(self, source):
+        """Build the reverse indices from normalized journal names to ISSNs for the input source.
+
+        Returns:
+            (dict): {(source, fieldName): {normalized name: (issn, ...), ...}, ...}
+        """
+        nameIdxD = {(source, fieldName): {} for fieldName in self.__nameFieldD[source]}
+        keyD = {}
+        for tD in self.__getIssnIndex(source).iterRecords():
+            issnL = [tD[ky] for ky in ["issn_print", "issn_online"] if tD.get(ky)]
+            for fieldName in self.__nameFieldD[source]:
+                if not tD.get(fieldName):
+                    continue
+                name = tD[fieldName]
+                if name not in keyD:
+                    keyD[name] = sys.intern(self.getJournalNameKey(name))
+                if keyD[name]:
+                    nameIdx = nameIdxD[(source, fieldName)]
+                    nameIdx[keyD[name]] = tuple(dict.fromkeys(nameIdx.get(keyD[name], ()) + tuple(issnL)))
+        logger.debug("Reverse journal name index %s lengths %r", source, {fieldName: len(nameIdx) for (_, fieldName), nameIdx in nameIdxD.items()})
+        return nameIdxD
+
+    def getJournalRecords(self, issnList, fields=None):
+        """Return the merged Medline and CrossRef journal records for the input ISSNs.
+
+        ISSNs are normalized (see normalizeIssn()) and malformed ISSNs are ignored.  Medline fields are returned
+        by name (journal_title, iso_abbrev, medline_abbrev, issn_print, issn_online) and CrossRef fields with a
+        "crossref_" prefix (crossref_journal_title, crossref_issn_print, crossref_issn_online, crossref_doi).
+        Sources with no requested fields are not searched.
+
+        Args:
+            issnList (iterable): ISSNs
+            fields (list, optional): merged record fields to return (default: all fields). Defaults to None.
+
+        Returns:
+            (dict): {canonical issn: {field: value, ...}, ...} for the ISSNs found in either source
+        """
+        issnL = list(dict.fromkeys([issn for issn in map(self.normalizeIssn, issnList) if issn]))
+        fieldS = set(fields) if fields is not None else None
+        rD = {}
+        for source, prefix in [("medline", ""), ("crossref", "crossref_")]:
+            fieldNameL = [fN for fN in self.__fieldNameD[source] if fieldS is None or prefix + fN in fieldS]
+            if not fieldNameL:
+                continue
+            for issn, tD in self.__getIssnIndex(source).getRecords(issnL, fieldNames=fieldNameL).items():
+                dD = rD.setdefault(issn, {})
+                for fN, val in tD.items():
+                    dD[prefix + fN] = val
+        return rD
+
+    def publishSharedTables(self, name=None):
+        """Publish the Medline and CrossRef journal indices in a new shared memory block.
+
+        Providers in other processes (e.g., pool workers) created with sharedTables=shm.name search the
+        published indices in place.  The caller owns the block and should call close() and unlink() on it
+        after the workers are finished.
+
+        Args:
+            name (str, optional): shared memory block name (default: a generated unique name). Defaults to None.
+
+        Returns:
+            (obj): multiprocessing.shared_memory.SharedMemory block containing the journal indices
+        """
+        imageD = {}
+        for source in self.__urlTargetD:
+            issnIdx = self.__getIssnIndex(source)
+            if not isinstance(issnIdx, JournalIssnIndex):
+                issnIdx = JournalIssnIndex(self.__rebuildCache(source, self.__dirPath, True), fieldNames=self.__fieldNameD[source])
+            imageD[source] = issnIdx.toBytes()
+        # Layout: magic, directory position and length (uint64), 8 byte aligned index images and the directory (JSON {source: [offset, length], ...})
+        dirD = {}
+        pos = 24
+        for source, imageB in imageD.items():
+            dirD[source] = [pos, len(imageB)]
+            pos = (pos + len(imageB) + 7) & ~7
+        dirB = json.dumps(dirD).encode("utf-8")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=pos + len(dirB))
+        shm.buf[:24] = self.SHARED_TABLES_MAGIC + struct.pack("<2Q", pos, len(dirB))
+        shm.buf[pos : pos + len(dirB)] = dirB
+        for source, (offset, length) in dirD.items():
+            shm.buf[offset : offset + length] = imageD[source]
+        logger.info("Published journal indices %r in shared memory %s (%d bytes)", {source: length for source, (_, length) in dirD.items()}, shm.name, shm.size)
+        return shm
+
+    def __attachSharedTables(self, name):
+        """Open the journal indices published in the named shared memory block.
+
+        Returns:
+            (dict): {source: journal ISSN index, ...}
+        """
+        try:
+            self.__shm = shared_memory.SharedMemory(name=name)
+            buf = self.__shm.buf
+            if bytes(buf[:8]) != self.SHARED_TABLES_MAGIC:
+                raise ValueError("Unrecognized journal index shared memory block")
+            dirPos, dirLen = struct.unpack_from("<2Q", buf, 8)
+            dirD = json.loads(str(buf[dirPos : dirPos + dirLen], "utf-8"))
+            logger.debug("Attached journal indices %r in shared memory %s", sorted(dirD), name)
+            return {source: JournalIssnIndex(buffer=buf[offset : offset + length]) for source, (offset, length) in dirD.items()}
+        except Exception as e:
+            logger.exception("Failing attaching journal indices in shared memory %s with %s", name, str(e))
+        # fall back to empty in-memory indices
+        return {source: JournalIssnIndex(fieldNames=fieldNames) for source, fieldNames in self.__fieldNameD.items()}
+
+    def close(self):
+        """Release the journal indices and any attached shared memory block (sources are loaded again on next access)."""
+        with self.__lock:
+            for issnIdx in self.__issnIdxD.values():
+                issnIdx.close()
+            self.__issnIdxD = {}
+            if self.__shm is not None:
+                self.__shm.close()
+                self.__shm = None
+
+    def __del__(self):
+        # release the index views before an attached shared memory block is closed on collection
         try:
-            jT = self.__crIssnD[issn]["journal_title"]
+            self.close()
         except Exception:
             pass
-        return jT
 
     def testCache(self):
         # Lengths ...
-        logger.info("Lengths Medline %d CrossRef %d", len(self.__mlIssnD), len(self.__crIssnD))
-        if (len(self.__mlIssnD) > 1000) and (len(self.__crIssnD) > 1000):
+        self.__loadSources(list(self.__urlTargetD))
+        mlLen = len(self.__getIssnIndex("medline"))
+        crLen = len(self.__getIssnIndex("crossref"))
+        logger.info("Lengths Medline %d CrossRef %d", mlLen, crLen)
+        if (mlLen > 1000) and (crLen > 1000):
             return True
         return False
 
     #
-    def __rebuildCache(self, urlTargetMedline, urlTargetCrossRef, cachePath, useCache):
-        mlD = {}
-        crD = {}
+    def __getStorePath(self, cachePath):
+        return os.path.join(cachePath, "citation-reference.sqlite")
+
+    def __isStoreCurrent(self, storePath, cachePath=None):
+        """Return True if the SQLite journal store exists in the current format (stores of an older format are rebuilt).
+
+        With a cache path, the store must also be at least as recent as the cached journal records of each source
+        (caches rebuilt by the memory backend are not applied to a store other processes may have open).
+        """
+        if not (os.access(storePath, os.R_OK) and JournalIssnStore.getFormatVersion(storePath) == JournalIssnStore.FORMAT_VERSION):
+            return False
+        if cachePath:
+            storeTime = os.stat(storePath).st_mtime_ns
+            for source in self.__urlTargetD:
+                namePath = os.path.join(cachePath, "%s-journals.json" % source)
+                if os.access(namePath, os.R_OK) and os.stat(namePath).st_mtime_ns > storeTime:
+                    logger.info("Journal store %s is older than the cached %s journal records", storePath, source)
+                    return False
+        return True
+
+    def __openStore(self, cachePath, useCache, lookupCacheSize):
+        """Open the SQLite journal store building it from the cached (or fetched) reference data if required.
+
+        Returns:
+            (dict): {source: journal ISSN index, ...}
+        """
+        storePath = self.__getStorePath(cachePath)
+        if not (useCache and self.__isStoreCurrent(storePath, cachePath)):
+            MarshalUtil().mkdir(cachePath)
+            requestTime = time.time()
+            # the store lock is taken before the source cache locks (in __rebuildCache())
+            with self.__cfU.lock(storePath):
+                if self.__isStoreCurrent(storePath, cachePath) and (useCache or self.__cfU.isFresh(storePath, requestTime)):
+                    logger.info("Using journal store written by a concurrent rebuild %s", storePath)
+                else:
+                    self.__writeStore(storePath, cachePath, useCache)
+        if not self.__isStoreCurrent(storePath):
+            # no reference data - fall back to empty in-memory indices
+            return {source: JournalIssnIndex(fieldNames=fieldNames) for source, fieldNames in self.__fieldNameD.items()}
+        return {source: JournalIssnStore(storePath, source, fieldNames, cacheSize=lookupCacheSize) for source, fieldNames in self.__fieldNameD.items()}
+
+    def __writeStore(self, storePath, cachePath, useCache):
+        """Write (or incrementally update) the SQLite journal store from the cached (or fetched) reference data."""
+        # changes are applied incrementally only to a store that is current with the cached data they are relative to
+        isCurrent = self.__isStoreCurrent(storePath, cachePath)
+        tableD = {source: (self.__fieldNameD[source], issnD) for source, issnD in self.__rebuildSources(list(self.__urlTargetD), cachePath, useCache).items()}
+        if self.__conditionalRefresh and not useCache and isCurrent:
+            ok = all([source in self.__deltaD for source in tableD])
+            ok = ok and JournalIssnStore.update(storePath, {source: (self.__fieldNameD[source],) + self.__deltaD[source] for source in tableD})
+            logger.info("Updating %s status %r", storePath, ok)
+            if ok:
+                return
+        if any([issnD for _, issnD in tableD.values()]):
+            # written to a temporary file and renamed into place
+            ok = JournalIssnStore.write(storePath, tableD)
+            logger.info("Storing %r ISSNs in %s status %r", {source: len(issnD) for source, (_, issnD) in tableD.items()}, storePath, ok)
+
+    def __rebuildSources(self, sourceL, cachePath, useCache):
+        """Return the journal records by ISSN for each input source (multiple sources are fetched and parsed in concurrent workers).
+
+        Returns:
+            (dict): {source: {issn: {fieldName: value, ...}, ...}, ...}
+        """
+        if len(sourceL) < 2:
+            return {source: self.__rebuildCache(source, cachePath, useCache) for source in sourceL}
+        MarshalUtil().mkdir(cachePath)
+        with ThreadPoolExecutor(max_workers=len(sourceL)) as executor:
+            issnDL = list(executor.map(lambda source: self.__rebuildCache(source, cachePath, useCache), sourceL))
+        return dict(zip(sourceL, issnDL))
+
+    def __rebuildCache(self, source, cachePath, useCache):
+        """Return the journal records by ISSN for the input source from the cache or rebuilt from the source data.
+
+        Rebuilds are serialized across processes by a lock on the cache file.  A process waiting for the lock
+        reuses the cache file written by a concurrent rebuild rather than fetching the source data again.
+
+        Args:
+            source (str): reference data source (medline or crossref)
+            cachePath (str): cache directory path
+            useCache (bool): use cached data or rebuild from the source data
+
+        Returns:
+            (dict): {issn: {fieldName: value, ...}, ...}
+        """
+        issnD = {}
         mU = MarshalUtil(workPath=cachePath)
         fmt = "json"
         ext = fmt if fmt == "json" else "pic"
-        medlineNamePath = os.path.join(cachePath, "medline-journals.%s" % ext)
-        crossRefNamePath = os.path.join(cachePath, "crossref-journals.%s" % ext)
+        namePath = os.path.join(cachePath, "%s-journals.%s" % (source, ext))
+        urlTarget = self.__urlTargetD[source]
         #
         logger.debug("Using cache data path %s", cachePath)
         mU.mkdir(cachePath)
-        if not useCache:
-            for fp in [medlineNamePath, crossRefNamePath]:
-                try:
-                    os.remove(fp)
-                except Exception:
-                    pass
+        if useCache and mU.exists(namePath):
+            issnD = self.__importJournalRecords(namePath)
+            logger.debug("Citation %s ISSN length %d", source, len(issnD))
+            return issnD
         #
-        if useCache and mU.exists(medlineNamePath) and mU.exists(crossRefNamePath):
-            mlD = mU.doImport(medlineNamePath, fmt=fmt)
-            crD = mU.doImport(crossRefNamePath, fmt=fmt)
-            logger.debug("Citation medline name length %d  CrossRef length %d", len(mlD), len(crD))
-        elif not useCache:
-            # ------
-            fU = FileUtil()
-            logger.info("Fetch data from source %s in %s", urlTargetMedline, cachePath)
-            fp = os.path.join(cachePath, fU.getFileName(urlTargetMedline))
-            ok = fU.get(urlTargetMedline, fp)
-            mlD = self.__getMedlineJournalIndex(fp)
-            ok = mU.doExport(medlineNamePath, mlD, fmt=fmt)
-            logger.info("Caching %d Medline ISSNs in %s status %r", len(mlD), medlineNamePath, ok)
-            # ------
-            # CrossRef reference data -
-            #   http://ftp.crossref.org/titlelist/titleFile.csv
-            fp = os.path.join(cachePath, fU.getFileName(urlTargetCrossRef))
-            ok = fU.get(urlTargetCrossRef, fp)
-            crD = {}
-            try:
-                tDL = mU.doImport(fp, fmt="csv", rowFormat="dict")
-                # crossref issn's are stripped of '-' and leading zeros.
-                for tD in tDL:
-                    tt = {}
-                    for kyTup in [("JournalTitle", "journal_title"), ("pissn", "issn_print"), ("eissn", "issn_online"), ("doi", "doi")]:
-                        if kyTup[0] in tD:
-                            tt[kyTup[1]] = tD[kyTup[0]]
-                    crD[tD["pissn"]] = tt
-                    crD[tD["eissn"]] = tt
-            except Exception as e:
-                logger.exception("Failing processing %s in %s with %s", urlTargetCrossRef, fp, str(e))
-            ok = mU.doExport(crossRefNamePath, crD, fmt=fmt)
-            logger.info("Caching %d CrossRef ISSNs in %s status %r", len(crD), crossRefNamePath, ok)
-            # ------
+        requestTime = time.time()
+        with self.__cfU.lock(namePath):
+            if mU.exists(namePath) and (useCache or self.__cfU.isFresh(namePath, requestTime)):
+                issnD = self.__importJournalRecords(namePath)
+                logger.info("Using %d %s ISSNs cached by a concurrent rebuild in %s", len(issnD), source, namePath)
+            elif not useCache and self.__conditionalRefresh:
+                issnD = self.__refreshCache(source, cachePath, namePath)
+            elif not useCache:
+                fU = FileUtil()
+                logger.info("Fetch data from source %s in %s", urlTarget, cachePath)
+                fp = os.path.join(cachePath, fU.getFileName(urlTarget))
+                ok = fU.get(urlTarget, fp)
+                if source == "medline":
+                    issnD = self.__getMedlineJournalIndex(fp)
+                else:
+                    issnD = self.__getCrossRefJournalIndex(fp)
+                ok = self.__cfU.exportAtomic(namePath, issnD, fmt=fmt)
+                logger.info("Caching %d %s ISSNs in %s status %r", len(issnD), source, namePath, ok)
         #
-        return mlD, crD
+        return issnD
+
+    def __importJournalRecords(self, namePath):
+        """Import cached journal records by ISSN.
+
+        Caches written before ISSNs were held in canonical form (e.g. CrossRef keys '219258') are
+        rekeyed by the canonical ISSNs of their records, dropping malformed ISSNs.
+
+        Returns:
+            (dict): {issn: {fieldName: value, ...}, ...}
+        """
+        issnD = MarshalUtil().doImport(namePath, fmt="json")
+        if self.__isCanonicalIssnList(issnD):
+            return issnD
+        rD = {}
+        for tD in issnD.values():
+            for issn in self.__normalizeIssnFields(tD):
+                rD[issn] = tD
+        logger.warning("Normalized the ISSNs of cached journal records in %s (%d to %d ISSNs)", namePath, len(issnD), len(rD))
+        return rD
+
+    @staticmethod
+    def __isCanonicalIssnList(issnL):
+        """Return True if all input ISSNs are in the canonical form of normalizeIssn() (a faster check for whole caches)."""
+        prefixD = CitationReferenceProvider.ISSN_PREFIX_SUMS
+        suffixD = CitationReferenceProvider.ISSN_SUFFIX_SUMS
+        checkChars = CitationReferenceProvider.ISSN_CHECK_CHARS
+        for issn in issnL:
+            if len(issn) != 9 or issn[4] != "-" or issn == "0000-0000":
+                return False
+            prefixSum = prefixD.get(issn[:4])
+            suffixSum = suffixD.get(issn[5:8])
+            if prefixSum is None or suffixSum is None or issn[8] != checkChars[-(prefixSum + suffixSum) % 11]:
+                return False
+        return True
+
+    def __refreshCache(self, source, cachePath, namePath):
+        """Conditionally refresh the cached journal records for the input source.
+
+        The source is downloaded and parsed only if it has changed (ETag, Last-Modified or content hash),
+        and the added, changed and removed journal records relative to the cached data are recorded.
+
+        Returns:
+            (dict): {issn: {fieldName: value, ...}, ...}
+        """
+        mU = MarshalUtil(workPath=cachePath)
+        fU = FileUtil()
+        urlTarget = self.__urlTargetD[source]
+        srU = SourceRefreshUtil(os.path.join(cachePath, "%s-source-state.json" % source))
+        fp = os.path.join(cachePath, fU.getFileName(urlTarget))
+        changed = srU.fetch(urlTarget, fp)
+        oldD = self.__importJournalRecords(namePath) if mU.exists(namePath) else None
+        if oldD is not None and not changed:
+            if changed is None:
+                logger.warning("Refresh of %s failed - using cached %s data", urlTarget, source)
+            else:
+                srU.saveState()
+            self.__deltaD[source] = ({}, [])
+            return oldD
+        issnD = {}
+        if mU.exists(fp):
+            issnD = self.__getMedlineJournalIndex(fp) if source == "medline" else self.__getCrossRefJournalIndex(fp)
+        if not issnD:
+            logger.error("No %s journal records in %s - using cached data", source, fp)
+            return oldD if oldD is not None else {}
+        ok = self.__cfU.exportAtomic(namePath, issnD, fmt="json")
+        if ok:
+            srU.saveState()
+        if ok and oldD is not None:
+            upsertD = {issn: tD for issn, tD in issnD.items() if oldD.get(issn) != tD}
+            deleteL = [issn for issn in oldD if issn not in issnD]
+            logger.info("Refreshing %s ISSNs added or changed %d removed %d (of %d)", source, len(upsertD), len(deleteL), len(issnD))
+            self.__deltaD[source] = (upsertD, deleteL)
+        return issnD
+
+    def __getCrossRefJournalIndex(self, filePath):
+        """Parse CrossRef journal title list data and return a dictionary by ISSN
+
+        Data from:
+            http://ftp.crossref.org/titlelist/titleFile.csv
+
+        Rows are streamed and projected to the journal title, ISSN and DOI columns.  CrossRef
+        ISSNs (stripped of '-' and leading zeros) are stored in canonical form, and empty or
+        malformed ISSNs are skipped.
+        """
+        crD = {}
+        try:
+            ioU = IoUtil()
+            rowIt = ioU.deserializeCsvIter(filePath, delimiter=",", rowFormat="list")
+            headerL = next(rowIt, [])
+            colL = [
+                (headerL.index(ky), fN) if ky in headerL else (None, fN)
+                for ky, fN in [("JournalTitle", "journal_title"), ("pissn", "issn_print"), ("eissn", "issn_online"), ("doi", "doi")]
+            ]
+            nCols = len(headerL)
+            for rowL in rowIt:
+                if len(rowL) < nCols:
+                    rowL = rowL + [""] * (nCols - len(rowL))
+                tt = {fN: rowL[ii] for ii, fN in colL if ii is not None}
+                for issn in self.__normalizeIssnFields(tt):
+                    crD[issn] = tt
+        except Exception as e:
+            logger.exception("Failing processing %s with %s", filePath, str(e))
+        logger.info("CrossRef ISSN journal length %d", len(crD))
+        return crD
 
     def __getMedlineJournalIndex(self, filePath):
         """Parse Medline journal reference data and return a dictionary by ISSN
@@ -155,10 +686,8 @@ class CitationReferenceProvider(StashableBase):
             for line in ifh:
                 if "----" in line and "journal_title" in dD:
                     logger.debug("line %r: %r", line, dD)
-                    if "issn_print" in dD:
-                        issnD[dD["issn_print"]] = copy.copy(dD)
-                    if "issn_online" in dD:
-                        issnD[dD["issn_online"]] = copy.copy(dD)
+                    for issn in self.__normalizeIssnFields(dD):
+                        issnD[issn] = copy.copy(dD)
                     dD = {}
                 #
                 fields = [f.strip() for f in line[:-1].split(":")]
@@ -0,0 +1,307 @@
+##
+# File:    JournalIssnIndex.py
+# Date:    18-Oct-2026
+#
+#  Updates:
+#  18-Oct-2026  Add getRecords() bulk lookup with field projection
+#  18-Oct-2026  Add a flat binary image of the index (toBytes()) searched in place from a shared buffer (buffer=)
+##
+"""
+Compact column-oriented index of journal records keyed by ISSN.
+
+"""
+
+import json
+import logging
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+logger = logging.getLogger(__name__)
+
+
+class JournalIssnColumnView(object):
+    """Read-only view of a column of optional string values stored in a binary index image."""
+
+    def __init__(self, buf, count, offsetPos, nullPos, blobPos):
+        self.__buf = buf
+        self.__count = count
+        self.__offsetPos = offsetPos
+        self.__nullPos = nullPos
+        self.__blobPos = blobPos
+        self.__uint64Pair = struct.Struct("<2Q")
+
+    def __getitem__(self, row):
+        if not 0 <= row < self.__count:
+            raise IndexError(row)
+        if self.__buf[self.__nullPos + row]:
+            return None
+        bV, eV = self.__uint64Pair.unpack_from(self.__buf, self.__offsetPos + 8 * row)
+        return str(self.__buf[self.__blobPos + bV : self.__blobPos + eV], "utf-8")
+
+    def __len__(self):
+        return self.__count
+
+
+class JournalIssnIndex(object):
+    """Journal records stored once in column lists with a sorted integer ISSN key array.
+
+    ISSN keys in the forms 'NNNN-NNNC' and 'NNNNNNNC' (including the shorter CrossRef forms
+    without leading zeros) are losslessly encoded as 32-bit integers.  Lookups are binary searches
+    over the sorted key array.  Any other key strings are held in a small overflow dictionary.
+
+    The index can be serialized as a flat binary image (toBytes()) and opened in place from a buffer
+    (e.g., a multiprocessing.shared_memory block) without unpacking the journal records.  The key arrays
+    of an image are in native byte order.
+    """
+
+    MAGIC = b"JISSNIX1"
+    CHECK_VALUES = {"0": 0, "1": 1, "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9, "X": 10}
+
+    def __init__(self, issnD=None, fieldNames=None, buffer=None):
+        """Build the index from journal records or open a binary index image.
+
+        Args:
+            issnD (dict, optional): journal records by ISSN {issn: {fieldName: value, ...}, ...}. Defaults to None.
+            fieldNames (list, optional): record field names (default: all fields in the input records). Defaults to None.
+            buffer (obj, optional): object supporting the buffer protocol containing an index image (see toBytes()). Defaults to None.
+        """
+        self.__buf = None
+        if buffer is not None:
+            self.__readBuffer(buffer)
+            return
+        issnD = issnD if issnD else {}
+        if fieldNames is None:
+            fieldNames = sorted(set([ky for rD in issnD.values() for ky in rD]))
+        self.__fieldNames = list(fieldNames)
+        self.__columnD = {fN: [] for fN in self.__fieldNames}
+        self.__keyA = array("I")
+        self.__rowA = array("I")
+        self.__overflowD = {}
+        self.__build(issnD)
+
+    def __build(self, issnD):
+        rowD = {}
+        # (encoded key << 32 | row) packed for sorting
+        packedL = []
+        encodeKey = self.encodeKey
+        columnL = [self.__columnD[fN] for fN in self.__fieldNames]
+        for issn, rD in issnD.items():
+            rowTup = tuple(map(rD.get, self.__fieldNames))
+            row = rowD.get(rowTup)
+            if row is None:
+                row = rowD[rowTup] = len(rowD)
+                for colL, val in zip(columnL, rowTup):
+                    colL.append(val)
+            code = encodeKey(issn)
+            if code is None:
+                self.__overflowD[issn] = row
+            else:
+                packedL.append(code << 32 | row)
+        packedL.sort()
+        self.__keyA = array("I", [packed >> 32 for packed in packedL])
+        self.__rowA = array("I", [packed & 0xFFFFFFFF for packed in packedL])
+        logger.debug("Journal ISSN index keys %d overflow %d records %d", len(self.__keyA), len(self.__overflowD), len(rowD))
+
+    def __readBuffer(self, buffer):
+        self.__buf = memoryview(buffer)
+        if bytes(self.__buf[:8]) != self.MAGIC:
+            raise ValueError("Unrecognized journal ISSN index format")
+        numKeys, numRows, metaLen = struct.unpack_from("<3Q", self.__buf, 8)
+        pos = 32
+        metaD = json.loads(str(self.__buf[pos : pos + metaLen], "utf-8"))
+        pos = self.__align(pos + metaLen)
+        self.__fieldNames = metaD["fields"]
+        self.__overflowD = metaD["overflow"]
+        self.__keyA = self.__buf[pos : pos + 4 * numKeys].cast("I")
+        pos += 4 * numKeys
+        self.__rowA = self.__buf[pos : pos + 4 * numKeys].cast("I")
+        pos = self.__align(pos + 4 * numKeys)
+        self.__columnD = {}
+        for fN in self.__fieldNames:
+            offsetPos = pos
+            nullPos = offsetPos + 8 * (numRows + 1)
+            blobPos = self.__align(nullPos + numRows)
+            (blobLen,) = struct.unpack_from("<Q", self.__buf, offsetPos + 8 * numRows)
+            self.__columnD[fN] = JournalIssnColumnView(self.__buf, numRows, offsetPos, nullPos, blobPos)
+            pos = self.__align(blobPos + blobLen)
+        logger.debug("Opened journal ISSN index image keys %d records %d (%d bytes)", numKeys, numRows, self.__buf.nbytes)
+
+    @staticmethod
+    def __align(pos):
+        return (pos + 7) & ~7
+
+    def toBytes(self):
+        """Serialize the index as a binary image (opened with JournalIssnIndex(buffer=...)).
+
+        Layout: magic (8 bytes), key, record and metadata lengths (uint64), metadata (JSON field names and
+        overflow keys), the key and record number arrays (native uint32), then for each field the value
+        offsets (uint64), null flags (uint8) and value blob (UTF-8).  Sections are 8 byte aligned.
+
+        Returns:
+            (bytes): index image
+        """
+        numRows = self.getRecordCount()
+        metaB = json.dumps({"fields": self.__fieldNames, "overflow": self.__overflowD}).encode("utf-8")
+        sectionL = [self.MAGIC + struct.pack("<3Q", len(self.__keyA), numRows, len(metaB)) + metaB]
+        sectionL.append(array("I", self.__keyA).tobytes() + array("I", self.__rowA).tobytes())
+        for fN in self.__fieldNames:
+            colL = self.__columnD[fN]
+            valL = [colL[row] for row in range(numRows)]
+            encL = [val.encode("utf-8") if val is not None else b"" for val in valL]
+            offsetL = [0]
+            for vB in encL:
+                offsetL.append(offsetL[-1] + len(vB))
+            sectionL.append(struct.pack("<%dQ" % len(offsetL), *offsetL) + bytes([val is None for val in valL]))
+            sectionL.append(b"".join(encL))
+        partL = [sectionB + b"\0" * (self.__align(len(sectionB)) - len(sectionB)) for sectionB in sectionL]
+        return b"".join(partL)
+
+    def close(self):
+        """Release the buffer of an index opened from a binary image (the index becomes unusable)."""
+        if self.__buf is not None:
+            self.__keyA.release()
+            self.__rowA.release()
+            self.__columnD = {}
+            self.__buf.release()
+            self.__buf = None
+
+    @staticmethod
+    def encodeKey(issn):
+        """Encode an ISSN key string as an integer (the encoding preserves the exact key string).
+
+        Args:
+            issn (str): ISSN key
+
+        Returns:
+            (int): encoded key or None if the input is not an encodable ISSN form
+        """
+        if not isinstance(issn, str):
+            return None
+        kLen = len(issn)
+        if kLen == 9 and issn[4] == "-":
+            body = issn[:4] + issn[5:8]
+        elif 0 < kLen < 9:
+            body = issn[:-1]
+        else:
+            return None
+        check = issn[-1]
+        if (body and not (body.isascii() and body.isdigit())) or check not in JournalIssnIndex.CHECK_VALUES:
+            return None
+        return (kLen << 27) | (int(body or "0") * 11 + JournalIssnIndex.CHECK_VALUES[check])
+
+    @staticmethod
+    def decodeKey(code):
+        """Decode an integer ISSN key to its key string."""
+        kLen = code >> 27
+        body, check = divmod(code & ((1 << 27) - 1), 11)
+        checkS = "X" if check == 10 else str(check)
+        if kLen == 9:
+            bodyS = "%07d" % body
+            return bodyS[:4] + "-" + bodyS[4:] + checkS
+        return ("%0*d" % (kLen - 1, body) if kLen > 1 else "") + checkS
+
+    def __getRow(self, issn):
+        code = self.encodeKey(issn)
+        if code is None:
+            try:
+                return self.__overflowD.get(issn)
+            except TypeError:
+                return None
+        ii = bisect_left(self.__keyA, code)
+        if ii < len(self.__keyA) and self.__keyA[ii] == code:
+            return self.__rowA[ii]
+        return None
+
+    def get(self, issn, fieldName, default=None):
+        """Return the value of the named field of the journal record for the input ISSN.
+
+        Args:
+            issn (str): ISSN key
+            fieldName (str): record field name
+            default (obj, optional): value returned if there is no record or field value. Defaults to None.
+
+        Returns:
+            (obj): field value or default
+        """
+        row = self.__getRow(issn)
+        if row is None or fieldName not in self.__columnD:
+            return default
+        val = self.__columnD[fieldName][row]
+        return default if val is None else val
+
+    def getRecord(self, issn):
+        """Return the journal record for the input ISSN as a dictionary or None."""
+        row = self.__getRow(issn)
+        return self.__getRecordByRow(row) if row is not None else None
+
+    def getRecords(self, issnList, fieldNames=None):
+        """Return the journal records for the input ISSNs (one index probe per ISSN).
+
+        Args:
+            issnList (iterable): ISSN keys
+            fieldNames (list, optional): record fields to return (default: all fields). Defaults to None.
+
+        Returns:
+            (dict): {issn: {fieldName: value, ...}, ...} for the ISSNs with journal records
+        """
+        projL = [(fN, self.__columnD[fN]) for fN in (self.__fieldNames if fieldNames is None else fieldNames) if fN in self.__columnD]
+        encodeKey = self.encodeKey
+        keyA = self.__keyA
+        rowA = self.__rowA
+        nKeys = len(keyA)
+        rD = {}
+        for issn in issnList:
+            code = encodeKey(issn)
+            if code is None:
+                row = self.__getRow(issn)
+            else:
+                ii = bisect_left(keyA, code)
+                row = rowA[ii] if ii < nKeys and keyA[ii] == code else None
+            if row is not None:
+                rD[issn] = {fN: colL[row] for fN, colL in projL if colL[row] is not None}
+        return rD
+
+    def __getRecordByRow(self, row):
+        return {fN: self.__columnD[fN][row] for fN in self.__fieldNames if self.__columnD[fN][row] is not None}
+
+    def iterRecords(self):
+        """Iterate over the distinct journal records (as dictionaries)."""
+        for row in range(self.getRecordCount()):
+            yield self.__getRecordByRow(row)
+
+    def keys(self):
+        """Iterate over ISSN keys."""
+        for code in self.__keyA:
+            yield self.decodeKey(code)
+        for issn in self.__overflowD:
+            yield issn
+
+    def toDict(self):
+        """Return the journal records by ISSN {issn: {fieldName: value, ...}, ...}."""
+        return {issn: self.getRecord(issn) for issn in self.keys()}
+
+    def getRecordCount(self):
+        return len(self.__columnD[self.__fieldNames[0]]) if self.__fieldNames else 0
+
+    def getMemorySize(self):
+        """Return the approximate memory size (bytes) of the index (key arrays, columns and distinct values, or the binary image)."""
+        if self.__buf is not None:
+            return self.__buf.nbytes
+        seenS = set()
+        size = sys.getsizeof(self.__keyA) + sys.getsizeof(self.__rowA) + sys.getsizeof(self.__overflowD)
+        size += sum([sys.getsizeof(ky) for ky in self.__overflowD])
+        for colL in self.__columnD.values():
+            size += sys.getsizeof(colL)
+            for val in colL:
+                if val is not None and id(val) not in seenS:
+                    seenS.add(id(val))
+                    size += sys.getsizeof(val)
+        return size
+
+    def __contains__(self, issn):
+        return self.__getRow(issn) is not None
+
+    def __len__(self):
+        return len(self.__keyA) + len(self.__overflowD)
@@ -0,0 +1,213 @@
+##
+# File:    JournalIssnStore.py
+# Date:    18-Oct-2026
+#
+#  Updates:
+#  18-Oct-2026  Add update() applying added, changed and removed records in place
+#  18-Oct-2026  Add getRecords() bulk lookup with field projection
+#  18-Oct-2026  Record the store format version (FORMAT_VERSION) and add getFormatVersion()
+##
+"""
+SQLite-backed store of journal records keyed by ISSN shared by concurrent reader processes.
+
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import urllib.parse
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+
+class JournalIssnStore(object):
+    """Read-only point query access to a table of journal records keyed by ISSN in an SQLite file.
+
+    Each process opens its own read-only connection on first use (connections are not shared across
+    forked processes).  Recently accessed records are held in a small in-process cache.
+
+    The store format version (FORMAT_VERSION) is recorded in the SQLite user_version of the file.
+    Version 1 stores are keyed by canonical ISSNs ('NNNN-NNNC').
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, filePath, tableName, fieldNames, cacheSize=10000):
+        """Open a journal record table.
+
+        Args:
+            filePath (str): SQLite file path
+            tableName (str): table name
+            fieldNames (list): record field names
+            cacheSize (int, optional): maximum number of cached records (0 disables, None is unbounded). Defaults to 10000.
+        """
+        self.__filePath = filePath
+        self.__tableName = tableName
+        self.__fieldNames = list(fieldNames)
+        self.__lock = threading.Lock()
+        self.__conn = None
+        self.__pid = None
+        self.__getRow = lru_cache(maxsize=cacheSize)(self.__queryRow)
+
+    def __getConnection(self):
+        if self.__conn is None or self.__pid != os.getpid():
+            uri = "file:%s?mode=ro" % urllib.parse.quote(os.path.abspath(self.__filePath))
+            self.__conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self.__pid = os.getpid()
+        return self.__conn
+
+    def __query(self, sql, args=()):
+        with self.__lock:
+            return self.__getConnection().execute(sql, args).fetchall()
+
+    def __queryRow(self, issn):
+        if not isinstance(issn, str):
+            return None
+        rowL = self.__query("SELECT %s FROM %s WHERE issn = ?" % (", ".join(self.__fieldNames), self.__tableName), (issn,))
+        return rowL[0] if rowL else None
+
+    def get(self, issn, fieldName, default=None):
+        """Return the value of the named field of the journal record for the input ISSN.
+
+        Args:
+            issn (str): ISSN key
+            fieldName (str): record field name
+            default (obj, optional): value returned if there is no record or field value. Defaults to None.
+
+        Returns:
+            (obj): field value or default
+        """
+        row = self.__getRow(issn)
+        if row is None or fieldName not in self.__fieldNames:
+            return default
+        val = row[self.__fieldNames.index(fieldName)]
+        return default if val is None else val
+
+    def getRecord(self, issn):
+        """Return the journal record for the input ISSN as a dictionary or None."""
+        row = self.__getRow(issn)
+        return {fN: val for fN, val in zip(self.__fieldNames, row) if val is not None} if row is not None else None
+
+    def getRecords(self, issnList, fieldNames=None, chunkSize=500):
+        """Return the journal records for the input ISSNs (queried in chunks of ISSNs).
+
+        Args:
+            issnList (iterable): ISSN keys
+            fieldNames (list, optional): record fields to return (default: all fields). Defaults to None.
+            chunkSize (int, optional): number of ISSNs per query. Defaults to 500.
+
+        Returns:
+            (dict): {issn: {fieldName: value, ...}, ...} for the ISSNs with journal records
+        """
+        projL = [fN for fN in (self.__fieldNames if fieldNames is None else fieldNames) if fN in self.__fieldNames]
+        issnL = list(set([issn for issn in issnList if isinstance(issn, str)]))
+        rD = {}
+        for ii in range(0, len(issnL), chunkSize):
+            chunkL = issnL[ii : ii + chunkSize]
+            sql = "SELECT %s FROM %s WHERE issn IN (%s)" % (", ".join(["issn"] + projL), self.__tableName, ", ".join(["?"] * len(chunkL)))
+            for row in self.__query(sql, chunkL):
+                rD[row[0]] = {fN: val for fN, val in zip(projL, row[1:]) if val is not None}
+        return rD
+
+    def iterRecords(self):
+        """Iterate over the distinct journal records (as dictionaries)."""
+        for row in self.__query("SELECT DISTINCT %s FROM %s" % (", ".join(self.__fieldNames), self.__tableName)):
+            yield {fN: val for fN, val in zip(self.__fieldNames, row) if val is not None}
+
+    def cacheInfo(self):
+        return self.__getRow.cache_info()
+
+    def close(self):
+        with self.__lock:
+            if self.__conn is not None:
+                self.__conn.close()
+                self.__conn = None
+
+    def __contains__(self, issn):
+        return self.__getRow(issn) is not None
+
+    def __len__(self):
+        return self.__query("SELECT COUNT(*) FROM %s" % self.__tableName)[0][0]
+
+    @staticmethod
+    def write(filePath, tableD):
+        """Write journal record tables to an SQLite file (written to a temporary file and renamed into place).
+
+        Args:
+            filePath (str): SQLite file path
+            tableD (dict): {tableName: (fieldNames, {issn: {fieldName: value, ...}, ...}), ...}
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        tmpPath = filePath + ".%d.tmp" % os.getpid()
+        try:
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+            conn = sqlite3.connect(tmpPath)
+            try:
+                conn.execute("PRAGMA user_version = %d" % JournalIssnStore.FORMAT_VERSION)
+                for tableName, (fieldNames, issnD) in tableD.items():
+                    conn.execute("CREATE TABLE %s (issn TEXT PRIMARY KEY, %s) WITHOUT ROWID" % (tableName, ", ".join(["%s TEXT" % fN for fN in fieldNames])))
+                    conn.executemany(
+                        "INSERT INTO %s VALUES (?, %s)" % (tableName, ", ".join(["?"] * len(fieldNames))),
+                        ([issn] + [rD.get(fN) for fN in fieldNames] for issn, rD in issnD.items()),
+                    )
+                    logger.debug("Stored %d journal records in table %s", len(issnD), tableName)
+                conn.commit()
+            finally:
+                conn.close()
+            os.replace(tmpPath, filePath)
+            return True
+        except Exception as e:
+            logger.exception("Failing writing journal store %s with %s", filePath, str(e))
+            try:
+                os.remove(tmpPath)
+            except Exception:
+                pass
+        return False
+
+    @staticmethod
+    def getFormatVersion(filePath):
+        """Return the format version of an SQLite journal store file (0 for stores written without a version or None if unreadable)."""
+        try:
+            uri = "file:%s?mode=ro" % urllib.parse.quote(os.path.abspath(filePath))
+            conn = sqlite3.connect(uri, uri=True)
+            try:
+                return conn.execute("PRAGMA user_version").fetchone()[0]
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.debug("Failing reading the format version of %s with %s", filePath, str(e))
+        return None
+
+    @staticmethod
+    def update(filePath, tableD):
+        """Apply added, changed and removed journal records to the tables of an existing SQLite file (in a single transaction).
+
+        Args:
+            filePath (str): SQLite file path
+            tableD (dict): {tableName: (fieldNames, {issn: {fieldName: value, ...}, ...} added or changed, [issn, ...] removed), ...}
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        try:
+            conn = sqlite3.connect(filePath)
+            try:
+                with conn:
+                    for tableName, (fieldNames, upsertD, deleteL) in tableD.items():
+                        conn.executemany("DELETE FROM %s WHERE issn = ?" % tableName, ([issn] for issn in deleteL))
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO %s (issn, %s) VALUES (?, %s)" % (tableName, ", ".join(fieldNames), ", ".join(["?"] * len(fieldNames))),
+                            ([issn] + [rD.get(fN) for fN in fieldNames] for issn, rD in upsertD.items()),
+                        )
+                        logger.debug("Updated table %s with %d added or changed and %d removed journal records", tableName, len(upsertD), len(deleteL))
+            finally:
+                conn.close()
+            return True
+        except Exception as e:
+            logger.exception("Failing updating journal store %s with %s", filePath, str(e))
+        return False
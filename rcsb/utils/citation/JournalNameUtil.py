@@ -0,0 +1,47 @@
+##
+# File:    JournalNameUtil.py
+# Date:    18-Oct-2026
+#
+#  Updates:
+##
+"""
+Normalization of journal titles and abbreviations to lookup keys shared by the citation providers.
+
+"""
+
+import logging
+import string
+import unicodedata
+
+import regex as re
+
+logger = logging.getLogger(__name__)
+
+
+class JournalNameUtil(object):
+    """Journal title and abbreviation normalization shared by CitationReferenceProvider and JournalTitleAbbreviationProvider."""
+
+    ASCII_PUNCTUATION_TABLE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+    @staticmethod
+    def getNameKey(name):
+        """Return the normalized lookup key for a journal title or abbreviation.
+
+        Diacritics, case, punctuation and symbols are ignored, '&' is read as 'and' and a leading
+        article 'The' is dropped unless it is the only word.  ASCII input takes a translate()
+        fast path yielding the same key as the general Unicode path.
+
+        Args:
+            name (str): journal title or abbreviation
+
+        Returns:
+            (str): normalized key or None
+        """
+        if not isinstance(name, str):
+            return None
+        if name.isascii():
+            wordL = name.replace("&", " and ").lower().translate(JournalNameUtil.ASCII_PUNCTUATION_TABLE).split()
+        else:
+            name = re.sub(r"\p{M}+", "", unicodedata.normalize("NFKD", name)).replace("&", " and ").casefold()
+            wordL = re.sub(r"[\p{P}\p{S}]+", " ", name).split()
+        return " ".join(wordL[1:] if len(wordL) > 1 and wordL[0] == "the" else wordL)
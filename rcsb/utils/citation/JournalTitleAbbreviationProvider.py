@@ -3,19 +3,53 @@
 # Date:    20-Nov-2019 J. Westbrook
 #
 #  Updates:
+#  18-Oct-2026  Use a longest-prefix index built at load time for prefix term matching
+#  18-Oct-2026  Use a longest-suffix index built at load time for suffix term matching
+#  18-Oct-2026  Use an Aho-Corasick automaton built at load time for infix term matching
+#  18-Oct-2026  Add batch method getJournalAbbreviations() resolving each distinct title word once
+#  18-Oct-2026  Add bounded title and word memoization with cacheInfo() and clearCache()
+#  18-Oct-2026  Load the lemmatizer lazily, add a precomputed LTWA lemma table and lemmatizer=None option
+#  18-Oct-2026  Replace the multi-word term alternation regex with a token-level phrase matcher
+#  18-Oct-2026  Add a compact memory-mapped binary LTWA index (iso-ltwa.bin) written with the JSON cache
+#  18-Oct-2026  Parse the LTWA source file in a single streaming pass
+#  18-Oct-2026  Add languages= option and resolve language specific conflict mappings at load time
+#  18-Oct-2026  Add an optional persistent title abbreviation result cache keyed by the LTWA source hash
+#  18-Oct-2026  Add an exact title index of known (curated) ISO abbreviations checked before the LTWA rules
+#  18-Oct-2026  Add conditionalRefresh option skipping the LTWA download and parse when the source is unchanged
+#  18-Oct-2026  Add publishSharedTables() and sharedTables= option reading the LTWA tables from shared memory
+#  18-Oct-2026  Serialize LTWA cache rebuilds across processes with a file lock and write cache files atomically
+#  18-Oct-2026  Always build the LTWA lemma table with WordNet and use it only with the WordNet (or no) lemmatizer
+#  18-Oct-2026  Stream the LTWA source rows with IoUtil.deserializeCsvIter()
+#  18-Oct-2026  Resolve language specific term mappings by the first matching language in the languages= order
+#  18-Oct-2026  Compute known abbreviation title keys with the shared JournalNameUtil.getNameKey()
+#  18-Oct-2026  Build the LTWA lemma table only with the WordNet lemmatizer and run without nltk if it is not installed
+#  18-Oct-2026  Return no LTWA term data when a conditional refresh fails and there is no cached data
+#  18-Oct-2026  Retain the part of the word preceding a matching suffix or infix term in its abbreviation
+#  18-Oct-2026  Serve term lookups from the mapped binary LTWA index (hash lookups and prefix and suffix tries) without decoding it
+#  18-Oct-2026  Publish the prefix and suffix term tries with the shared LTWA tables so workers search the shared block in place
 ##
 
 
+import contextlib
+import json
 import logging
+import multiprocessing
 import os
 import string
+import time
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 import regex as re
-# import nltk
-from nltk.stem.wordnet import WordNetLemmatizer
 
+from rcsb.utils.citation.CacheFileUtil import CacheFileUtil
+from rcsb.utils.citation.JournalNameUtil import JournalNameUtil
+from rcsb.utils.citation.LtwaTermIndex import LtwaPhraseMatcher, LtwaTermIndex, LtwaTermTrie
+from rcsb.utils.citation.MappedStringTable import MappedStringTable
+from rcsb.utils.citation.SourceRefreshUtil import SourceRefreshUtil
 from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.io.IoUtil import IoUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.io.StashableBase import StashableBase
 
@@ -30,6 +64,18 @@ logger = logging.getLogger(__name__)
 #     nltk.download("popular")  # Only download the 'popular' set (~0.5 GB).
 #     # In weekly-update workflow, currently downloading 'all' (~3.5 GB) up front, prior to parallel workers being started
 
+# Word resolver inherited by forked batch abbreviation workers
+_wordResolver = None
+
+
+def _initWordResolver(resolver):
+    global _wordResolver  # pylint: disable=global-statement
+    _wordResolver = resolver
+
+
+def _resolveWordChunk(wordList):
+    return _wordResolver(wordList)
+
 
 class JournalTitleAbbreviationProvider(StashableBase):
     """Manage resources required to support journal title abbreviation assignment
@@ -55,6 +101,9 @@ class JournalTitleAbbreviationProvider(StashableBase):
         copies or substantial portions of the Software.
     """
 
+    # Version of the abbreviation rules (persistent title abbreviation results of other versions are discarded)
+    RULES_VERSION = 2
+
     def __init__(self, **kwargs):
         dirName = "journal-abbreviations"
         cachePath = kwargs.get("cachePath", ".")
@@ -62,6 +111,23 @@ class JournalTitleAbbreviationProvider(StashableBase):
         urlTargetIsoLtwa = kwargs.get("urlTargetLtwa", "https://www.issn.org/wp-content/uploads/2013/09/LTWA_20160915.txt")
         dirPath = os.path.join(cachePath, dirName)
         useCache = kwargs.get("useCache", True)
+        # With useCache=False, reuse the cached term data if the LTWA source is unchanged (ETag, Last-Modified or content hash)
+        self.__conditionalRefresh = kwargs.get("conditionalRefresh", False)
+        # Maximum time (seconds) to wait for a cache rebuild by a concurrent process
+        self.__cfU = CacheFileUtil(timeout=kwargs.get("lockTimeout", 3600))
+        # Persist title abbreviations in the cache directory (invalidated by any change in the LTWA source)
+        useResultCache = kwargs.get("useResultCache", False)
+        # Maximum number of memoized titles and title words (0 disables, None is unbounded)
+        titleCacheSize = kwargs.get("titleCacheSize", 10000)
+        wordCacheSize = kwargs.get("wordCacheSize", 50000)
+        # Load the binary LTWA index in place of the JSON cache when it is available
+        self.__useBinaryIndex = kwargs.get("useBinaryIndex", True)
+        # Name of a shared memory block holding the LTWA tables published by publishSharedTables() (searched in place, no cache or source access)
+        sharedTables = kwargs.get("sharedTables", None)
+        # Languages (LTWA language codes) used to resolve terms with language specific mappings
+        #   (in order of preference - a term with mappings for several of the languages takes the first)
+        languages = kwargs.get("languages", ["eng"])
+        self.__languages = list(dict.fromkeys([languages] if isinstance(languages, str) else languages))
         #
         self.__noAbbrevPlaceHolder = "n.a."
         self.__prefixKey = "prefix"
@@ -71,8 +137,12 @@ class JournalTitleAbbreviationProvider(StashableBase):
         self.__lowercaseFlag = "lower"
         self.__uppercaseFlag = "upper"
         self.__titlecaseFlag = "title"
-        #
-        self.__wml = WordNetLemmatizer()
+        # Lemmatizer applied to title words that miss on their normalized form -
+        #   "wordnet" (default, loaded on first use), None (precomputed LTWA lemma table only - nltk is not required),
+        #   or an object providing a lemmatize(word) method (the precomputed WordNet lemma table is not used).
+        #   The lemma table is built by cache rebuilds with the "wordnet" lemmatizer (when nltk and WordNet are available).
+        self.__lemmatizer = kwargs.get("lemmatizer", "wordnet")
+        self.__wml = None
         #
         self.__stopWords = set(
             [
@@ -170,9 +240,33 @@ class JournalTitleAbbreviationProvider(StashableBase):
                 "og",
             ]
         )
-        self.__abbrevD, self.__conflictD, self.__multiWordTermList = self.__rebuildCache(urlTargetIsoLtwa, dirPath, useCache)
-        # Token a string space boundaries respecting a special list of multi-word strings -
-        self.__tokenizerRegex = re.compile("({}|\\s+)".format("|".join(["(?:^|\\s){}(?:\\s|$)".format(w) for w in self.__multiWordTermList])), flags=re.I)
+        # Mapped binary LTWA index (file or shared memory block) serving term lookups (if loaded)
+        self.__ltwaTables = None
+        if sharedTables:
+            aD = self.__importBinaryIndex(sharedMemoryName=sharedTables)
+        else:
+            aD = self.__rebuildCache(urlTargetIsoLtwa, dirPath, useCache)
+        self.__abbrevD = aD["abbrev"] if "abbrev" in aD else {}
+        self.__conflictD = aD["conflicts"] if "conflicts" in aD else {}
+        self.__multiWordTermList = aD["multi_word_abbrev"] if "multi_word_abbrev" in aD else []
+        self.__lemmaD = self.__getLemmaTable(aD)
+        self.__sourceHash = aD["source_hash"] if "source_hash" in aD else None
+        # Longest-match term indices (built once per load)
+        self.__abbrevIdx = self.__buildTermIndex(self.__abbrevD, aD.get("tries", {}))
+        self.__resolvedConflictD = self.__resolveConflicts(self.__conflictD, self.__languages)
+        self.__conflictIdx = self.__buildTermIndex(self.__resolvedConflictD)
+        # Token a string space boundaries respecting a special list of multi-word strings (stored as escaped patterns) -
+        self.__phraseMatcher = LtwaPhraseMatcher([re.sub(r"\\(.)", r"\1", w) for w in self.__multiWordTermList])
+        #
+        self.__abbreviateTitleCached = lru_cache(maxsize=titleCacheSize)(self.__abbreviateTitle)
+        self.__resolveWordCached = lru_cache(maxsize=wordCacheSize)(self.__resolveWord)
+        #
+        self.__resultCachePath = os.path.join(dirPath, "iso-abbrev-results.json")
+        self.__resultCacheModified = False
+        self.__resultCacheD = self.__loadResultCache(self.__resultCachePath) if useResultCache else None
+        # Known ISO abbreviations {normalized title: abbreviation without periods, ...} (e.g., from Medline or PubMed)
+        self.__knownAbbrevD = {}
+        self.addKnownAbbreviations(kwargs.get("knownAbbreviations", {}))
 
     def testCache(self):
         # Lengths ...
@@ -184,6 +278,48 @@ class JournalTitleAbbreviationProvider(StashableBase):
             pass
         return False
 
+    def getLanguages(self):
+        """Return the languages used to resolve language specific term mappings (in order of preference)."""
+        return list(self.__languages)
+
+    def __resolveConflicts(self, conflictD, useLangs):
+        """Resolve the language specific term mappings for the input languages.
+
+        Args:
+            conflictD (dict): language conflict dictionary {wType: {term: {lang: abbrev, ...}, ...}, ...}
+            useLangs (list): languages in order of preference
+
+        Returns:
+            (dict): {wType: {term: abbrev of the first language with a mapping or None (unresolved), ...}, ...}
+        """
+        resolvedD = {}
+        for wType, tD in conflictD.items():
+            resolvedD[wType] = {}
+            for term, langD in tD.items():
+                resolvedD[wType][term] = next((langD[lang] for lang in useLangs if lang in langD), None)
+        logger.debug("Resolved language conflicts for %r (%r)", useLangs, {wType: len(tD) for wType, tD in resolvedD.items()})
+        return resolvedD
+
+    def __buildTermIndex(self, termD, trieD=None):
+        """Build the longest-match index over the prefix, suffix and infix terms in the input dictionary
+        (using any prebuilt prefix and reversed suffix term tries {"prefix": LtwaTermTrie, "suffix": LtwaTermTrie}).
+        """
+        trieD = trieD if trieD else {}
+        return LtwaTermIndex(
+            prefixD=termD.get(self.__prefixKey),
+            suffixD=termD.get(self.__suffixKey),
+            infixD=termD.get(self.__infixKey),
+            prefixTrie=trieD.get(self.__prefixKey),
+            suffixTrie=trieD.get(self.__suffixKey),
+        )
+
+    def __buildTermTries(self, termD):
+        """Return the tries of the prefix and reversed suffix terms in the input dictionary {"prefix": LtwaTermTrie, "suffix": LtwaTermTrie}."""
+        return {
+            self.__prefixKey: LtwaTermTrie(list(termD.get(self.__prefixKey, {}))),
+            self.__suffixKey: LtwaTermTrie([term[::-1] for term in termD.get(self.__suffixKey, {})]),
+        }
+
     def __rebuildCache(self, urlTargetIsoLtwa, dirPath, useCache):
         """Rebuild the cache of ISO abbreviation term data
 
@@ -193,9 +329,10 @@ class JournalTitleAbbreviationProvider(StashableBase):
             useCache (bool):  flag to use cached files
 
         Returns:
-            tuple: (dict) title word abbreviations
-                   (dict) language conflict dictionary
-                   (list) multi-word abbreviation targets
+            dict: LTWA term data {"abbrev": title word abbreviations, "conflicts": language conflict dictionary,
+                  "multi_word_abbrev": multi-word abbreviation targets, "lemmas": lemmas for inflected forms of
+                  LTWA terms, "lemmatizer": lemmatizer of the lemma table ("wordnet" or None),
+                  "source_hash": hash (sha256) of the LTWA source file}
 
         Notes:
             ISO source file (tab delimited UTF-16LE) is maintained at the ISSN site -
@@ -206,139 +343,509 @@ class JournalTitleAbbreviationProvider(StashableBase):
         fmt = "json"
         ext = fmt if fmt == "json" else "pic"
         isoLtwaNamePath = os.path.join(dirPath, "iso-ltwa.%s" % ext)
+        isoLtwaBinaryPath = os.path.join(dirPath, "iso-ltwa.bin")
         logger.debug("Using cache data path %s", dirPath)
         mU.mkdir(dirPath)
-        if not useCache:
-            for fp in [isoLtwaNamePath]:
-                try:
-                    os.remove(fp)
-                except Exception:
-                    pass
-        #
-        if useCache and mU.exists(isoLtwaNamePath):
-            aD = mU.doImport(isoLtwaNamePath, fmt=fmt)
-            logger.debug("Abbreviation name length %d", len(aD["abbrev"]))
-        elif not useCache:
-            # ------
-            fU = FileUtil()
-            logger.info("Fetch data from source %s in %s", urlTargetIsoLtwa, dirPath)
-            fp = os.path.join(dirPath, fU.getFileName(urlTargetIsoLtwa))
-            ok = fU.get(urlTargetIsoLtwa, fp)
-            aD = self.__getLtwaTerms(dirPath, fp)
-            ok = mU.doExport(isoLtwaNamePath, aD, fmt=fmt)
-            logger.debug("abbrevD keys %r", list(aD.keys()))
-            logger.debug("Caching %d ISO LTWA in %s status %r", len(aD["abbrev"]), isoLtwaNamePath, ok)
-        #
-        abbrevD = aD["abbrev"] if "abbrev" in aD else {}
-        conflictD = aD["conflicts"] if "conflicts" in aD else {}
-        multiWordTermL = aD["multi_word_abbrev"] if "multi_word_abbrev" in aD else []
+        fU = FileUtil()
+        fp = os.path.join(dirPath, fU.getFileName(urlTargetIsoLtwa))
+        srU = None
+        cached = mU.exists(isoLtwaNamePath) or (self.__useBinaryIndex and mU.exists(isoLtwaBinaryPath))
+        requestTime = time.time()
+        # Rebuilds are serialized across processes - waiting processes reuse the rebuilt cache files
+        with contextlib.nullcontext() if useCache and cached else self.__cfU.lock(isoLtwaNamePath):
+            if not useCache and (self.__cfU.isFresh(isoLtwaNamePath, requestTime) or (self.__useBinaryIndex and self.__cfU.isFresh(isoLtwaBinaryPath, requestTime))):
+                logger.info("Using LTWA data cached by a concurrent rebuild in %s", dirPath)
+                useCache = True
+            if not useCache and self.__conditionalRefresh:
+                srU = SourceRefreshUtil(os.path.join(dirPath, "ltwa-source-state.json"))
+                changed = srU.fetch(urlTargetIsoLtwa, fp)
+                if not changed and (mU.exists(isoLtwaNamePath) or (self.__useBinaryIndex and mU.exists(isoLtwaBinaryPath))):
+                    if changed is None:
+                        logger.warning("Refresh of %s failed - using cached LTWA data", urlTargetIsoLtwa)
+                    else:
+                        srU.saveState()
+                    useCache = True
+                elif changed is None:
+                    logger.error("Refresh of %s failed and there is no cached LTWA data", urlTargetIsoLtwa)
+                    return aD
+            #
+            if useCache and self.__useBinaryIndex and mU.exists(isoLtwaBinaryPath):
+                aD = self.__importBinaryIndex(filePath=isoLtwaBinaryPath)
+            if not aD and useCache and mU.exists(isoLtwaNamePath):
+                aD = mU.doImport(isoLtwaNamePath, fmt=fmt)
+                logger.debug("Abbreviation name length %d", len(aD["abbrev"]))
+            elif not useCache:
+                # ------
+                logger.info("Fetch data from source %s in %s", urlTargetIsoLtwa, dirPath)
+                ok = mU.exists(fp) if srU else fU.get(urlTargetIsoLtwa, fp)
+                aD = self.__getLtwaTerms(fp)
+                aD["lemmas"] = self.__buildLemmaTable(aD)
+                aD["lemmatizer"] = "wordnet" if aD["lemmas"] else None
+                aD["source_hash"] = fU.hash(fp, hashType="sha256") if ok else None
+                ok = self.__cfU.exportAtomic(isoLtwaNamePath, aD, fmt=fmt)
+                logger.debug("abbrevD keys %r", list(aD.keys()))
+                logger.debug("Caching %d ISO LTWA in %s status %r", len(aD["abbrev"]), isoLtwaNamePath, ok)
+                aD["tries"] = self.__buildTermTries(aD["abbrev"])
+                ok = self.__exportBinaryIndex(isoLtwaBinaryPath, aD)
+                logger.debug("Caching binary ISO LTWA index in %s status %r", isoLtwaBinaryPath, ok)
+                if not ok:
+                    # a previous binary index is stale
+                    try:
+                        os.remove(isoLtwaBinaryPath)
+                    except Exception:
+                        pass
+                if srU and aD.get("source_hash"):
+                    srU.saveState()
         #
-        return abbrevD, conflictD, multiWordTermL
+        return aD
+
+    def __exportBinaryIndex(self, filePath, aD):
+        """Write the LTWA term data as memory-mappable string tables."""
+        return MappedStringTable.write(filePath, self.__getBinaryTables(aD), blobD=self.__getBinaryBlobs(aD))
+
+    def __getBinaryBlobs(self, aD):
+        """Return the serialized prefix and reversed suffix term tries of the LTWA term data (blobs trie.prefix and trie.suffix)."""
+        return {"trie." + wType: trie.getBuffer() for wType, trie in aD.get("tries", {}).items()}
+
+    def __getBinaryTables(self, aD):
+        """Return the LTWA term data as string tables.
+
+        Tables: abbrev.<word type>, conflicts.<word type> (JSON encoded language mappings),
+        multi_word_abbrev, lemmas and info (LTWA source hash and lemma table lemmatizer).
+        """
+        tableD = {}
+        for wType, tD in aD.get("abbrev", {}).items():
+            tableD["abbrev." + wType] = tD
+        for wType, tD in aD.get("conflicts", {}).items():
+            tableD["conflicts." + wType] = {word: json.dumps(langD, sort_keys=True) for word, langD in tD.items()}
+        tableD["multi_word_abbrev"] = {term: "" for term in aD.get("multi_word_abbrev", [])}
+        tableD["lemmas"] = aD.get("lemmas", {})
+        tableD["info"] = {ky: aD[ky] for ky in ["source_hash", "lemmatizer"] if aD.get(ky)}
+        return tableD
+
+    def publishSharedTables(self, name=None):
+        """Publish the LTWA term tables in a new shared memory block.
+
+        Providers in other processes (e.g., pool workers) created with sharedTables=shm.name attach to the
+        block without reading the cache or the LTWA source.  Full-word, prefix and suffix terms and lemmas are
+        looked up in the shared block in place, while the small conflict and multi-word tables and the infix
+        automaton are rebuilt in each worker.  Known abbreviations are not published.  The caller owns the block
+        and should call close() and unlink() on it after the workers are finished.
+
+        Args:
+            name (str, optional): shared memory block name (default: a generated unique name). Defaults to None.
+
+        Returns:
+            (obj): multiprocessing.shared_memory.SharedMemory block containing the LTWA tables
+        """
+        aD = {
+            "abbrev": self.__abbrevD,
+            "conflicts": self.__conflictD,
+            "multi_word_abbrev": self.__multiWordTermList,
+            "lemmas": self.__lemmaD,
+            "lemmatizer": "wordnet" if self.__lemmaD else None,
+            "source_hash": self.__sourceHash,
+        }
+        aD["tries"] = {"prefix": self.__abbrevIdx.getPrefixTrie(), "suffix": self.__abbrevIdx.getSuffixTrie()}
+        shm = MappedStringTable.toSharedMemory(self.__getBinaryTables(aD), name=name, blobD=self.__getBinaryBlobs(aD))
+        logger.info("Published LTWA tables in shared memory %s (%d bytes)", shm.name, shm.size)
+        return shm
+
+    def close(self):
+        """Release the mapped binary LTWA index (file map or shared memory block) if one is loaded.
+
+        The LTWA term tables of the provider are empty after close().
+        """
+        if self.__ltwaTables is None:
+            return
+        self.__abbrevD = {}
+        self.__lemmaD = {}
+        self.__abbrevIdx = LtwaTermIndex()
+        self.clearCache()
+        self.__ltwaTables.close()
+        self.__ltwaTables = None
+
+    def __importBinaryIndex(self, filePath=None, sharedMemoryName=None):
+        """Open the binary LTWA index file (memory-mapped) or shared memory block and return the LTWA term data.
+
+        The abbreviation and lemma tables are returned as read-only views of the mapped tables and the prefix
+        and suffix term tries are searched in place, so the pages of the index are shared by all processes
+        mapping the same file or block.  Only the small conflict and multi-word term tables are decoded.
+        The index stays open until close().
+        """
+        aD = {}
+        msT = None
+        try:
+            msT = MappedStringTable(filePath=filePath, sharedMemoryName=sharedMemoryName)
+            aD = {"abbrev": {}, "conflicts": {}, "multi_word_abbrev": [], "lemmas": {}, "tries": {}}
+            for name in msT.getTableNames():
+                tV = msT.getTable(name)
+                if name.startswith("abbrev."):
+                    aD["abbrev"][name[len("abbrev.") :]] = tV
+                elif name.startswith("conflicts."):
+                    aD["conflicts"][name[len("conflicts.") :]] = {word: json.loads(langs) for word, langs in tV.items()}
+                elif name == "multi_word_abbrev":
+                    aD["multi_word_abbrev"] = list(tV)
+                elif name == "lemmas":
+                    aD["lemmas"] = tV
+                elif name == "info":
+                    aD.update({ky: tV[ky] for ky in ["source_hash", "lemmatizer"] if ky in tV})
+            for name in msT.getBlobNames():
+                if name.startswith("trie."):
+                    aD["tries"][name[len("trie.") :]] = LtwaTermTrie(buffer=msT.getBlob(name))
+            logger.debug("Read binary LTWA index %s (full word length %d)", filePath or sharedMemoryName, len(aD["abbrev"].get(self.__fullWordKey, {})))
+        except Exception as e:
+            logger.exception("Failing reading binary LTWA index %s with %s", filePath or sharedMemoryName, str(e))
+            aD = {}
+        if aD:
+            self.__ltwaTables = msT
+        elif msT is not None:
+            msT.close()
+        return aD
+
+    def __buildLemmaTable(self, aD):
+        """Precompute WordNet lemmas for regular inflections of the LTWA full word terms.
+
+        The table is built only with the "wordnet" lemmatizer (rebuilds with lemmatizer=None or a custom
+        lemmatizer do not load nltk) and is skipped if nltk or the WordNet corpus is not available.
+
+        Args:
+            aD (dict): LTWA term data
+
+        Returns:
+            (dict): {inflected form: lemma, ...}
+        """
+        lemmaD = {}
+        if self.__lemmatizer != "wordnet":
+            logger.debug("Skipping LTWA lemma table for lemmatizer %r", self.__lemmatizer)
+            return {}
+        try:
+            from nltk.stem.wordnet import WordNetLemmatizer  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            logger.warning("nltk is not available - skipping LTWA lemma table (%s)", str(e))
+            return {}
+        wml = WordNetLemmatizer()
+        termS = set(aD.get("abbrev", {}).get(self.__fullWordKey, {})) | set(aD.get("conflicts", {}).get(self.__fullWordKey, {}))
+        try:
+            for term in termS:
+                if not term.isalpha():
+                    continue
+                for form in self.__getInflections(term):
+                    if form not in termS and wml.lemmatize(form) == term:
+                        lemmaD[form] = term
+        except LookupError as e:
+            logger.warning("Lemmatizer resources unavailable - skipping LTWA lemma table (%s)", str(e))
+            return {}
+        logger.info("LTWA lemma table length %d", len(lemmaD))
+        return lemmaD
+
+    def __getLemmaTable(self, aD):
+        """Return the precomputed WordNet lemma table for the configured lemmatizer ("wordnet" or None) or an empty table."""
+        lemmaD = aD.get("lemmas", {})
+        if not lemmaD:
+            return {}
+        if aD.get("lemmatizer") != "wordnet":
+            logger.info("Ignoring LTWA lemma table built by lemmatizer %r", aD.get("lemmatizer"))
+            return {}
+        if self.__lemmatizer not in ["wordnet", None]:
+            logger.debug("Using configured lemmatizer %r in place of the WordNet lemma table", type(self.__lemmatizer).__name__)
+            return {}
+        return lemmaD
+
+    def __getInflections(self, term):
+        """Return candidate regular plural forms of the input term."""
+        formS = {term + "s", term + "es"}
+        for sfx, repL in [("y", ["ies"]), ("um", ["a"]), ("us", ["i"]), ("is", ["es"]), ("ex", ["ices"]), ("ix", ["ices"]), ("f", ["ves"]), ("fe", ["ves"])]:
+            if term.endswith(sfx):
+                formS.update([term[: -len(sfx)] + rep for rep in repL])
+        return formS
+
+    def __getLemmatizer(self):
+        """Return the configured lemmatizer (loaded on first use) or None."""
+        if self.__wml is None and self.__lemmatizer:
+            if self.__lemmatizer == "wordnet":
+                try:
+                    from nltk.stem.wordnet import WordNetLemmatizer  # pylint: disable=import-outside-toplevel
+
+                    self.__wml = WordNetLemmatizer()
+                except ImportError as e:
+                    logger.warning("nltk is not available - resolving title words without a lemmatizer (%s)", str(e))
+                    self.__lemmatizer = None
+            else:
+                self.__wml = self.__lemmatizer
+        return self.__wml
+
+    def __getLemma(self, word):
+        """Return the lemma of the input word from the precomputed LTWA lemma table or the configured lemmatizer."""
+        lemma = self.__lemmaD.get(word)
+        if lemma is not None:
+            return lemma
+        wml = self.__getLemmatizer()
+        return wml.lemmatize(word) if wml else word
+
+    def addKnownAbbreviations(self, titleAbbrevD, overwrite=False):
+        """Add known ISO abbreviations for journal titles.  Known abbreviations are returned
+        in place of the LTWA rule-based abbreviation for titles matching after normalization of
+        case, punctuation and white space.
+
+        Args:
+            titleAbbrevD (dict): {journal title: ISO abbreviation, ...}
+            overwrite (bool, optional): replace existing abbreviations for the same title. Defaults to False.
+
+        Returns:
+            (int): number of abbreviations added
+        """
+        numAdded = 0
+        for title, abbrev in titleAbbrevD.items():
+            if not title or not abbrev:
+                continue
+            titleKey = JournalNameUtil.getNameKey(title)
+            if titleKey and (overwrite or titleKey not in self.__knownAbbrevD):
+                self.__knownAbbrevD[titleKey] = " ".join(unicodedata.normalize("NFKD", abbrev).replace(".", " ").split())
+                numAdded += 1
+        logger.debug("Added %d known abbreviations (total %d)", numAdded, len(self.__knownAbbrevD))
+        return numAdded
+
+    def addPubMedAbbreviations(self, pubMedD, overwrite=False):
+        """Add the journal ISO abbreviations observed in PubMed entry data.
+
+        Args:
+            pubMedD (dict): PubMed entry data {pmid: {"article": {"journal_title": , "journal_title_iso_abbrev": , ...}, ...}, ...} (e.g., PubMedReader().readString())
+            overwrite (bool, optional): replace existing abbreviations for the same title. Defaults to False.
+
+        Returns:
+            (int): number of abbreviations added
+        """
+        titleAbbrevD = {}
+        for doc in pubMedD.values():
+            aD = doc.get("article", {}) if isinstance(doc, dict) else {}
+            if aD.get("journal_title") and aD.get("journal_title_iso_abbrev"):
+                titleAbbrevD[aD["journal_title"]] = aD["journal_title_iso_abbrev"]
+        return self.addKnownAbbreviations(titleAbbrevD, overwrite=overwrite)
+
+    def getKnownAbbreviationCount(self):
+        return len(self.__knownAbbrevD)
 
     def getJournalAbbreviation(self, title, usePunctuation=True):
-        #
-        useLangs = ["eng"]
-        title = unicodedata.normalize("NFKD", title)
-        useLangs = set(useLangs)
+        """Return the ISO 4 abbreviation for the input journal title.
+
+        Args:
+            title (str): journal title
+            usePunctuation (bool, optional): append periods to abbreviated words. Defaults to True.
+
+        Returns:
+            (str): abbreviated journal title
+        """
+        if self.__knownAbbrevD:
+            knownAbbrev = self.__getKnownAbbreviation(title, usePunctuation)
+            if knownAbbrev is not None:
+                return knownAbbrev
+        if self.__resultCacheD is not None:
+            resultD = self.__getResultTable(usePunctuation)
+            if title not in resultD:
+                resultD[title] = self.__abbreviateTitleCached(title, usePunctuation)
+                self.__resultCacheModified = True
+            return resultD[title]
+        return self.__abbreviateTitleCached(title, usePunctuation)
+
+    def cacheInfo(self):
+        """Return usage statistics for the memoized title and title word abbreviations.
+
+        Returns:
+            (dict): {"title": {"hits": , "misses": , "maxSize": , "currentSize": , "hitRate": }, "word": {...}}
+        """
+        rD = {}
+        for ky, cachedMethod in [("title", self.__abbreviateTitleCached), ("word", self.__resolveWordCached)]:
+            cI = cachedMethod.cache_info()
+            rD[ky] = {
+                "hits": cI.hits,
+                "misses": cI.misses,
+                "maxSize": cI.maxsize,
+                "currentSize": cI.currsize,
+                "hitRate": float(cI.hits) / float(cI.hits + cI.misses) if cI.hits + cI.misses else 0.0,
+            }
+        return rD
+
+    def clearCache(self):
+        """Clear the memoized title and title word abbreviations (and usage statistics)."""
+        self.__abbreviateTitleCached.cache_clear()
+        self.__resolveWordCached.cache_clear()
+
+    def getJournalAbbreviations(self, titleList, usePunctuation=True, workers=1):
+        """Return ISO 4 abbreviations for a list of journal titles.
+
+        All titles are tokenized first and each distinct normalized title word is
+        resolved only once across the full list.
+
+        Args:
+            titleList (list): journal titles
+            usePunctuation (bool, optional): append periods to abbreviated words. Defaults to True.
+            workers (int, optional): number of worker processes used to resolve distinct title words. Defaults to 1.
+
+        Returns:
+            (list): abbreviated journal titles in input order
+        """
+        if self.__knownAbbrevD:
+            abbrevL = [self.__getKnownAbbreviation(title, usePunctuation) for title in titleList]
+            missL = [title for title, abbrev in zip(titleList, abbrevL) if abbrev is None]
+            if missL:
+                missAbbrevIt = iter(self.__getRuleAbbreviations(missL, usePunctuation, workers))
+                abbrevL = [abbrev if abbrev is not None else next(missAbbrevIt) for abbrev in abbrevL]
+            return abbrevL
+        return self.__getRuleAbbreviations(titleList, usePunctuation, workers)
+
+    def __getRuleAbbreviations(self, titleList, usePunctuation, workers):
+        if self.__resultCacheD is not None:
+            resultD = self.__getResultTable(usePunctuation)
+            missL = sorted(set([title for title in titleList if title not in resultD]))
+            if missL:
+                resultD.update(zip(missL, self.__getJournalAbbreviationList(missL, usePunctuation, workers)))
+                self.__resultCacheModified = True
+            return [resultD[title] for title in titleList]
+        return self.__getJournalAbbreviationList(titleList, usePunctuation, workers)
+
+    def saveResultCache(self):
+        """Save the persistent title abbreviation result cache (if enabled and modified) in the cache directory.
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        if self.__resultCacheD is None:
+            return False
+        if not self.__resultCacheModified:
+            return True
+        ok = False
+        try:
+            # replaced atomically - concurrent processes may be loading the result cache
+            ok = self.__cfU.exportAtomic(self.__resultCachePath, self.__resultCacheD, fmt="json")
+            self.__resultCacheModified = not ok
+            logger.debug("Saved %r title abbreviation results in %s status %r", {ky: len(rD) for ky, rD in self.__resultCacheD["results"].items()}, self.__resultCachePath, ok)
+        except Exception as e:
+            logger.exception("Failing saving result cache %s with %s", self.__resultCachePath, str(e))
+        return ok
+
+    def backup(self, cfgOb, configName, remotePrefix=None, useStash=True, useGit=False, backupToFallback=False):
+        """Backup the cache directory (including any persistent title abbreviation results) to remote stash and/or git storage.
+
+        Args:
+            cfgOb (obj): configuration object (ConfigUtil())
+            configName (str): configuration section name
+            remotePrefix (str, optional): channel prefix. Defaults to None.
+            useStash (bool, optional): use "stash" storage services. Defaults to True.
+            useGit (bool, optional): use a git repository service. Defaults to False.
+            backupToFallback (bool, optional): whether to also backup to fallback stash server. Defaults to False.
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        self.saveResultCache()
+        return super(JournalTitleAbbreviationProvider, self).backup(cfgOb, configName, remotePrefix=remotePrefix, useStash=useStash, useGit=useGit, backupToFallback=backupToFallback)
+
+    def __getResultCacheKey(self, usePunctuation):
+        """Return the key of the persistent results for the current abbreviation options."""
+        if self.__lemmatizer is None or isinstance(self.__lemmatizer, str):
+            lemmatizerName = str(self.__lemmatizer).lower()
+        else:
+            lemmatizerName = type(self.__lemmatizer).__name__
+        return "%s|%s|%s" % (",".join(self.__languages), lemmatizerName, "punctuation" if usePunctuation else "no_punctuation")
+
+    def __getResultTable(self, usePunctuation):
+        return self.__resultCacheD["results"].setdefault(self.__getResultCacheKey(usePunctuation), {})
+
+    def __loadResultCache(self, filePath):
+        """Load persistent title abbreviation results, discarding results for any other LTWA source or rules version.
+
+        Returns:
+            (dict): {"source_hash": , "rules_version": , "results": {option key: {title: abbreviation, ...}, ...}} or None if the LTWA source is unknown
+        """
+        if not self.__sourceHash:
+            logger.warning("LTWA source hash is unavailable (rebuild the cache with useCache=False) - persistent results are disabled")
+            return None
+        rD = {"source_hash": self.__sourceHash, "rules_version": self.RULES_VERSION, "results": {}}
+        try:
+            mU = MarshalUtil()
+            if mU.exists(filePath):
+                tD = mU.doImport(filePath, fmt="json")
+                if tD and tD.get("source_hash") == self.__sourceHash and tD.get("rules_version") == self.RULES_VERSION:
+                    rD["results"] = tD.get("results", {})
+                else:
+                    logger.info("Discarding title abbreviation results for a prior LTWA source or rules version in %s", filePath)
+                    self.__resultCacheModified = True
+        except Exception as e:
+            logger.exception("Failing reading result cache %s with %s", filePath, str(e))
+        logger.debug("Loaded title abbreviation results %r", {ky: len(tD) for ky, tD in rD["results"].items()})
+        return rD
+
+    def __getKnownAbbreviation(self, title, usePunctuation):
+        """Return the known ISO abbreviation for the input title or None.  With punctuation,
+        periods are appended to abbreviation tokens that are not words of the title.
+        """
+        titleKey = JournalNameUtil.getNameKey(title)
+        abbrev = self.__knownAbbrevD.get(titleKey)
+        if abbrev is None:
+            return None
+        if usePunctuation:
+            titleWordS = set(titleKey.split())
+            abbrev = " ".join([tok + "." if re.fullmatch(r"\p{L}[\p{L}\p{M}]*", tok) and JournalNameUtil.getNameKey(tok) not in titleWordS else tok for tok in abbrev.split()])
+        return unicodedata.normalize("NFKC", abbrev)
+
+    def __getJournalAbbreviationList(self, titleList, usePunctuation, workers):
+        tokenL = [self.__tokenizeTitle(title) for title in titleList]
+        wordS = set()
+        for _, wordPairL in tokenL:
+            if not self.__isSingleWordTitle(wordPairL):
+                wordS.update([wordNorm for _, wordNorm in wordPairL if wordNorm not in self.__stopWords])
+        wordResolutionD = self.__resolveWords(sorted(wordS), workers)
+        logger.debug("Resolved %d distinct words for %d titles", len(wordResolutionD), len(tokenL))
+        return [self.__assembleAbbreviation(title, wordPairL, wordResolutionD, usePunctuation) for title, wordPairL in tokenL]
+
+    def __abbreviateTitle(self, title, usePunctuation):
+        title, wordPairL = self.__tokenizeTitle(title)
+        return self.__assembleAbbreviation(title, wordPairL, {}, usePunctuation)
 
+    def __tokenizeTitle(self, title):
+        """Split the input title into words and multi-word terms.
+
+        Returns:
+            tuple: (str) NFKD normalized title
+                   (list) [(original word, normalized word), ...]
+        """
+        title = unicodedata.normalize("NFKD", title)
         # split title either at space on as defined as multi-word targets
-        titleWords = list(filter(lambda w: w.strip(), self.__tokenizerRegex.split(title)))
+        titleWords = self.__phraseMatcher.split(title)
+        return title, [(origWord, self.__normalizeWord(origWord)) for origWord in titleWords]
 
-        retWordList = []
+    def __isSingleWordTitle(self, wordPairL):
+        return len(wordPairL) == 1 and len(wordPairL[0][0].split(" ")) == 1
+
+    def __assembleAbbreviation(self, title, wordPairL, wordResolutionD, usePunctuation):
+        """Assemble the abbreviated title from resolved title words.
+
+        Args:
+            title (str): NFKD normalized title
+            wordPairL (list): [(original word, normalized word), ...]
+            wordResolutionD (dict): resolved words {normalized word: resolution, ...} (updated with any unresolved words)
+            usePunctuation (bool): append periods to abbreviated words
 
+        Returns:
+            (str): abbreviated journal title
+        """
         # Exception for single-word titles
-        if len(titleWords) == 1 and len(titleWords[0].split(" ")) == 1:
+        if self.__isSingleWordTitle(wordPairL):
             return title
 
-        for origWord in titleWords:
-            # normalize and lemmatize
-            wordNorm = self.__normalizeWord(origWord)
-
+        retWordList = []
+        for origWord, wordNorm in wordPairL:
             # skip stopwords
             if wordNorm in self.__stopWords:
                 continue
-
-            # if normalized word fails, try lemma
-            wordLemma = self.__wml.lemmatize(wordNorm)
-            wordCandidates = (wordNorm, wordLemma) if wordNorm != wordLemma else (wordNorm,)
-
-            wordAbbr = ""
+            if wordNorm not in wordResolutionD:
+                wordResolutionD[wordNorm] = self.__resolveWordCached(wordNorm)
+            if wordResolutionD[wordNorm] is None:
+                return title
+            wordAbbr, word = wordResolutionD[wordNorm]
             capitalization = self.__getCapitalization(origWord)
 
-            for word in wordCandidates:
-                # Check for language degeneracy in mapping
-                if self.__fullWordKey in self.__conflictD and word in self.__conflictD[self.__fullWordKey]:
-                    allowedLangs = self.__conflictD[self.__fullWordKey][word].keys()
-                    possibleLangs = allowedLangs & useLangs
-                    if len(possibleLangs) == 1:
-                        wordAbbr = self.__conflictD[self.__fullWordKey][word][possibleLangs.pop()]
-                        break
-                    else:
-                        logger.error("Language mapping conflict for term %r (%r)", word, allowedLangs)
-                        return title
-                if not wordAbbr and self.__prefixKey in self.__conflictD:
-                    # prefix conflicts
-                    for prefix in sorted(self.__conflictD[self.__prefixKey].keys()):
-                        if word.startswith(prefix):
-                            allowedLangs = self.__conflictD[self.__prefixKey][word].keys()
-                            possibleLangs = allowedLangs & useLangs
-                            if len(possibleLangs) == 1:
-                                wordAbbr = self.__conflictD[self.__prefixKey][word][possibleLangs.pop()]
-                            else:
-                                logger.error("Language mapping conflict for term %r (%r)", word, allowedLangs)
-                                return title
-
-                if not wordAbbr and self.__suffixKey in self.__conflictD:
-                    # suffix conflicts
-                    for suffix in sorted(self.__conflictD[self.__suffixKey].keys()):
-                        if word.endswith(suffix):
-                            allowedLangs = self.__conflictD[self.__suffixKey][word].keys()
-                            possibleLangs = allowedLangs & useLangs
-                            if len(possibleLangs) == 1:
-                                wordAbbr = self.__conflictD[self.__suffixKey][word][possibleLangs.pop()]
-                            else:
-                                logger.error("Language mapping conflict for term %r (%r)", word, allowedLangs)
-                                return title
-
-                if not wordAbbr and self.__infixKey in self.__conflictD:
-                    # infix conflicts
-                    for infix in sorted(self.__conflictD[self.__infixKey].keys()):
-                        if infix in word:
-                            allowedLangs = self.__conflictD[self.__infixKey][word].keys()
-                            possibleLangs = allowedLangs & useLangs
-                            if len(possibleLangs) == 1:
-                                wordAbbr = self.__conflictD[self.__infixKey][word][possibleLangs.pop()]
-                            else:
-                                logger.error("Language mapping conflict for term %r (%r)", word, allowedLangs)
-                                return title
-                if wordAbbr:
-                    break
-
-                # Evaluate abbreviation mapping for each word type
-                if not wordAbbr and self.__fullWordKey in self.__abbrevD and word in self.__abbrevD[self.__fullWordKey]:
-                    wordAbbr = self.__abbrevD[self.__fullWordKey][word]
-                    break
-                if not wordAbbr and self.__prefixKey in self.__abbrevD:
-                    # check prefixes in descending length order
-                    for prefix in sorted(self.__abbrevD[self.__prefixKey].keys(), key=lambda p: (-len(p), p)):
-                        if word.startswith(prefix):
-                            wordAbbr = self.__abbrevD[self.__prefixKey][prefix]
-                            break
-                if not wordAbbr and self.__suffixKey in self.__abbrevD:
-                    # check suffixes in descending length order
-                    for suffix in sorted(self.__abbrevD[self.__suffixKey].keys(), key=lambda p: (-len(p), p)):
-                        if word.endswith(suffix):
-                            wordAbbr = self.__abbrevD[self.__suffixKey][suffix]
-                            break
-                if not wordAbbr and self.__infixKey in self.__abbrevD:
-                    # check infixes in descending length order
-                    for infix in sorted(self.__abbrevD[self.__infixKey].keys(), key=lambda p: (-len(p), p)):
-                        if infix in word:
-                            wordAbbr = self.__abbrevD[self.__infixKey][infix]
-                            break
-                if wordAbbr:
-                    break
-
             # Apply formating preferences
             if wordAbbr in ("", self.__noAbbrevPlaceHolder):
                 wordAbbr = self.__finalizeOutput(word, capitalization, usePunctuation=False)
@@ -348,6 +855,105 @@ class JournalTitleAbbreviationProvider(StashableBase):
             retWordList.append(wordAbbr)
         return unicodedata.normalize("NFKC", " ".join(retWordList))
 
+    def __resolveWords(self, wordList, workers):
+        """Resolve the input normalized words optionally distributing the work across worker processes.
+
+        Returns:
+            (dict): {normalized word: resolution, ...}
+        """
+        if workers > 1 and len(wordList) > 1:
+            try:
+                mpContext = multiprocessing.get_context("fork")
+            except ValueError:
+                mpContext = None
+                logger.warning("Forked worker processes are not supported on this platform - resolving words serially")
+            if mpContext:
+                chunkSize = max(1, -(-len(wordList) // (4 * workers)))
+                chunkL = [wordList[ii : ii + chunkSize] for ii in range(0, len(wordList), chunkSize)]
+                wordResolutionD = {}
+                with ProcessPoolExecutor(max_workers=workers, mp_context=mpContext, initializer=_initWordResolver, initargs=(self.__resolveWordList,)) as executor:
+                    for chunkD in executor.map(_resolveWordChunk, chunkL):
+                        wordResolutionD.update(chunkD)
+                return wordResolutionD
+        return self.__resolveWordList(wordList)
+
+    def __resolveWordList(self, wordList):
+        return {wordNorm: self.__resolveWordCached(wordNorm) for wordNorm in wordList}
+
+    def __resolveWord(self, wordNorm):
+        """Resolve the LTWA abbreviation for a normalized title word (or its lemma).
+
+        Args:
+            wordNorm (str): normalized title word
+
+        Returns:
+            tuple: (str) abbreviation or "" if there is no matching term
+                   (str) the word form (normalized word or lemma) last evaluated
+            or None if the word has an unresolved language mapping conflict
+        """
+        word = wordNorm
+        wordAbbr = self.__lookupWord(word)
+        if wordAbbr is None:
+            # if normalized word fails, try lemma (loaded only on a miss)
+            wordLemma = self.__getLemma(wordNorm)
+            if wordLemma != wordNorm:
+                word = wordLemma
+                wordAbbr = self.__lookupWord(word)
+        if wordAbbr is False:
+            return None
+        return (wordAbbr if wordAbbr else "", word)
+
+    def __lookupWord(self, word):
+        """Return the LTWA abbreviation for the input word form, None if there is no matching term,
+        or False if the word has an unresolved language mapping conflict.
+        """
+        # Check for language degeneracy in mapping (resolved for the provider languages)
+        for wType, getMatch in [
+            (self.__fullWordKey, lambda w: w if w in self.__resolvedConflictD[self.__fullWordKey] else None),
+            (self.__prefixKey, self.__conflictIdx.getLongestPrefix),
+            (self.__suffixKey, self.__conflictIdx.getLongestSuffix),
+            (self.__infixKey, self.__conflictIdx.getBestInfix),
+        ]:
+            if wType not in self.__resolvedConflictD:
+                continue
+            term = getMatch(word)
+            if term is not None:
+                wordAbbr = self.__resolvedConflictD[wType][term]
+                if wordAbbr is None:
+                    logger.error("Language mapping conflict for term %r (%r)", word, self.__conflictD[wType][term].keys())
+                    return False
+                if wordAbbr or wType == self.__fullWordKey:
+                    return self.__getTermAbbreviation(word, wType, term, wordAbbr)
+
+        # Evaluate abbreviation mapping for each word type
+        wordAbbr = self.__abbrevD[self.__fullWordKey].get(word) if self.__fullWordKey in self.__abbrevD else None
+        if wordAbbr is not None:
+            return wordAbbr
+        for wType, getMatch in [
+            (self.__prefixKey, self.__abbrevIdx.getLongestPrefix),
+            (self.__suffixKey, self.__abbrevIdx.getLongestSuffix),
+            (self.__infixKey, self.__abbrevIdx.getBestInfix),
+        ]:
+            if wType in self.__abbrevD:
+                term = getMatch(word)
+                wordAbbr = self.__abbrevD[wType][term] if term is not None else None
+                if wordAbbr:
+                    return self.__getTermAbbreviation(word, wType, term, wordAbbr)
+        return None
+
+    def __getTermAbbreviation(self, word, wType, term, termAbbr):
+        """Return the abbreviation of the input word for its matching LTWA term.
+
+        A suffix or infix term abbreviation replaces only the matching end of the word (the word is
+        truncated after an infix), e.g. 'cardiologie' with '-ologie' (-ol.) is 'cardiol' and 'myocardial'
+        with '-cardi-' (-card.) is 'myocard'.
+        """
+        if termAbbr == self.__noAbbrevPlaceHolder or wType not in (self.__suffixKey, self.__infixKey):
+            return termAbbr
+        if wType == self.__suffixKey:
+            return word[: len(word) - len(term)] + termAbbr
+        return word[: word.find(term)] + termAbbr
+
     def __getType(self, word):
         """Classify the input word base on internal punctuation."""
         if word.startswith("-"):
@@ -404,69 +1010,62 @@ class JournalTitleAbbreviationProvider(StashableBase):
             parts.append(part)
         return " ".join(parts)
 
-    def __getLtwaTerms(self, dirPath, isoLtwaNamePath):
+    def __getLtwaTerms(self, isoLtwaNamePath):
+        """Parse the ISO LTWA source file in a single streaming pass.
+
+        Terms with more than one mapping (typically language specific) are collected as conflicts
+        and removed from the abbreviation tables.  Only the languages of the first mapping of each
+        term are retained until the term is either found in conflict or the pass completes.
+        """
         logger.info("Processing terms in %r", isoLtwaNamePath)
         titleWordAbbrevD = {}
         conflictD = {}
         multiWordTermL = []
         abbrevD = {"abbrev": titleWordAbbrevD, "conflicts": conflictD, "multi_word_abbrev": multiWordTermL}
         #
-        mU = MarshalUtil(workPath=dirPath)
         try:
-            tsv = mU.doImport(isoLtwaNamePath, fmt="tdd", rowFormat="list", encoding="utf-16-le")
-            logger.debug("Read isoLtwaNamePath %s record count %d", isoLtwaNamePath, len(tsv))
-            conflictWords = set()
-            for line in tsv:
-                try:
-                    if len(line) == 3:
-                        word, abbr, langs = line
-                    else:
-                        word, abbr = line
-                        langs = ""
-
-                except Exception:
+            # languages of the first mapping of each term {wType: {word: langs, ...}, ...}
+            firstLangsD = {}
+            rowCount = 0
+            # tab delimited UTF-16LE rows streamed from the source file
+            for line in IoUtil().deserializeCsvIter(isoLtwaNamePath, delimiter="\t", rowFormat="list", encoding="utf-16-le"):
+                rowCount += 1
+                if len(line) == 3:
+                    word, abbr, langs = line
+                elif len(line) == 2:
+                    word, abbr = line
+                    langs = ""
+                else:
                     logger.error("Format issue for line %r", line)
                     continue
+                # Assign word type -
                 wType = self.__getType(word)
                 word = self.__normalizeWord(word)
                 abbr = self.__normalizeAbbr(abbr)
-                # Assign word type -
                 if wType not in titleWordAbbrevD:
                     titleWordAbbrevD[wType] = {}
-                # Detect conflict words
-                if word in titleWordAbbrevD[wType]:
-                    conflictWords.add((wType, word))
-                elif " " in word:
-                    multiWordTermL.append(re.escape(word))
+                    firstLangsD[wType] = {}
                 #
-                titleWordAbbrevD[wType][word] = abbr
-            # Build dictionary capturing degenerate language specific mappings
-            for wType, word in conflictWords:
-                # remove from main list
-                titleWordAbbrevD[wType].pop(word)
-            logger.debug("conflict words length %d", len(conflictWords))
-            for line in tsv:
-                try:
-                    if len(line) == 3:
-                        word, abbr, langs = line
-                    else:
-                        word, abbr = line
-                        langs = ""
-                except Exception:
-                    logger.error("Format issue for line %r", line)
+                if wType in conflictD and word in conflictD[wType]:
+                    langD = conflictD[wType][word]
+                elif word in titleWordAbbrevD[wType]:
+                    # Detect conflict words and capture degenerate language specific mappings
+                    langD = conflictD.setdefault(wType, {}).setdefault(word, {})
+                    firstAbbr = titleWordAbbrevD[wType].pop(word)
+                    for lang in firstLangsD[wType].pop(word).split(","):
+                        langD[lang.strip()] = firstAbbr
+                else:
+                    if " " in word:
+                        multiWordTermL.append(re.escape(word))
+                    titleWordAbbrevD[wType][word] = abbr
+                    firstLangsD[wType][word] = langs
                     continue
-                wType = self.__getType(word)
-                word = self.__normalizeWord(word)
-                logger.debug("Word %r wordType %r", word, wType)
-                if (wType, word) in conflictWords:
-                    abbr = self.__normalizeAbbr(abbr)
-                    if wType not in conflictD:
-                        conflictD[wType] = {}
-                    if word not in conflictD[wType]:
-                        conflictD[wType][word] = {}
-                    for lang in langs.split(","):
-                        conflictD[wType][word][lang.strip()] = abbr
-            multiWordTermL = sorted(list(set(multiWordTermL)))
+                for lang in langs.split(","):
+                    langD[lang.strip()] = abbr
+            #
+            logger.debug("Read isoLtwaNamePath %s record count %d", isoLtwaNamePath, rowCount)
+            logger.debug("conflict words length %d", sum([len(tD) for tD in conflictD.values()]))
+            multiWordTermL = sorted(set(multiWordTermL))
             #
             abbrevD = {"abbrev": titleWordAbbrevD, "conflicts": conflictD, "multi_word_abbrev": multiWordTermL}
             for ky in abbrevD["abbrev"]:
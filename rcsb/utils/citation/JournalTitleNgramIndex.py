@@ -0,0 +1,122 @@
+##
+# File:    JournalTitleNgramIndex.py
+# Date:    18-Oct-2026
+#
+#  Updates:
+##
+"""
+Character n-gram inverted index for approximate (fuzzy) journal title matching.
+
+"""
+
+import heapq
+import logging
+from array import array
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+
+class JournalTitleNgramIndex(object):
+    """Inverted index from character n-grams to normalized journal titles.
+
+    Candidate titles are gathered from the postings of the rarest n-grams of the query (bounded by
+    a posting budget).  The candidates with close to the most hits are ranked by the Dice coefficient
+    of their n-gram sets with the query n-gram set.  Probing several of the rarest n-grams tolerates
+    the (rare) n-grams introduced by misspellings.
+    """
+
+    def __init__(self, titleItems, ngramSize=4, probeGrams=8, postingBudget=5000, hitSlack=2, candidateFactor=3):
+        """Build the index.
+
+        Args:
+            titleItems (iterable): normalized titles and identifiers [(title, (issn, ...)), ...]
+            ngramSize (int, optional): n-gram length. Defaults to 4.
+            probeGrams (int, optional): maximum number of (rarest) query n-grams probed. Defaults to 8.
+            postingBudget (int, optional): maximum number of postings scanned per query. Defaults to 5000.
+            hitSlack (int, optional): candidates have at least the maximum hit count less this slack. Defaults to 2.
+            candidateFactor (int, optional): maximum number of candidates ranked per requested match. Defaults to 3.
+        """
+        self.__ngramSize = ngramSize
+        self.__postingBudget = postingBudget
+        self.__probeGrams = probeGrams
+        self.__hitSlack = hitSlack
+        self.__candidateFactor = candidateFactor
+        self.__titleL = []
+        self.__issnL = []
+        self.__postingD = {}
+        self.__build(titleItems)
+
+    def __build(self, titleItems):
+        titleIdD = {}
+        postingD = {}
+        for title, issnT in titleItems:
+            if not title:
+                continue
+            titleId = titleIdD.get(title)
+            if titleId is not None:
+                self.__issnL[titleId] = tuple(dict.fromkeys(self.__issnL[titleId] + tuple(issnT)))
+                continue
+            titleId = titleIdD[title] = len(self.__titleL)
+            self.__titleL.append(title)
+            self.__issnL.append(tuple(issnT))
+            for gram in self.getNgrams(title):
+                postingL = postingD.get(gram)
+                if postingL is None:
+                    postingL = postingD[gram] = array("I")
+                postingL.append(titleId)
+        self.__postingD = postingD
+        logger.debug("Journal title n-gram index titles %d n-grams %d postings %d", len(self.__titleL), len(postingD), sum([len(pL) for pL in postingD.values()]))
+
+    def getNgrams(self, title):
+        """Return the set of character n-grams of the input (normalized) title padded with a leading and trailing space."""
+        title = " " + title + " "
+        nS = self.__ngramSize
+        return {title[ii : ii + nS] for ii in range(max(1, len(title) - nS + 1))}
+
+    def search(self, title, k=10):
+        """Return the best matching titles for the input (normalized) title.
+
+        Args:
+            title (str): normalized title
+            k (int, optional): maximum number of matches. Defaults to 10.
+
+        Returns:
+            (list): [(score, title, (issn, ...)), ...] in order of decreasing score (Dice coefficient of n-gram sets)
+        """
+        if not title or k < 1:
+            return []
+        queryS = self.getNgrams(title)
+        gramL = sorted([gram for gram in queryS if gram in self.__postingD], key=lambda gram: len(self.__postingD[gram]))
+        if not gramL:
+            return []
+        # Count the hits in the postings of the rarest n-grams (up to probeGrams n-grams within the posting budget)
+        hitC = Counter()
+        nScanned = 0
+        for gram in gramL[: self.__probeGrams]:
+            postingL = self.__postingD[gram]
+            if nScanned + len(postingL) > self.__postingBudget:
+                if nScanned:
+                    break
+                # non-selective query - the first titles sharing its rarest n-gram
+                postingL = postingL[: self.__postingBudget]
+            hitC.update(postingL)
+            nScanned += len(postingL)
+        # Rank the titles with close to the most hits by the Dice coefficient of their n-gram sets with the query n-gram set
+        minHits = max(hitC.values()) - self.__hitSlack
+        candidateL = [titleId for titleId, count in hitC.items() if count >= minHits]
+        if len(candidateL) > k * self.__candidateFactor:
+            candidateL = heapq.nlargest(k * self.__candidateFactor, candidateL, key=hitC.__getitem__)
+        nQuery = len(queryS)
+        scoreL = []
+        for titleId in candidateL:
+            titleS = self.getNgrams(self.__titleL[titleId])
+            scoreL.append((2.0 * len(queryS & titleS) / (nQuery + len(titleS)), titleId))
+        return [(score, self.__titleL[titleId], self.__issnL[titleId]) for score, titleId in heapq.nlargest(k, scoreL)]
+
+    def getTitleCount(self):
+        return len(self.__titleL)
+
+    def getMemorySize(self):
+        """Return the approximate memory size (bytes) of the n-gram postings."""
+        return sum([pL.buffer_info()[1] * pL.itemsize for pL in self.__postingD.values()])
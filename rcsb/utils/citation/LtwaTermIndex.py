@@ -0,0 +1,328 @@
+##
+# File:    LtwaTermIndex.py
+# Date:    18-Oct-2026
+#
+#  Updates:
+#  18-Oct-2026  Replace the prefix and suffix length buckets with character tries (LtwaTermTrie)
+##
+"""
+Longest-match lookup index and multi-word phrase matcher over ISO LTWA title word terms.
+
+"""
+
+import logging
+import struct
+import sys
+from array import array
+from collections import deque
+
+import regex as re
+
+logger = logging.getLogger(__name__)
+
+
+class LtwaTermTrie(object):
+    """Character trie over LTWA terms held in a flat buffer.
+
+    The trie transitions are stored in an open addressing hash table keyed by (state, character),
+    so a longest-match lookup walks the query word once and costs O(L) hash probes for a word of
+    length L.  The buffer (see toBytes()) can be stored in a file or shared memory block and
+    searched in place.
+
+    Layout (little-endian): magic (8 bytes), slot count (power of 2, uint64), slot keys
+    (uint64 - (state << 21 | character code point) + 1, 0 for an empty slot) and slot values
+    (uint32 - child state * 2 + terminal flag).
+    """
+
+    MAGIC = b"LTTRIE01"
+    HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+    HASH_MASK = 0xFFFFFFFFFFFFFFFF
+
+    def __init__(self, termL=None, buffer=None):
+        """Build the trie from a list of terms or open a serialized trie.
+
+        Args:
+            termL (list, optional): terms. Defaults to None.
+            buffer (obj, optional): object supporting the buffer protocol containing a serialized trie (see toBytes()). Defaults to None.
+        """
+        self.__buf = memoryview(buffer if buffer is not None else self.toBytes(termL or []))
+        if bytes(self.__buf[:8]) != self.MAGIC:
+            raise ValueError("Unrecognized term trie format")
+        (numSlots,) = struct.unpack_from("<Q", self.__buf, 8)
+        self.__slotMask = numSlots - 1
+        self.__shift = 64 - (numSlots.bit_length() - 1)
+        self.__keyV = self.__buf[16 : 16 + 8 * numSlots].cast("Q")
+        self.__valV = self.__buf[16 + 8 * numSlots : 16 + 12 * numSlots].cast("I")
+        if sys.byteorder != "little":
+            # byte-swapped copies on big-endian hosts
+            self.__keyV, self.__valV = array("Q", self.__keyV), array("I", self.__valV)
+            self.__keyV.byteswap()
+            self.__valV.byteswap()
+
+    def getBuffer(self):
+        """Return the serialized trie."""
+        return self.__buf
+
+    def getLongestMatch(self, word):
+        """Return the length of the longest term that is a prefix of the input word (0 if there is none).
+
+        Args:
+            word (str): input word (reversed for a trie of reversed terms)
+
+        Returns:
+            (int): length of the longest matching term
+        """
+        keyV = self.__keyV
+        state = best = 0
+        for ii, ch in enumerate(word, 1):
+            key = (state << 21 | ord(ch)) + 1
+            slot = ((key * self.HASH_MULTIPLIER) & self.HASH_MASK) >> self.__shift
+            while keyV[slot] != key:
+                if not keyV[slot]:
+                    return best
+                slot = (slot + 1) & self.__slotMask
+            val = self.__valV[slot]
+            state = val >> 1
+            if val & 1:
+                best = ii
+        return best
+
+    @staticmethod
+    def toBytes(termL):
+        """Serialize a trie over the input terms.
+
+        Args:
+            termL (list): terms
+
+        Returns:
+            (bytes): serialized trie
+        """
+        # {transition key: child state * 2 + terminal flag, ...}
+        transD = {}
+        for term in termL:
+            key = 0
+            for ch in term:
+                key = ((transD[key] >> 1 if key else 0) << 21 | ord(ch)) + 1
+                if key not in transD:
+                    transD[key] = (len(transD) + 1) << 1
+            if key:
+                transD[key] |= 1
+        # at most half of the slots are occupied
+        numSlots = 2
+        while numSlots < 2 * len(transD):
+            numSlots *= 2
+        shift = 64 - (numSlots.bit_length() - 1)
+        keyA = array("Q", bytes(8 * numSlots))
+        valA = array("I", bytes(4 * numSlots))
+        for key, val in transD.items():
+            slot = ((key * LtwaTermTrie.HASH_MULTIPLIER) & LtwaTermTrie.HASH_MASK) >> shift
+            while keyA[slot]:
+                slot = (slot + 1) & (numSlots - 1)
+            keyA[slot] = key
+            valA[slot] = val
+        if sys.byteorder != "little":
+            keyA.byteswap()
+            valA.byteswap()
+        return LtwaTermTrie.MAGIC + struct.pack("<Q", numSlots) + keyA.tobytes() + valA.tobytes()
+
+
+class LtwaTermIndex(object):
+    """Longest-match index for LTWA prefix, suffix and infix terms.
+
+    Prefix terms and reversed suffix terms are held in character tries (LtwaTermTrie), so a
+    longest-prefix (or longest-suffix) lookup walks the query word once with O(L) hash probes
+    for a word of length L.
+
+    Infix terms are compiled into an Aho-Corasick automaton so that all infix terms
+    occurring in a word are found in a single pass over the word.  Overlapping matches
+    are resolved longest first, then alphabetically.
+    """
+
+    def __init__(self, prefixD=None, suffixD=None, infixD=None, prefixTrie=None, suffixTrie=None):
+        """Build the index.
+
+        Args:
+            prefixD (dict, optional): prefix terms {term: value, ...}. Defaults to None.
+            suffixD (dict, optional): suffix terms {term: value, ...}. Defaults to None.
+            infixD (dict, optional): infix terms {term: value, ...}. Defaults to None.
+            prefixTrie (obj, optional): LtwaTermTrie of the prefix terms (used in place of prefixD). Defaults to None.
+            suffixTrie (obj, optional): LtwaTermTrie of the reversed suffix terms (used in place of suffixD). Defaults to None.
+        """
+        self.__prefixTrie = prefixTrie if prefixTrie else LtwaTermTrie(list(prefixD) if prefixD else [])
+        self.__suffixTrie = suffixTrie if suffixTrie else LtwaTermTrie([term[::-1] for term in suffixD] if suffixD else [])
+        self.__gotoL, self.__failL, self.__bestL = self.__buildAutomaton(infixD.keys() if infixD else [])
+
+    def getPrefixTrie(self):
+        """Return the trie of prefix terms."""
+        return self.__prefixTrie
+
+    def getSuffixTrie(self):
+        """Return the trie of reversed suffix terms."""
+        return self.__suffixTrie
+
+    def getLongestPrefix(self, word):
+        """Return the longest prefix term of the input word or None.
+
+        Args:
+            word (str): normalized input word
+
+        Returns:
+            (str): matching prefix term or None
+        """
+        tLen = self.__prefixTrie.getLongestMatch(word)
+        return word[:tLen] if tLen else None
+
+    def getLongestSuffix(self, word):
+        """Return the longest suffix term of the input word or None.
+
+        Args:
+            word (str): normalized input word
+
+        Returns:
+            (str): matching suffix term or None
+        """
+        tLen = self.__suffixTrie.getLongestMatch(word[::-1])
+        return word[len(word) - tLen :] if tLen else None
+
+    def getBestInfix(self, word):
+        """Return the longest infix term occurring in the input word or None.
+        Ties between terms of equal length are broken alphabetically.
+
+        Args:
+            word (str): normalized input word
+
+        Returns:
+            (str): matching infix term or None
+        """
+        state = 0
+        best = self.__bestL[0]
+        for ch in word:
+            while state and ch not in self.__gotoL[state]:
+                state = self.__failL[state]
+            state = self.__gotoL[state].get(ch, 0)
+            best = self.__getPreferred(best, self.__bestL[state])
+        return best
+
+    def __getPreferred(self, termA, termB):
+        """Return the preferred of two matching terms (longest first, then alphabetical)."""
+        if termA is None:
+            return termB
+        if termB is None:
+            return termA
+        return termA if (-len(termA), termA) <= (-len(termB), termB) else termB
+
+    def __buildAutomaton(self, termL):
+        """Compile an Aho-Corasick automaton over the input terms.
+
+        Args:
+            termL (list): terms
+
+        Returns:
+            tuple: (list) goto transitions for each state {char: state, ...}
+                   (list) failure transition for each state
+                   (list) preferred term matched on reaching each state (or None)
+        """
+        gotoL = [{}]
+        failL = [0]
+        bestL = [None]
+        for term in termL:
+            state = 0
+            for ch in term:
+                if ch not in gotoL[state]:
+                    gotoL.append({})
+                    failL.append(0)
+                    bestL.append(None)
+                    gotoL[state][ch] = len(gotoL) - 1
+                state = gotoL[state][ch]
+            bestL[state] = self.__getPreferred(bestL[state], term)
+        #
+        # breadth-first assignment of failure links and inherited matches
+        queue = deque(gotoL[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nextState in gotoL[state].items():
+                queue.append(nextState)
+                fState = failL[state]
+                while fState and ch not in gotoL[fState]:
+                    fState = failL[fState]
+                failL[nextState] = gotoL[fState][ch] if ch in gotoL[fState] else 0
+                bestL[nextState] = self.__getPreferred(bestL[nextState], bestL[failL[nextState]])
+        #
+        for state in range(1, len(bestL)):
+            bestL[state] = self.__getPreferred(bestL[state], bestL[0])
+        logger.debug("Infix automaton terms %d states %d", len(termL), len(gotoL))
+        return gotoL, failL, bestL
+
+
+class LtwaPhraseMatcher(object):
+    """Split titles at whitespace while keeping LTWA multi-word terms together.
+
+    Multi-word terms are bucketed by their first token, so only title tokens that
+    begin a multi-word term are compared with candidate terms.  The segmentation is
+    the same as a case-insensitive split on the alternation of all terms (each
+    bounded by a single whitespace character or the string ends) or whitespace runs:
+    a matched term segment includes its consumed boundary whitespace and the shortest
+    matching term is preferred.
+    """
+
+    def __init__(self, termList):
+        """Build the matcher.
+
+        Args:
+            termList (list): normalized (lower case) multi-word terms
+        """
+        self.__wsRegex = re.compile(r"\s+")
+        self.__firstTokenD = {}
+        for term in termList:
+            self.__firstTokenD.setdefault(term.split(" ")[0], []).append(term)
+        for termL in self.__firstTokenD.values():
+            termL.sort(key=lambda t: (len(t), t))
+
+    def split(self, text):
+        """Split the input text into words and multi-word terms.
+
+        Args:
+            text (str): input text
+
+        Returns:
+            (list): non-blank text segments
+        """
+        segL = []
+        tLen = len(text)
+        pos = ii = 0
+        while ii < tLen:
+            wsM = self.__wsRegex.match(text, ii)
+            if wsM:
+                jj = self.__matchTerm(text, ii + 1)
+            else:
+                jj = self.__matchTerm(text, ii) if ii == 0 else -1
+            if jj >= 0:
+                segL.append(text[pos:ii])
+                segL.append(text[ii:jj])
+                pos = ii = jj
+            elif wsM:
+                segL.append(text[pos:ii])
+                segL.append(wsM.group(0))
+                pos = ii = wsM.end()
+            else:
+                wsM = self.__wsRegex.search(text, ii)
+                ii = wsM.start() if wsM else tLen
+        segL.append(text[pos:])
+        return [seg for seg in segL if seg.strip()]
+
+    def __matchTerm(self, text, start):
+        """Return the end position (after any trailing boundary whitespace character) of the
+        shortest multi-word term beginning at the start position or -1.
+        """
+        tLen = len(text)
+        wsM = self.__wsRegex.search(text, start)
+        termL = self.__firstTokenD.get(text[start : wsM.start() if wsM else tLen].lower())
+        if termL:
+            for term in termL:
+                end = start + len(term)
+                if end <= tLen and text[start:end].lower() == term:
+                    if end == tLen:
+                        return end
+                    if self.__wsRegex.match(text, end):
+                        return end + 1
+        return -1
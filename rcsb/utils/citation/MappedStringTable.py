@@ -0,0 +1,323 @@
+##
+# File:    MappedStringTable.py
+# Date:    18-Oct-2026
+#
+#  Updates:
+#  18-Oct-2026  Add publication of string tables in shared memory (toSharedMemory() and sharedMemoryName=)
+#  18-Oct-2026  Add MappedStringTableView.toDict() bulk decoding of a table
+#  18-Oct-2026  Add per-table hash slots for constant time key lookups and named binary blobs (format MSTABLE2), remove toDict()
+##
+"""
+Compact read-only string tables stored in a binary layout that can be memory-mapped
+and shared between processes through the page cache.
+
+"""
+
+import logging
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+
+logger = logging.getLogger(__name__)
+
+
+class MappedStringTableView(Mapping):
+    """Read-only mapping view of a single string table (keys in sorted UTF-8 order).
+    Key lookups probe a hash slot array over the underlying buffer (no table data is copied).
+    """
+
+    def __init__(self, buf, count, keyOffsetPos, valOffsetPos, keyBlobPos, valBlobPos, slotPos, numSlots):
+        self.__buf = buf
+        self.__count = count
+        self.__keyBlobPos = keyBlobPos
+        self.__valBlobPos = valBlobPos
+        self.__keyOffsetV = MappedStringTable.getArrayView(buf, keyOffsetPos, count + 1, "Q")
+        self.__valOffsetV = MappedStringTable.getArrayView(buf, valOffsetPos, count + 1, "Q")
+        self.__slotV = MappedStringTable.getArrayView(buf, slotPos, numSlots, "I")
+        self.__slotMask = numSlots - 1
+
+    def __getKeyBytes(self, ii):
+        return bytes(self.__buf[self.__keyBlobPos + self.__keyOffsetV[ii] : self.__keyBlobPos + self.__keyOffsetV[ii + 1]])
+
+    def __getValue(self, ii):
+        return str(self.__buf[self.__valBlobPos + self.__valOffsetV[ii] : self.__valBlobPos + self.__valOffsetV[ii + 1]], "utf-8")
+
+    def __find(self, key):
+        if not isinstance(key, str) or not self.__count:
+            return -1
+        kB = key.encode("utf-8")
+        slot = zlib.crc32(kB) & self.__slotMask
+        while self.__slotV[slot]:
+            ii = self.__slotV[slot] - 1
+            if self.__getKeyBytes(ii) == kB:
+                return ii
+            slot = (slot + 1) & self.__slotMask
+        return -1
+
+    def __getitem__(self, key):
+        ii = self.__find(key)
+        if ii < 0:
+            raise KeyError(key)
+        return self.__getValue(ii)
+
+    def get(self, key, default=None):
+        ii = self.__find(key)
+        return self.__getValue(ii) if ii >= 0 else default
+
+    def __contains__(self, key):
+        return self.__find(key) >= 0
+
+    def __iter__(self):
+        for ii in range(self.__count):
+            yield self.__getKeyBytes(ii).decode("utf-8")
+
+    def items(self):
+        """Iterate over (key, value) pairs in key order (sequential scan without key lookups)."""
+        for ii in range(self.__count):
+            yield self.__getKeyBytes(ii).decode("utf-8"), self.__getValue(ii)
+
+    def __len__(self):
+        return self.__count
+
+    def release(self):
+        """Release the views of the underlying buffer held by this table view."""
+        for view in [self.__keyOffsetV, self.__valOffsetV, self.__slotV]:
+            if isinstance(view, memoryview):
+                view.release()
+
+
+class MappedStringTable(object):
+    """Collection of named string tables {tableName: {key: value, ...}, ...} and named binary
+    blobs in a compact binary layout.
+
+    Layout (little-endian):
+        magic (8 bytes), table count (uint32), blob count (uint32), then for each table a directory
+        entry - name length (uint16), name (UTF-8), entry count (uint64), and the positions (uint64)
+        of the key offset array, value offset array, key blob, value blob and hash slot array, and
+        the hash slot count (uint64), then for each blob a directory entry - name length (uint16),
+        name (UTF-8), position and length (uint64).  Keys are stored in sorted UTF-8 byte order.
+        The hash slot array (uint32, a power of 2 at most half occupied) holds entry index + 1 (0
+        for an empty slot) at the CRC-32 of the key bytes, with linear probing.
+    """
+
+    MAGIC = b"MSTABLE2"
+
+    def __init__(self, filePath=None, buffer=None, sharedMemoryName=None):
+        """Open string tables from a file (memory-mapped), a named shared memory block or an existing buffer.
+
+        Args:
+            filePath (str, optional): path to a binary string table file. Defaults to None.
+            buffer (obj, optional): object supporting the buffer protocol containing string tables. Defaults to None.
+            sharedMemoryName (str, optional): name of a shared memory block containing string tables (see toSharedMemory()). Defaults to None.
+        """
+        self.__mmap = None
+        self.__shm = None
+        self.__tableD = {}
+        self.__blobD = {}
+        if filePath:
+            with open(filePath, "rb") as ifh:
+                self.__mmap = mmap.mmap(ifh.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = self.__mmap
+        elif sharedMemoryName:
+            self.__shm = shared_memory.SharedMemory(name=sharedMemoryName)
+            buffer = self.__shm.buf
+        self.__buf = memoryview(buffer) if buffer is not None else None
+        if self.__buf is not None:
+            try:
+                self.__readDirectory()
+            except Exception:
+                self.close()
+                raise
+
+    def __readDirectory(self):
+        if bytes(self.__buf[:8]) != self.MAGIC:
+            raise ValueError("Unrecognized string table format")
+        numTables, numBlobs = struct.unpack_from("<2I", self.__buf, 8)
+        pos = 16
+        for ii in range(numTables + numBlobs):
+            (nameLen,) = struct.unpack_from("<H", self.__buf, pos)
+            pos += 2
+            name = bytes(self.__buf[pos : pos + nameLen]).decode("utf-8")
+            pos += nameLen
+            if ii < numTables:
+                count, keyOffsetPos, valOffsetPos, keyBlobPos, valBlobPos, slotPos, numSlots = struct.unpack_from("<7Q", self.__buf, pos)
+                pos += 56
+                self.__tableD[name] = MappedStringTableView(self.__buf, count, keyOffsetPos, valOffsetPos, keyBlobPos, valBlobPos, slotPos, numSlots)
+            else:
+                blobPos, blobLen = struct.unpack_from("<2Q", self.__buf, pos)
+                pos += 16
+                self.__blobD[name] = (blobPos, blobLen)
+
+    def getTableNames(self):
+        return list(self.__tableD.keys())
+
+    def getTable(self, name):
+        """Return a read-only mapping view of the named table or None."""
+        return self.__tableD.get(name, None)
+
+    def getBlobNames(self):
+        return list(self.__blobD.keys())
+
+    def getBlob(self, name):
+        """Return a read-only view (memoryview) of the named blob or None."""
+        if name not in self.__blobD:
+            return None
+        blobPos, blobLen = self.__blobD[name]
+        return self.__buf[blobPos : blobPos + blobLen]
+
+    def close(self):
+        """Release the underlying buffer (views obtained from this object become unusable).
+
+        A file map or shared memory block with views still held elsewhere (e.g. blob views) is closed
+        when those views are released.
+        """
+        for tV in self.__tableD.values():
+            tV.release()
+        self.__tableD = {}
+        self.__blobD = {}
+        if self.__buf is not None:
+            self.__buf.release()
+            self.__buf = None
+        try:
+            if self.__mmap is not None:
+                self.__mmap.close()
+            if self.__shm is not None:
+                self.__shm.close()
+        except BufferError:
+            logger.debug("String table views are still in use - the buffer is released with the views")
+        self.__mmap = None
+        self.__shm = None
+
+    def __del__(self):
+        # release the table views before the shared memory block is closed on collection
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def getArrayView(buf, pos, count, typeCode):
+        """Return an indexable view of the little-endian integer array ('I' or 'Q') at the input buffer position."""
+        view = buf[pos : pos + count * array(typeCode).itemsize].cast(typeCode)
+        if sys.byteorder != "little":
+            # byte-swapped copy on big-endian hosts
+            view = array(typeCode, view)
+            view.byteswap()
+        return view
+
+    @staticmethod
+    def __packArray(typeCode, valL):
+        aA = array(typeCode, valL)
+        if sys.byteorder != "little":
+            aA.byteswap()
+        return aA.tobytes()
+
+    @staticmethod
+    def __getHashSlots(keyL):
+        """Return the hash slot array (entry index + 1 at the CRC-32 of each key, linear probing) for the input keys (bytes)."""
+        numSlots = 2
+        while numSlots < 2 * len(keyL):
+            numSlots *= 2
+        slotA = array("I", bytes(4 * numSlots))
+        for ii, kB in enumerate(keyL):
+            slot = zlib.crc32(kB) & (numSlots - 1)
+            while slotA[slot]:
+                slot = (slot + 1) & (numSlots - 1)
+            slotA[slot] = ii + 1
+        return slotA
+
+    @staticmethod
+    def toBytes(tableD, blobD=None):
+        """Serialize string tables and binary blobs.
+
+        Args:
+            tableD (dict): {tableName: {key (str): value (str), ...}, ...}
+            blobD (dict, optional): {blobName: data (bytes-like), ...}. Defaults to None.
+
+        Returns:
+            (bytes): serialized string tables and blobs
+        """
+        blobD = blobD if blobD else {}
+        dirSize = 16 + sum([2 + len(name.encode("utf-8")) + 56 for name in tableD]) + sum([2 + len(name.encode("utf-8")) + 16 for name in blobD])
+        dirL = []
+        sectionL = []
+        pos = dirSize
+        for name, tD in tableD.items():
+            itemL = sorted([(str(ky).encode("utf-8"), str(val).encode("utf-8")) for ky, val in tD.items()])
+            keyOffsetL = [0]
+            valOffsetL = [0]
+            for kB, vB in itemL:
+                keyOffsetL.append(keyOffsetL[-1] + len(kB))
+                valOffsetL.append(valOffsetL[-1] + len(vB))
+            slotA = MappedStringTable.__getHashSlots([kB for kB, _ in itemL])
+            keyOffsetB = MappedStringTable.__packArray("Q", keyOffsetL)
+            valOffsetB = MappedStringTable.__packArray("Q", valOffsetL)
+            slotB = MappedStringTable.__packArray("I", slotA)
+            keyBlobB = b"".join([kB for kB, _ in itemL])
+            valBlobB = b"".join([vB for _, vB in itemL])
+            keyOffsetPos = pos
+            valOffsetPos = keyOffsetPos + len(keyOffsetB)
+            slotPos = valOffsetPos + len(valOffsetB)
+            keyBlobPos = slotPos + len(slotB)
+            valBlobPos = keyBlobPos + len(keyBlobB)
+            pos = valBlobPos + len(valBlobB)
+            nameB = name.encode("utf-8")
+            dirL.append(struct.pack("<H", len(nameB)) + nameB + struct.pack("<7Q", len(itemL), keyOffsetPos, valOffsetPos, keyBlobPos, valBlobPos, slotPos, len(slotA)))
+            sectionL.extend([keyOffsetB, valOffsetB, slotB, keyBlobB, valBlobB])
+        for name, dataB in blobD.items():
+            nameB = name.encode("utf-8")
+            dirL.append(struct.pack("<H", len(nameB)) + nameB + struct.pack("<2Q", pos, len(dataB)))
+            sectionL.append(bytes(dataB))
+            pos += len(dataB)
+        return MappedStringTable.MAGIC + struct.pack("<2I", len(tableD), len(blobD)) + b"".join(dirL) + b"".join(sectionL)
+
+    @staticmethod
+    def toSharedMemory(tableD, name=None, blobD=None):
+        """Serialize string tables and binary blobs to a new shared memory block.
+
+        Other processes open the tables with MappedStringTable(sharedMemoryName=shm.name).  The caller owns
+        the block and should call close() and unlink() on it when the tables are no longer required.
+
+        Args:
+            tableD (dict): {tableName: {key (str): value (str), ...}, ...}
+            name (str, optional): shared memory block name (default: a generated unique name). Defaults to None.
+            blobD (dict, optional): {blobName: data (bytes-like), ...}. Defaults to None.
+
+        Returns:
+            (obj): multiprocessing.shared_memory.SharedMemory block containing the string tables
+        """
+        dataB = MappedStringTable.toBytes(tableD, blobD=blobD)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(dataB))
+        shm.buf[: len(dataB)] = dataB
+        return shm
+
+    @staticmethod
+    def write(filePath, tableD, blobD=None):
+        """Serialize string tables and binary blobs to a file (written to a temporary file and renamed into place).
+
+        Args:
+            filePath (str): output file path
+            tableD (dict): {tableName: {key (str): value (str), ...}, ...}
+            blobD (dict, optional): {blobName: data (bytes-like), ...}. Defaults to None.
+
+        Returns:
+            (bool): True for success or False otherwise
+        """
+        tmpPath = filePath + ".%d.tmp" % os.getpid()
+        try:
+            with open(tmpPath, "wb") as ofh:
+                ofh.write(MappedStringTable.toBytes(tableD, blobD=blobD))
+            os.replace(tmpPath, filePath)
+            return True
+        except Exception as e:
+            logger.exception("Failing writing string tables to %s with %s", filePath, str(e))
+            try:
+                os.remove(tmpPath)
+            except Exception:
+                pass
+        return False
@@ -0,0 +1,125 @@
+##
+# File:    SourceRefreshUtil.py
+# Date:    18-Oct-2026
+#
+#  Updates:
+#  18-Oct-2026  Write the source state file with CacheFileUtil.exportAtomic()
+##
+"""
+Conditional fetch of reference source files tracking HTTP validators and content hashes.
+
+"""
+
+import datetime
+import logging
+import os
+import shutil
+import urllib.error
+import urllib.request
+
+from rcsb.utils.citation.CacheFileUtil import CacheFileUtil
+from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+
+class SourceRefreshUtil(object):
+    """Fetch a reference source file only if it has changed since the last recorded fetch.
+
+    The state of each fetched source (ETag, Last-Modified and the sha256 hash of its content) is
+    stored in a JSON state file.  HTTP(S) sources are requested conditionally (If-None-Match and
+    If-Modified-Since) and other sources (local, file:// and FTP) are compared by content hash.
+    """
+
+    def __init__(self, statePath, timeout=60):
+        """Conditional source fetch utility.
+
+        Args:
+            statePath (str): JSON state file path
+            timeout (int, optional): HTTP request timeout (seconds). Defaults to 60.
+        """
+        self.__statePath = statePath
+        self.__timeout = timeout
+        self.__mU = MarshalUtil()
+        self.__fU = FileUtil()
+        self.__stateD = self.__mU.doImport(statePath, fmt="json") if self.__mU.exists(statePath) else {}
+        self.__stateD = self.__stateD if isinstance(self.__stateD, dict) else {}
+        self.__pendingD = {}
+
+    def getState(self, url):
+        """Return the recorded state for the input source URL {"etag":, "last_modified":, "sha256":, "timestamp":} or None."""
+        return self.__stateD.get(url)
+
+    def fetch(self, url, filePath):
+        """Fetch the source URL to the input file path if the source has changed.
+
+        The new state is held until saveState() is called (i.e., after data derived from the source has been stored).
+
+        Args:
+            url (str): source locator
+            filePath (str): local file path for the source data (the previously fetched copy is retained if unchanged)
+
+        Returns:
+            (bool): True if the source has changed, False if it is unchanged, or None if the fetch failed
+        """
+        tmpPath = filePath + ".%d.tmp" % os.getpid()
+        try:
+            stateD = self.__stateD.get(url, {}) if os.access(filePath, os.R_OK) else {}
+            headerD = {}
+            if self.__fU.getScheme(url) in ["http", "https"]:
+                headerD = self.__fetchHttp(url, tmpPath, stateD)
+                if headerD is None:
+                    logger.info("Source %s is unchanged (not modified)", url)
+                    return False
+            elif not self.__fU.get(url, tmpPath):
+                logger.error("Failing fetching source %s", url)
+                return None
+            sha256 = self.__fU.hash(tmpPath, hashType="sha256")
+            self.__pendingD[url] = {
+                "etag": headerD.get("ETag"),
+                "last_modified": headerD.get("Last-Modified"),
+                "sha256": sha256,
+                "timestamp": datetime.datetime.now().isoformat(),
+            }
+            if stateD.get("sha256") == sha256:
+                logger.info("Source %s is unchanged (content hash)", url)
+                os.remove(tmpPath)
+                return False
+            os.replace(tmpPath, filePath)
+            return True
+        except Exception as e:
+            logger.exception("Failing fetching source %s with %s", url, str(e))
+        try:
+            os.remove(tmpPath)
+        except Exception:
+            pass
+        return None
+
+    def __fetchHttp(self, url, filePath, stateD):
+        """Conditional HTTP GET - return the response headers or None if the source is not modified."""
+        req = urllib.request.Request(url)
+        if stateD.get("etag"):
+            req.add_header("If-None-Match", stateD["etag"])
+        if stateD.get("last_modified"):
+            req.add_header("If-Modified-Since", stateD["last_modified"])
+        try:
+            with urllib.request.urlopen(req, timeout=self.__timeout) as resp, open(filePath, "wb") as ofh:
+                shutil.copyfileobj(resp, ofh)
+                return dict(resp.headers.items())
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
+
+    def saveState(self):
+        """Record the state of sources fetched since the last save.
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        if not self.__pendingD:
+            return True
+        self.__stateD.update(self.__pendingD)
+        self.__pendingD = {}
+        return CacheFileUtil.exportAtomic(self.__statePath, self.__stateD, fmt="json", indent=3)
@@ -14,11 +14,21 @@ Test cases for citation reference information provider functions.
 
 """
 
+import functools
+import http.server
 import logging
+import multiprocessing
 import os
+import shutil
+import sqlite3
+import threading
+import time
 import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from rcsb.utils.citation.CitationReferenceProvider import CitationReferenceProvider
+from rcsb.utils.citation.JournalIssnStore import JournalIssnStore
+from rcsb.utils.io.MarshalUtil import MarshalUtil
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
@@ -27,10 +37,70 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
 
+class DelayedRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Stand-in reference data server adding a fixed delay to each response."""
+
+    delaySeconds = 1.0
+
+    def do_GET(self):
+        time.sleep(self.delaySeconds)
+        super(DelayedRequestHandler, self).do_GET()
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class CountingRequestHandler(DelayedRequestHandler):
+    """Stand-in reference data server recording the requested paths (responses are delayed to overlap concurrent rebuilds)."""
+
+    delaySeconds = 3.0
+    requestPathL = []
+
+    def do_GET(self):
+        self.requestPathL.append(self.path)
+        super(CountingRequestHandler, self).do_GET()
+
+
+class ConcurrentRequestHandler(DelayedRequestHandler):
+    """Stand-in reference data server holding each response until the requests sharing the barrier are all in progress."""
+
+    barrier = None
+
+    def do_GET(self):
+        try:
+            self.barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        super(ConcurrentRequestHandler, self).do_GET()
+
+
+def _getRebuiltJournalData(kwargs, issnList):
+    """Return journal data from a provider rebuilding its cache (run in a worker process)."""
+    crP = CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+    return crP.getJournalRecords(issnList)
+
+
+def _getSharedJournalData(sharedTables, cachePath, issnList):
+    """Return journal data from a provider attached to shared journal indices (run in a worker process)."""
+    crP = CitationReferenceProvider(cachePath=cachePath, urlTargetMedline="/no/such/J_Medline.txt", urlTargetCrossRef="/no/such/titleFile.csv", sharedTables=sharedTables)
+    rD = {
+        "titles": [crP.getMedlineJournalTitle(issn) for issn in issnList],
+        "crossref_titles": [crP.getCrossRefJournalTitle(issn) for issn in issnList],
+        "iso_abbrevs": crP.getMedlineJournalIsoAbbreviations(),
+        "issns_by_title": crP.getMedlineIssnsByTitle("Journal of biological chemistry"),
+        "cache_files": sorted(os.listdir(cachePath)) if os.path.isdir(cachePath) else [],
+    }
+    crP.close()
+    return rD
+
+
 class CitationReferenceProviderTests(unittest.TestCase):
     def setUp(self):
         self.__export = False
         self.__cachePath = os.path.join(HERE, "test-output", "CACHE")
+        self.__sampleCachePath = os.path.join(HERE, "test-output", "CACHE-SAMPLE")
+        self.__medlineSamplePath = os.path.join(HERE, "test-data", "J_Medline_sample.txt")
+        self.__crossRefSamplePath = os.path.join(HERE, "test-data", "crossref_titleFile_sample.csv")
 
     def tearDown(self):
         pass
@@ -54,15 +124,431 @@ class CitationReferenceProviderTests(unittest.TestCase):
             self.assertEqual(crP.getMedlineJournalIsoAbbreviation(tD["issn_online"]), tD["iso_abbrev"])
             self.assertEqual(crP.getMedlineJournalAbbreviation(tD["issn_online"]), tD["medline_abbrev"])
             self.assertEqual(crP.getMedlineJournalTitle(tD["issn_online"]), tD["journal_title"])
+            isoD = crP.getMedlineJournalIsoAbbreviations()
+            self.assertGreater(len(isoD), 1000)
+            self.assertEqual(isoD[tD["journal_title"]], tD["iso_abbrev"])
+            #
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSharedJournalTitles(self):
+        """Test ISO abbreviations of a journal title shared by Medline journals are independent of the record order."""
+        try:
+            recL = [
+                ("Pathology", "Pathology", "0031-3025"),
+                ("Pathology", "Pathology (Phila)", "1234-5679"),
+                ("Journal of molecular biology", "J Mol Biol", "0022-2836"),
+            ]
+            for ii, orderL in enumerate([recL, list(reversed(recL))]):
+                medlinePath = os.path.join(self.__sampleCachePath, "J_Medline_shared_%d.txt" % ii)
+                os.makedirs(self.__sampleCachePath, exist_ok=True)
+                with open(medlinePath, "w", encoding="utf-8") as ofh:
+                    for title, isoAbbrev, issn in orderL:
+                        ofh.write("-" * 56 + "\nJournalTitle: %s\nMedAbbr: %s\nISSN (Print): %s\nIsoAbbr: %s\n" % (title, isoAbbrev, issn, isoAbbrev))
+                    ofh.write("-" * 56 + "\n")
+                crP = CitationReferenceProvider(
+                    cachePath=os.path.join(self.__sampleCachePath, "shared-titles-%d" % ii), urlTargetMedline=medlinePath, urlTargetCrossRef=self.__crossRefSamplePath, useCache=False
+                )
+                self.assertEqual(crP.getMedlineJournalIsoAbbreviations(), {"Pathology": "Pathology", "Journal of molecular biology": "J Mol Biol"})
+                self.assertEqual(crP.getMedlineJournalIsoAbbreviation("1234-5679"), "Pathology (Phila)")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSqliteBackend(self):
+        """Test SQLite journal store lookups against the in-memory journal indices (local reference data)."""
+        try:
+            kwargs = {"cachePath": self.__sampleCachePath, "urlTargetMedline": self.__medlineSamplePath, "urlTargetCrossRef": self.__crossRefSamplePath}
+            storePath = os.path.join(self.__sampleCachePath, "citation-reference", "citation-reference.sqlite")
+            if os.access(storePath, os.R_OK):
+                os.remove(storePath)
+            memP = CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+            # build the store from the cached reference data
+            sqlP = CitationReferenceProvider(useCache=True, storageBackend="sqlite", lookupCacheSize=16, sources="medline", **kwargs)
+            self.assertTrue(os.access(storePath, os.R_OK))
+            issnL = ["0021-9258", "1083-351X", "2041-1723", "0022-2836", "0000-0000", "", None]
+            for issn in issnL:
+                self.assertEqual(sqlP.getMedlineJournalIsoAbbreviation(issn), memP.getMedlineJournalIsoAbbreviation(issn))
+                self.assertEqual(sqlP.getMedlineJournalAbbreviation(issn), memP.getMedlineJournalAbbreviation(issn))
+                self.assertEqual(sqlP.getMedlineJournalTitle(issn), memP.getMedlineJournalTitle(issn))
+            for issn in ["219258", "1083351X", "20411723", "0021-9258", ""]:
+                self.assertEqual(sqlP.getCrossRefJournalTitle(issn), memP.getCrossRefJournalTitle(issn))
+            self.assertEqual(sqlP.getMedlineJournalIsoAbbreviations(), memP.getMedlineJournalIsoAbbreviations())
+            self.assertEqual(sqlP.getMedlineJournalIsoAbbreviation("0021-9258"), "J Biol Chem")
+            self.assertEqual(sqlP.getCrossRefJournalTitle("219258"), "The Journal of biological chemistry")
+            self.assertEqual(sqlP.getCrossRefJournalTitle("0021-9258"), "The Journal of biological chemistry")
+            # rebuild the store from source data
+            sqlP = CitationReferenceProvider(useCache=False, storageBackend="sqlite", **kwargs)
+            self.assertEqual(sqlP.getMedlineJournalIsoAbbreviations(), memP.getMedlineJournalIsoAbbreviations())
+            self.assertEqual(sqlP.getMedlineJournalTitle("2041-1723"), "Nature communications")
+            # a memory backend rebuild leaves the (open) store in place and the stale store is rebuilt on next use
+            storeIno = os.stat(storePath).st_ino
+            memP = CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+            self.assertEqual(os.stat(storePath).st_ino, storeIno)
+            self.assertEqual(sqlP.getMedlineJournalTitle("2041-1723"), "Nature communications")
+            sqlP = CitationReferenceProvider(useCache=True, storageBackend="sqlite", **kwargs)
+            self.assertEqual(sqlP.getMedlineJournalIsoAbbreviations(), memP.getMedlineJournalIsoAbbreviations())
+            self.assertNotEqual(os.stat(storePath).st_ino, storeIno)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testLazySourceLoading(self):
+        """Test lazy per-source loading and the sources= preload option (local reference data)."""
+        try:
+            kwargs = {"cachePath": self.__sampleCachePath, "urlTargetMedline": self.__medlineSamplePath, "urlTargetCrossRef": self.__crossRefSamplePath}
+            dirPath = os.path.join(self.__sampleCachePath, "citation-reference")
+            mlPath = os.path.join(dirPath, "medline-journals.json")
+            crPath = os.path.join(dirPath, "crossref-journals.json")
+            if os.access(crPath, os.R_OK):
+                os.remove(crPath)
+            crP = CitationReferenceProvider(useCache=False, sources=["medline"], **kwargs)
+            self.assertTrue(os.access(mlPath, os.R_OK))
+            self.assertFalse(os.access(crPath, os.R_OK))
+            self.assertEqual(crP.getMedlineJournalIsoAbbreviation("0021-9258"), "J Biol Chem")
+            self.assertFalse(os.access(crPath, os.R_OK))
+            self.assertEqual(crP.getCrossRefJournalTitle("219258"), "The Journal of biological chemistry")
+            self.assertTrue(os.access(crPath, os.R_OK))
+            # empty CrossRef ISSNs are not indexed
+            self.assertIsNone(crP.getCrossRefJournalTitle(""))
+            # concurrent first access
+            crP = CitationReferenceProvider(useCache=True, **kwargs)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                rL = list(executor.map(crP.getMedlineJournalTitle, ["2041-1723"] * 32))
+            self.assertEqual(rL, ["Nature communications"] * 32)
+            with self.assertRaises(ValueError):
+                CitationReferenceProvider(useCache=True, sources=["pubmed"], **kwargs)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testConcurrentRefresh(self):
+        """Test concurrent refresh of reference sources served by a delayed stand-in HTTP server."""
+        httpd = None
+        try:
+            # the Medline and CrossRef responses are held until both requests are in progress (the barrier breaks if they are sequential)
+            ConcurrentRequestHandler.barrier = threading.Barrier(2, timeout=10.0)
+            handler = functools.partial(ConcurrentRequestHandler, directory=os.path.join(HERE, "test-data"))
+            httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            threading.Thread(target=httpd.serve_forever, daemon=True).start()
+            baseUrl = "http://127.0.0.1:%d" % httpd.server_address[1]
+            kwargs = {
+                "cachePath": self.__sampleCachePath,
+                "urlTargetMedline": baseUrl + "/J_Medline_sample.txt",
+                "urlTargetCrossRef": baseUrl + "/crossref_titleFile_sample.csv",
+            }
+            startTime = time.time()
+            crP = CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+            elapsed = time.time() - startTime
+            logger.info("Refreshed reference sources in %.2f seconds (per source delay %.2f)", elapsed, ConcurrentRequestHandler.delaySeconds)
+            self.assertFalse(ConcurrentRequestHandler.barrier.broken)
+            self.assertEqual(crP.getMedlineJournalIsoAbbreviation("0021-9258"), "J Biol Chem")
+            self.assertEqual(crP.getCrossRefJournalTitle("219258"), "The Journal of biological chemistry")
+            # file:// locators
+            kwargs.update({"urlTargetMedline": "file://" + self.__medlineSamplePath, "urlTargetCrossRef": "file://" + self.__crossRefSamplePath})
+            crP = CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+            self.assertEqual(crP.getMedlineJournalTitle("2041-1723"), "Nature communications")
+            self.assertEqual(crP.getCrossRefJournalTitle("20411723"), "Nature communications")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+        finally:
+            if httpd:
+                httpd.shutdown()
+                httpd.server_close()
+
+    def testConcurrentCacheRebuild(self):
+        """Test cold cache rebuilds by concurrent worker processes fetching each reference source once."""
+        httpd = None
+        try:
+            handler = functools.partial(CountingRequestHandler, directory=os.path.join(HERE, "test-data"))
+            httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            threading.Thread(target=httpd.serve_forever, daemon=True).start()
+            baseUrl = "http://127.0.0.1:%d" % httpd.server_address[1]
+            issnL = ["0021-9258", "219258", "2041-1723", "0021-9259"]
+            numWorkers = 4
+            for storageBackend in ["memory", "sqlite"]:
+                cachePath = os.path.join(self.__sampleCachePath, "concurrent-%s" % storageBackend)
+                shutil.rmtree(cachePath, ignore_errors=True)
+                del CountingRequestHandler.requestPathL[:]
+                kwargs = {
+                    "cachePath": cachePath,
+                    "urlTargetMedline": baseUrl + "/J_Medline_sample.txt",
+                    "urlTargetCrossRef": baseUrl + "/crossref_titleFile_sample.csv",
+                    "storageBackend": storageBackend,
+                }
+                with ProcessPoolExecutor(max_workers=numWorkers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                    rL = list(executor.map(_getRebuiltJournalData, [kwargs] * numWorkers, [issnL] * numWorkers))
+                logger.info("Backend %s requests %r", storageBackend, CountingRequestHandler.requestPathL)
+                self.assertEqual(sorted(CountingRequestHandler.requestPathL), ["/J_Medline_sample.txt", "/crossref_titleFile_sample.csv"])
+                self.assertEqual(sorted(rL[0]), ["0021-9258", "2041-1723"])
+                self.assertEqual(rL, [rL[0]] * numWorkers)
+                dirPath = os.path.join(cachePath, "citation-reference")
+                self.assertEqual([fn for fn in os.listdir(dirPath) if fn.endswith(".tmp")], [])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+        finally:
+            if httpd:
+                httpd.shutdown()
+                httpd.server_close()
+
+    def testConditionalRefresh(self):
+        """Test conditional refresh skips unchanged sources and applies journal changes to the SQLite store in place."""
+        httpd = None
+        try:
+            sourcePath = os.path.join(HERE, "test-output", "J_Medline_sample_copy.txt")
+            with open(self.__medlineSamplePath, "r", encoding="utf-8") as ifh:
+                medlineText = ifh.read()
+            with open(sourcePath, "w", encoding="utf-8") as ofh:
+                ofh.write(medlineText)
+            kwargs = {"cachePath": self.__sampleCachePath, "urlTargetMedline": sourcePath, "urlTargetCrossRef": self.__crossRefSamplePath, "storageBackend": "sqlite"}
+            dirPath = os.path.join(self.__sampleCachePath, "citation-reference")
+            storePath = os.path.join(dirPath, "citation-reference.sqlite")
+            mlPath = os.path.join(dirPath, "medline-journals.json")
+            #
+            crP = CitationReferenceProvider(useCache=False, conditionalRefresh=True, sources="medline", **kwargs)
+            self.assertEqual(crP.getMedlineJournalTitle("2041-1723"), "Nature communications")
+            self.assertTrue(os.access(os.path.join(dirPath, "medline-source-state.json"), os.R_OK))
+            mTime = os.stat(mlPath).st_mtime_ns
+            storeIno = os.stat(storePath).st_ino
+            # unchanged sources are not parsed again
+            crP = CitationReferenceProvider(useCache=False, conditionalRefresh=True, sources="medline", **kwargs)
+            self.assertEqual(os.stat(mlPath).st_mtime_ns, mTime)
+            self.assertEqual(crP.getMedlineJournalTitle("2041-1723"), "Nature communications")
+            # changed and removed journals are applied to the existing store
+            with open(sourcePath, "w", encoding="utf-8") as ofh:
+                medlineText = medlineText.replace("JournalTitle: Nature communications", "JournalTitle: Nature communications (revised)")
+                ofh.write(medlineText.replace("ISSN (Print): 0021-9258", "ISSN (Print):"))
+            crP = CitationReferenceProvider(useCache=False, conditionalRefresh=True, sources="medline", **kwargs)
+            self.assertNotEqual(os.stat(mlPath).st_mtime_ns, mTime)
+            self.assertEqual(os.stat(storePath).st_ino, storeIno)
+            self.assertEqual(crP.getMedlineJournalTitle("2041-1723"), "Nature communications (revised)")
+            self.assertIsNone(crP.getMedlineJournalTitle("0021-9258"))
+            self.assertEqual(crP.getMedlineJournalTitle("1083-351X"), "The Journal of biological chemistry")
+            self.assertEqual(crP.getCrossRefJournalTitle("219258"), "The Journal of biological chemistry")
+            os.remove(sourcePath)
             #
+            # HTTP validators (Last-Modified)
+            handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=os.path.join(HERE, "test-data"))
+            httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            threading.Thread(target=httpd.serve_forever, daemon=True).start()
+            kwargs["urlTargetMedline"] = "http://127.0.0.1:%d/J_Medline_sample.txt" % httpd.server_address[1]
+            for _ in range(2):
+                crP = CitationReferenceProvider(useCache=False, conditionalRefresh=True, sources="medline", **kwargs)
+                self.assertEqual(crP.getMedlineJournalTitle("2041-1723"), "Nature communications")
+                self.assertEqual(crP.getMedlineJournalTitle("0021-9258"), "The Journal of biological chemistry")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+        finally:
+            if httpd:
+                httpd.shutdown()
+                httpd.server_close()
+
+    def testBulkLookup(self):
+        """Test bulk merged journal record lookup against the single ISSN accessors (local reference data)."""
+        try:
+            kwargs = {"cachePath": self.__sampleCachePath, "urlTargetMedline": self.__medlineSamplePath, "urlTargetCrossRef": self.__crossRefSamplePath}
+            issnL = ["0021-9258", "1083-351X", "2041-1723", "219258", "20411723", "0000-0000", "", None, "0021-9258"]
+            CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+            for storageBackend in ["memory", "sqlite"]:
+                crP = CitationReferenceProvider(useCache=True, storageBackend=storageBackend, **kwargs)
+                rD = crP.getJournalRecords(issnL)
+                self.assertEqual(sorted(rD.keys()), ["0021-9258", "1083-351X", "2041-1723"])
+                self.assertEqual(rD["0021-9258"]["iso_abbrev"], "J Biol Chem")
+                self.assertEqual(rD["0021-9258"]["crossref_doi"], "10.5555/sample.0")
+                for issn in issnL:
+                    tD = rD.get(CitationReferenceProvider.normalizeIssn(issn), {})
+                    self.assertEqual(tD.get("iso_abbrev"), crP.getMedlineJournalIsoAbbreviation(issn))
+                    self.assertEqual(tD.get("medline_abbrev"), crP.getMedlineJournalAbbreviation(issn))
+                    self.assertEqual(tD.get("journal_title"), crP.getMedlineJournalTitle(issn))
+                    self.assertEqual(tD.get("crossref_journal_title"), crP.getCrossRefJournalTitle(issn))
+                # field projection
+                rD = crP.getJournalRecords(iter(issnL), fields=["iso_abbrev", "crossref_journal_title"])
+                self.assertEqual(rD["1083-351X"], {"iso_abbrev": "J Biol Chem", "crossref_journal_title": "The Journal of biological chemistry"})
+                self.assertEqual(rD["2041-1723"], {"iso_abbrev": "Nat Commun", "crossref_journal_title": "Nature communications"})
+                self.assertEqual(crP.getJournalRecords(["20411723"], fields=["crossref_doi"]), {"2041-1723": {"crossref_doi": "10.5555/sample.13"}})
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testReverseNameLookup(self):
+        """Test ISSN lookup by normalized journal title and abbreviation (local reference data)."""
+        try:
+            kwargs = {"cachePath": self.__sampleCachePath, "urlTargetMedline": self.__medlineSamplePath, "urlTargetCrossRef": self.__crossRefSamplePath}
+            CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+            for storageBackend in ["memory", "sqlite"]:
+                crP = CitationReferenceProvider(useCache=True, storageBackend=storageBackend, **kwargs)
+                self.assertEqual(crP.getMedlineIssnsByTitle("The Journal of biological chemistry"), ["0021-9258", "1083-351X"])
+                self.assertEqual(crP.getMedlineIssnsByTitle("JOURNAL OF BIOLOGICAL CHEMISTRY"), ["0021-9258", "1083-351X"])
+                self.assertEqual(crP.getMedlineIssnsByTitle("Acta Crystallographica Section D: Biological Crystallography"), ["0907-4449", "1399-0047"])
+                self.assertEqual(crP.getMedlineIssnsByTitle("Journal of Molecular Graphics and Modelling"), ["1093-3263", "1873-4243"])
+                self.assertEqual(crP.getMedlineIssnsByTitle("Nature Communicátions"), ["2041-1723"])
+                self.assertEqual(crP.getMedlineIssnsByAbbreviation("J Biol Chem"), ["0021-9258", "1083-351X"])
+                self.assertEqual(crP.getMedlineIssnsByIsoAbbreviation("J. Biol. Chem."), ["0021-9258", "1083-351X"])
+                self.assertEqual(crP.getMedlineIssnsByIsoAbbreviation("Nat. Commun."), ["2041-1723"])
+                self.assertEqual(crP.getCrossRefIssnsByTitle("journal of biological chemistry"), ["0021-9258", "1083-351X"])
+                for name in ["Unknown journal", "", None]:
+                    self.assertEqual(crP.getMedlineIssnsByTitle(name), [])
+            self.assertEqual(CitationReferenceProvider.getJournalNameKey("The Journal of Physical Chemistry. B"), "journal of physical chemistry b")
+            self.assertEqual(CitationReferenceProvider.getJournalNameKey("Zeitschrift für Naturforschung"), "zeitschrift fur naturforschung")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testFindJournalCandidates(self):
+        """Test approximate ISSN lookup by misspelled and truncated journal titles (local reference data)."""
+        try:
+            kwargs = {"cachePath": self.__sampleCachePath, "urlTargetMedline": self.__medlineSamplePath, "urlTargetCrossRef": self.__crossRefSamplePath}
+            CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+            for storageBackend in ["memory", "sqlite"]:
+                crP = CitationReferenceProvider(useCache=True, storageBackend=storageBackend, **kwargs)
+                rL = crP.findJournalCandidates("The Journal of biological chemistry")
+                self.assertEqual(rL[:2], [("0021-9258", 1.0), ("1083-351X", 1.0)])
+                for title in ["Jurnal of biologcal chemistry", "Journal of biological chem", "ACTA CRYSTALLOGRAPHICA SECTON D"]:
+                    issnL = [issn for issn, _ in crP.findJournalCandidates(title, k=5)]
+                    logger.debug("Title %r candidates %r", title, issnL)
+                    self.assertLessEqual(len(issnL), 5)
+                    self.assertTrue(set(issnL) & {"0021-9258", "0907-4449"})
+                rL = crP.findJournalCandidates("Nature comunications", k=2)
+                self.assertEqual(rL[0][0], "2041-1723")
+                self.assertLess(rL[0][1], 1.0)
+                for title in ["", None, "zz"]:
+                    self.assertEqual(crP.findJournalCandidates(title), [])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testNormalizeIssn(self):
+        """Test canonical ISSN normalization and check digit validation (local reference data)."""
+        try:
+            for issn in ["0021-9258", "00219258", "219258", " 0021-9258 "]:
+                self.assertEqual(CitationReferenceProvider.normalizeIssn(issn), "0021-9258")
+            for issn in ["1083-351X", "1083-351x", "1083351X"]:
+                self.assertEqual(CitationReferenceProvider.normalizeIssn(issn), "1083-351X")
+            for issn in ["0021-9259", "1083-3510", "0000-0000", "0021 9258", "0021-92580", "0021_9258", "X", "", "----", "١٢٣٤-٥٦٧٨", None, 219258]:
+                self.assertIsNone(CitationReferenceProvider.normalizeIssn(issn))
+            kwargs = {"cachePath": self.__sampleCachePath, "urlTargetMedline": self.__medlineSamplePath, "urlTargetCrossRef": self.__crossRefSamplePath}
+            crP = CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+            for issn in ["0021-9258", "00219258", "219258", "0021-9258\n"]:
+                self.assertEqual(crP.getMedlineJournalIsoAbbreviation(issn), "J Biol Chem")
+                self.assertEqual(crP.getCrossRefJournalTitle(issn), "The Journal of biological chemistry")
+            self.assertIsNone(crP.getMedlineJournalTitle("0021-9259"))
+            self.assertEqual(
+                crP.getJournalRecords(["2041-1723", "20411723"], fields=["issn_online", "crossref_issn_online"]),
+                {"2041-1723": {"issn_online": "2041-1723", "crossref_issn_online": "2041-1723"}},
+            )
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testLegacyCache(self):
+        """Test journal caches and SQLite stores written before ISSNs were held in canonical form (local reference data)."""
+        try:
+            kwargs = {"cachePath": self.__sampleCachePath, "urlTargetMedline": self.__medlineSamplePath, "urlTargetCrossRef": self.__crossRefSamplePath}
+            CitationReferenceProvider(useCache=False, sources=["medline", "crossref"], **kwargs)
+            dirPath = os.path.join(self.__sampleCachePath, "citation-reference")
+            storePath = os.path.join(dirPath, "citation-reference.sqlite")
+            mU = MarshalUtil()
+            # CrossRef ISSNs were stored as in the title list ('219258') and Medline ISSNs as in J_Medline.txt
+            legacyD = {}
+            for source, toLegacy in [("crossref", lambda issn: issn.replace("-", "").lstrip("0")), ("medline", lambda issn: issn.lower())]:
+                namePath = os.path.join(dirPath, "%s-journals.json" % source)
+                issnD = {}
+                for tD in mU.doImport(namePath, fmt="json").values():
+                    tD = {fN: toLegacy(val) if fN in ["issn_print", "issn_online"] else val for fN, val in tD.items()}
+                    for fN in ["issn_print", "issn_online"]:
+                        if fN in tD:
+                            issnD[tD[fN]] = tD
+                mU.doExport(namePath, issnD, fmt="json")
+                legacyD[source] = (CitationReferenceProvider.MEDLINE_FIELDS if source == "medline" else CitationReferenceProvider.CROSSREF_FIELDS, issnD)
+            self.assertIn("219258", legacyD["crossref"][1])
+            self.assertIn("1083-351x", legacyD["medline"][1])
+            self.assertTrue(JournalIssnStore.write(storePath, legacyD))
+            conn = sqlite3.connect(storePath)
+            conn.execute("PRAGMA user_version = 0")
+            conn.close()
+            self.assertEqual(JournalIssnStore.getFormatVersion(storePath), 0)
+            for storageBackend in ["memory", "sqlite"]:
+                crP = CitationReferenceProvider(useCache=True, storageBackend=storageBackend, **kwargs)
+                for issn in ["219258", "0021-9258", "1083-351x", "1083-351X"]:
+                    self.assertEqual(crP.getCrossRefJournalTitle(issn), "The Journal of biological chemistry")
+                    self.assertEqual(crP.getMedlineJournalIsoAbbreviation(issn), "J Biol Chem")
+                self.assertEqual(crP.getMedlineIssnsByTitle("Journal of biological chemistry"), ["0021-9258", "1083-351X"])
+                self.assertEqual(
+                    crP.getJournalRecords(["1083351X"], fields=["issn_online", "crossref_issn_online"]), {"1083-351X": {"issn_online": "1083-351X", "crossref_issn_online": "1083-351X"}}
+                )
+            self.assertEqual(JournalIssnStore.getFormatVersion(storePath), JournalIssnStore.FORMAT_VERSION)
+            # a cache with only hyphenated upper case ISSNs one of which has an invalid check digit
+            namePath = os.path.join(dirPath, "medline-journals.json")
+            CitationReferenceProvider(useCache=False, sources=["medline"], **kwargs)
+            issnD = mU.doImport(namePath, fmt="json")
+            issnD["0021-9259"] = dict(issnD["0021-9258"], issn_print="0021-9259")
+            mU.doExport(namePath, issnD, fmt="json")
+            crP = CitationReferenceProvider(useCache=True, **kwargs)
+            self.assertIsNone(crP.getMedlineJournalTitle("0021-9259"))
+            self.assertEqual(crP.getMedlineIssnsByTitle("Journal of biological chemistry"), ["0021-9258", "1083-351X"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSharedTables(self):
+        """Test journal indices published in shared memory and searched by providers in worker processes (local reference data)."""
+        shm = None
+        try:
+            kwargs = {"cachePath": self.__sampleCachePath, "urlTargetMedline": self.__medlineSamplePath, "urlTargetCrossRef": self.__crossRefSamplePath}
+            issnL = ["0021-9258", "1083-351X", "2041-1723", "219258", "0021-9259", None]
+            for storageBackend in ["memory", "sqlite"]:
+                crP = CitationReferenceProvider(useCache=False, storageBackend=storageBackend, **kwargs)
+                shm = crP.publishSharedTables()
+                expectedD = {
+                    "titles": [crP.getMedlineJournalTitle(issn) for issn in issnL],
+                    "crossref_titles": [crP.getCrossRefJournalTitle(issn) for issn in issnL],
+                    "iso_abbrevs": crP.getMedlineJournalIsoAbbreviations(),
+                    "issns_by_title": ["0021-9258", "1083-351X"],
+                    "cache_files": [],
+                }
+                self.assertEqual(expectedD["titles"][:3], ["The Journal of biological chemistry", "The Journal of biological chemistry", "Nature communications"])
+                workerCachePath = os.path.join(self.__sampleCachePath, "worker-cache")
+                with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+                    rL = list(executor.map(_getSharedJournalData, [shm.name] * 2, [workerCachePath] * 2, [issnL] * 2))
+                self.assertEqual(rL, [expectedD] * 2)
+                # attach in process
+                shP = CitationReferenceProvider(cachePath=workerCachePath, sharedTables=shm.name)
+                self.assertEqual(shP.getJournalRecords(issnL), crP.getJournalRecords(issnL))
+                shP.close()
+                shm.close()
+                shm.unlink()
+                shm = None
+            # missing block
+            shP = CitationReferenceProvider(cachePath=self.__sampleCachePath, sharedTables="no-such-journal-tables")
+            self.assertIsNone(shP.getMedlineJournalTitle("0021-9258"))
         except Exception as e:
             logger.exception("Failing with %s", str(e))
             self.fail()
+        finally:
+            if shm:
+                shm.close()
+                shm.unlink()
 
 
 def suiteCitationReferenceTests():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(CitationReferenceProviderTests("testGetJournalAbbrevs"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testSharedJournalTitles"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testSqliteBackend"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testLazySourceLoading"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testConcurrentRefresh"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testConcurrentCacheRebuild"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testConditionalRefresh"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testBulkLookup"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testReverseNameLookup"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testFindJournalCandidates"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testNormalizeIssn"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testLegacyCache"))
+    suiteSelect.addTest(CitationReferenceProviderTests("testSharedTables"))
     return suiteSelect
 
 
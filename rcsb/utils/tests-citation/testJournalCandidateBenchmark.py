@@ -0,0 +1,185 @@
+##
+# File:    testJournalCandidateBenchmark.py
+# Date:    18-Oct-2026
+#
+# Update:
+##
+"""
+Offline latency and recall benchmarks for approximate journal title matching.
+
+The benchmarks query the Medline journal titles in test-data/J_Medline_sample.txt with exact,
+misspelled and truncated titles and check that the ISSNs of the journal are among the candidates.
+
+Setting CITATION_BENCHMARK_FULL=1 also runs the benchmark over all Medline and CrossRef journal
+titles held in the CitationReferenceProvider cache in test-output/CACHE (built by the provider tests).
+"""
+
+import logging
+import os
+import random
+import time
+import unittest
+
+from rcsb.utils.citation.CitationReferenceProvider import CitationReferenceProvider
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+
+class JournalCandidateBenchmarkTests(unittest.TestCase):
+    def setUp(self):
+        self.__cachePath = os.path.join(HERE, "test-output", "CACHE-BENCHMARK")
+        self.__medlinePath = os.path.join(HERE, "test-data", "J_Medline_sample.txt")
+        self.__crossRefPath = os.path.join(HERE, "test-data", "crossref_titleFile_sample.csv")
+        self.__resultPath = os.path.join(HERE, "test-output", "journal-candidate-benchmark.json")
+        self.__fullCachePath = os.path.join(HERE, "test-output", "CACHE")
+        self.__fullResultPath = os.path.join(HERE, "test-output", "journal-candidate-benchmark-full.json")
+        self.__rounds = 5
+        self.__topK = 10
+        self.__minRecallD = {"exact": 1.0, "misspelled": 0.9, "truncated": 0.9}
+        # full title lists include distinct journals sharing a title, so only exact title recall is checked
+        self.__minRecallFullD = {"exact": 0.99}
+
+    def tearDown(self):
+        pass
+
+    def __getPercentile(self, valL, pct):
+        """Return the nearest-rank percentile of the input values (0.0 for no values)."""
+        sL = sorted(valL)
+        return sL[min(len(sL) - 1, int(round(pct / 100.0 * (len(sL) - 1))))] if sL else 0.0
+
+    def __readCachedJournals(self, cachePath, sources=None):
+        """Return the journal titles and their ISSNs in the CitationReferenceProvider cache files.
+
+        Args:
+            cachePath (str): CitationReferenceProvider cache path (the 'citation-reference' directory is read)
+            sources (list, optional): reference sources to read. Defaults to ["medline", "crossref"].
+
+        Returns:
+            (list): [(journal title, (issn, ...)), ...] in title order or None if a cache file is missing
+        """
+        titleD = {}
+        mU = MarshalUtil()
+        for source in sources or ["medline", "crossref"]:
+            filePath = os.path.join(cachePath, "citation-reference", "%s-journals.json" % source)
+            if not mU.exists(filePath):
+                logger.info("Missing cached %s journal data %s", source, filePath)
+                return None
+            issnD = mU.doImport(filePath, fmt="json")
+            for issn, dD in issnD.items():
+                issn = CitationReferenceProvider.normalizeIssn(issn)
+                if issn and dD.get("journal_title"):
+                    titleD.setdefault(dD["journal_title"], set()).add(issn)
+            logger.info("Read %d cached %s ISSNs from %s", len(issnD), source, filePath)
+        return [(title, tuple(sorted(issnS))) for title, issnS in sorted(titleD.items())]
+
+    def __misspell(self, title, rng):
+        """Return the title with a deleted character and two adjacent characters transposed."""
+        ii = rng.randrange(len(title))
+        title = title[:ii] + title[ii + 1 :]
+        ii = rng.randrange(len(title) - 1)
+        return title[:ii] + title[ii + 1] + title[ii] + title[ii + 2 :]
+
+    def __truncate(self, title):
+        """Return the leading two thirds of the title (at least two words)."""
+        wordL = title.split()
+        return " ".join(wordL[: max(2, (2 * len(wordL) + 2) // 3)])
+
+    def __runBenchmark(self, crP, recL, rounds, resultPath):
+        """Return the n-gram index construction time and the candidate latency and recall for exact, misspelled and truncated titles."""
+        rng = random.Random(42)
+        queryD = {
+            "exact": [(title, issnT) for title, issnT in recL],
+            "misspelled": [(self.__misspell(title, rng), issnT) for title, issnT in recL if len(title) > 8],
+            "truncated": [(self.__truncate(title), issnT) for title, issnT in recL if len(title.split()) > 2],
+        }
+        rD = {}
+        startTime = time.time()
+        crP.findJournalCandidates(recL[0][0])
+        rD["constructIndex"] = {"seconds": time.time() - startTime}
+        #
+        for ky, queryL in queryD.items():
+            latencyL = []
+            nHits = 0
+            nTop = 0
+            for _ in range(rounds):
+                for title, _ in queryL:
+                    startTime = time.perf_counter()
+                    crP.findJournalCandidates(title, k=self.__topK)
+                    latencyL.append(time.perf_counter() - startTime)
+            for title, issnT in queryL:
+                issnL = [issn for issn, _ in crP.findJournalCandidates(title, k=self.__topK)]
+                if set(issnL) & set(issnT):
+                    nHits += 1
+                    nTop += 1 if issnL[0] in issnT else 0
+                else:
+                    logger.debug("Missed %s query %r (expected %r) candidates %r", ky, title, issnT, issnL)
+            rD[ky] = {
+                "titles": len(queryL),
+                "p50Msec": 1000.0 * self.__getPercentile(latencyL, 50),
+                "p99Msec": 1000.0 * self.__getPercentile(latencyL, 99),
+                "recallAtK": float(nHits) / float(len(queryL)),
+                "top1": float(nTop) / float(len(queryL)),
+            }
+        #
+        logger.info("N-gram index construction %8.4f seconds", rD["constructIndex"]["seconds"])
+        for ky in queryD:
+            logger.info(
+                "Candidates %-12s titles %7d p50 %8.4f ms p99 %8.4f ms recall@%d %.3f top1 %.3f",
+                ky,
+                rD[ky]["titles"],
+                rD[ky]["p50Msec"],
+                rD[ky]["p99Msec"],
+                self.__topK,
+                rD[ky]["recallAtK"],
+                rD[ky]["top1"],
+            )
+        MarshalUtil().doExport(resultPath, rD, fmt="json", indent=3)
+        return rD
+
+    def testCandidateBenchmark(self):
+        """Benchmark n-gram index construction, candidate lookup latency and recall for exact, misspelled and truncated titles"""
+        try:
+            crP = CitationReferenceProvider(cachePath=self.__cachePath, urlTargetMedline=self.__medlinePath, urlTargetCrossRef=self.__crossRefPath, useCache=False)
+            # the Medline journal titles (read with the provider's Medline parser) and their ISSNs
+            recL = [(title, tuple(crP.getMedlineIssnsByTitle(title))) for title in sorted(crP.getMedlineJournalIsoAbbreviations())]
+            self.assertGreater(len(recL), 50)
+            rD = self.__runBenchmark(crP, recL, self.__rounds, self.__resultPath)
+            for ky, minRecall in self.__minRecallD.items():
+                self.assertGreaterEqual(rD[ky]["recallAtK"], minRecall)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    @unittest.skipUnless(os.environ.get("CITATION_BENCHMARK_FULL") == "1", "Set CITATION_BENCHMARK_FULL=1 to benchmark the cached full journal title lists")
+    def testCandidateBenchmarkFull(self):
+        """Benchmark candidate lookup latency and recall over the cached full Medline and CrossRef journal title lists"""
+        recL = self.__readCachedJournals(self.__fullCachePath)
+        if not recL:
+            self.skipTest("No cached Medline and CrossRef journal data in %s" % self.__fullCachePath)
+        try:
+            crP = CitationReferenceProvider(cachePath=self.__fullCachePath, useCache=True)
+            rD = self.__runBenchmark(crP, recL, 1, self.__fullResultPath)
+            for ky, minRecall in self.__minRecallFullD.items():
+                self.assertGreaterEqual(rD[ky]["recallAtK"], minRecall)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteCandidateBenchmarkTests():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(JournalCandidateBenchmarkTests("testCandidateBenchmark"))
+    suiteSelect.addTest(JournalCandidateBenchmarkTests("testCandidateBenchmarkFull"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    #
+    mySuite = suiteCandidateBenchmarkTests()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
+#
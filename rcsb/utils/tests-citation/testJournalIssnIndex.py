@@ -0,0 +1,139 @@
+##
+# File:    testJournalIssnIndex.py
+# Date:    18-Oct-2026
+#
+# Update:
+##
+"""
+Test cases for the compact journal ISSN index.
+"""
+
+import copy
+import logging
+import os
+import unittest
+
+from rcsb.utils.citation.JournalIssnIndex import JournalIssnIndex
+from rcsb.utils.io.IoUtil import getObjSize
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+
+class JournalIssnIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.__medlinePath = os.path.join(HERE, "test-data", "J_Medline_sample.txt")
+        self.__fieldNames = ["journal_title", "iso_abbrev", "medline_abbrev", "issn_print", "issn_online"]
+
+    def tearDown(self):
+        pass
+
+    def __readMedlineIndex(self, filePath):
+        """Return Medline journal records keyed by print and online ISSN (copied for each key)."""
+        issnD = {}
+        fieldD = {"JournalTitle": "journal_title", "IsoAbbr": "iso_abbrev", "MedAbbr": "medline_abbrev", "ISSN (Print)": "issn_print", "ISSN (Online)": "issn_online"}
+        dD = {}
+        with open(filePath, "r", encoding="utf-8") as ifh:
+            for line in ifh:
+                if line.startswith("----"):
+                    for ky in ["issn_print", "issn_online"]:
+                        if ky in dD:
+                            issnD[dD[ky]] = copy.copy(dD)
+                    dD = {}
+                    continue
+                fields = line.split(":", 1)
+                if len(fields) == 2 and fields[0].strip() in fieldD and fields[1].strip():
+                    dD[fieldD[fields[0].strip()]] = fields[1].strip()
+        return issnD
+
+    def testKeyEncoding(self):
+        """Test lossless integer encoding of ISSN key forms"""
+        for issn in ["0021-9258", "1549-960X", "00219258", "219258", "1549960X", "0", "X", "0000-0000"]:
+            code = JournalIssnIndex.encodeKey(issn)
+            self.assertIsNotNone(code)
+            self.assertLess(code, 2**32)
+            self.assertEqual(JournalIssnIndex.decodeKey(code), issn)
+        self.assertNotEqual(JournalIssnIndex.encodeKey("0021-9258"), JournalIssnIndex.encodeKey("00219258"))
+        self.assertNotEqual(JournalIssnIndex.encodeKey("00219258"), JournalIssnIndex.encodeKey("219258"))
+        for issn in ["", "0021-925x", "0021_9258", "002192581", "12X4-5678", "١٢٣٤-٥٦٧٨", None, 219258]:
+            self.assertIsNone(JournalIssnIndex.encodeKey(issn))
+
+    def testIndexLookup(self):
+        """Test index accessors against the source dictionary"""
+        try:
+            issnD = self.__readMedlineIndex(self.__medlinePath)
+            issnD["not-an-issn"] = {"journal_title": "Overflow journal"}
+            jIdx = JournalIssnIndex(issnD, fieldNames=self.__fieldNames)
+            self.assertEqual(len(jIdx), len(issnD))
+            self.assertEqual(jIdx.toDict(), issnD)
+            # records shared by print and online ISSNs are stored once
+            self.assertLess(jIdx.getRecordCount(), len(issnD))
+            for issn, rD in issnD.items():
+                self.assertIn(issn, jIdx)
+                self.assertEqual(jIdx.getRecord(issn), rD)
+                for fN in self.__fieldNames:
+                    self.assertEqual(jIdx.get(issn, fN), rD.get(fN))
+            self.assertEqual(jIdx.get("0021-9258", "iso_abbrev"), "J Biol Chem")
+            self.assertEqual(jIdx.get("2041-1723", "journal_title"), "Nature communications")
+            self.assertIsNone(jIdx.get("2041-1723", "issn_print"))
+            self.assertEqual(jIdx.get("2041-1723", "issn_print", default=""), "")
+            for issn in ["00219258", "0021-9259", "", None, ["0021-9258"]]:
+                self.assertNotIn(issn, jIdx)
+                self.assertIsNone(jIdx.getRecord(issn))
+            self.assertEqual(len(list(jIdx.iterRecords())), jIdx.getRecordCount())
+            # bulk lookup with field projection
+            issnL = list(issnD.keys()) + ["0021-9259", None]
+            self.assertEqual(jIdx.getRecords(issnL), issnD)
+            rD = jIdx.getRecords(issnL, fieldNames=["iso_abbrev", "unknown"])
+            self.assertEqual(rD, {issn: {"iso_abbrev": tD["iso_abbrev"]} if "iso_abbrev" in tD else {} for issn, tD in issnD.items()})
+            #
+            dictSize = getObjSize(issnD)
+            indexSize = jIdx.getMemorySize()
+            logger.info("ISSN keys %d records %d dictionary size %d index size %d (%.1f%%)", len(jIdx), jIdx.getRecordCount(), dictSize, indexSize, 100.0 * indexSize / dictSize)
+            self.assertLess(indexSize, dictSize)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testBinaryImage(self):
+        """Test lookups on a binary index image against the in-memory index"""
+        try:
+            issnD = self.__readMedlineIndex(self.__medlinePath)
+            issnD["not-an-issn"] = {"journal_title": "Overflow journal"}
+            jIdx = JournalIssnIndex(issnD, fieldNames=self.__fieldNames)
+            bIdx = JournalIssnIndex(buffer=bytearray(jIdx.toBytes()))
+            self.assertEqual(len(bIdx), len(jIdx))
+            self.assertEqual(bIdx.getRecordCount(), jIdx.getRecordCount())
+            self.assertEqual(bIdx.toDict(), issnD)
+            self.assertEqual(list(bIdx.iterRecords()), list(jIdx.iterRecords()))
+            issnL = list(issnD.keys()) + ["0021-9259", None]
+            self.assertEqual(bIdx.getRecords(issnL, fieldNames=["iso_abbrev"]), jIdx.getRecords(issnL, fieldNames=["iso_abbrev"]))
+            self.assertEqual(bIdx.get("2041-1723", "journal_title"), "Nature communications")
+            self.assertIsNone(bIdx.get("2041-1723", "issn_print"))
+            self.assertNotIn("0021-9259", bIdx)
+            self.assertEqual(bIdx.toBytes(), jIdx.toBytes())
+            bIdx.close()
+            eIdx = JournalIssnIndex(buffer=JournalIssnIndex(fieldNames=self.__fieldNames).toBytes())
+            self.assertEqual((len(eIdx), eIdx.getRecordCount(), eIdx.getRecord("0021-9258")), (0, 0, None))
+            with self.assertRaises(ValueError):
+                JournalIssnIndex(buffer=b"NOTANINDEX" + bytes(32))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteJournalIssnIndexTests():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(JournalIssnIndexTests("testKeyEncoding"))
+    suiteSelect.addTest(JournalIssnIndexTests("testIndexLookup"))
+    suiteSelect.addTest(JournalIssnIndexTests("testBinaryImage"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    #
+    mySuite = suiteJournalIssnIndexTests()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
+#
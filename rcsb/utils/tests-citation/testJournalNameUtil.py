@@ -0,0 +1,64 @@
+##
+# File:    testJournalNameUtil.py
+# Date:    18-Oct-2026
+#
+# Update:
+##
+"""
+Test cases for journal title and abbreviation key normalization.
+"""
+
+import logging
+import unittest
+
+from rcsb.utils.citation.CitationReferenceProvider import CitationReferenceProvider
+from rcsb.utils.citation.JournalNameUtil import JournalNameUtil
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+
+class JournalNameUtilTests(unittest.TestCase):
+    def setUp(self):
+        self.__keyD = {
+            "The Journal of Physical Chemistry. B": "journal of physical chemistry b",
+            "Zeitschrift für Naturforschung": "zeitschrift fur naturforschung",
+            "ZEITSCHRIFT FUR NATURFORSCHUNG.": "zeitschrift fur naturforschung",
+            "Genes & Development": "genes and development",
+            "Genes + Development": "genes development",
+            "Genes ＋ Développement": "genes developpement",
+            "The": "the",
+            "  the  ": "the",
+            "The Lancet": "lancet",
+            "": "",
+        }
+
+    def tearDown(self):
+        pass
+
+    def testGetNameKey(self):
+        """Test journal name keys for ASCII and non-ASCII titles"""
+        try:
+            for name, key in self.__keyD.items():
+                self.assertEqual(JournalNameUtil.getNameKey(name), key)
+                self.assertEqual(CitationReferenceProvider.getJournalNameKey(name), key)
+            self.assertIsNone(JournalNameUtil.getNameKey(None))
+            # the ASCII fast path agrees with the Unicode path (the NBSP forces the Unicode path)
+            for name in ["Proc. Natl. Acad. Sci. U.S.A.", "J. Phys. Chem. B/C", "Cell <Cambridge, Mass.> $ ^~|` =", "The"]:
+                self.assertEqual(JournalNameUtil.getNameKey(name), JournalNameUtil.getNameKey(name + "\u00a0"))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteJournalNameUtilTests():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(JournalNameUtilTests("testGetNameKey"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    #
+    mySuite = suiteJournalNameUtilTests()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
+#
@@ -0,0 +1,174 @@
+##
+# File:    testJournalTitleAbbreviationBenchmark.py
+# Date:    18-Oct-2026
+#
+# Update:
+##
+"""
+Offline throughput, latency and memory benchmarks for journal title abbreviation.
+
+The benchmarks use a checked-in LTWA sample (test-data/LTWA_sample.txt, UTF-16LE as distributed by ISSN)
+and a corpus of Medline journal titles with their ISO abbreviations (test-data/J_Medline_sample.txt).
+Timing comparisons are only checked with CITATION_BENCHMARK_FULL=1 (timings are always logged).
+"""
+
+import logging
+import os
+import time
+import tracemalloc
+import unittest
+
+from rcsb.utils.citation.CitationReferenceProvider import CitationReferenceProvider
+from rcsb.utils.citation.JournalTitleAbbreviationProvider import JournalTitleAbbreviationProvider
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+
+class SuffixLemmatizer(object):
+    """Minimal deterministic plural lemmatizer (avoids the WordNet corpus download)."""
+
+    def lemmatize(self, word):
+        if word.endswith("ies") and len(word) > 4:
+            return word[:-3] + "y"
+        if word.endswith("s") and not word.endswith("ss") and len(word) > 3:
+            return word[:-1]
+        return word
+
+
+class JournalTitleAbbreviationBenchmarkTests(unittest.TestCase):
+    def setUp(self):
+        self.__cachePath = os.path.join(HERE, "test-output", "CACHE-BENCHMARK")
+        self.__ltwaPath = os.path.join(HERE, "test-data", "LTWA_sample.txt")
+        self.__medlinePath = os.path.join(HERE, "test-data", "J_Medline_sample.txt")
+        self.__resultPath = os.path.join(HERE, "test-output", "journal-abbreviation-benchmark.json")
+        self.__rounds = 5
+        # LTWA_sample.txt was curated to cover the terms of the J_Medline_sample.txt titles, so this accuracy is
+        #   optimistic relative to the full LTWA and arbitrary titles (it guards against regressions in the rules only)
+        self.__minAccuracy = 0.9
+        # maximum ratio of the uncached title latency with the binary LTWA index to that with the JSON term data
+        self.__maxBinaryIndexSlowdown = 1.5
+        # wall-clock timings vary on shared hosts so the timing comparisons are only checked with CITATION_BENCHMARK_FULL=1
+        self.__checkTimings = os.environ.get("CITATION_BENCHMARK_FULL") == "1"
+
+    def tearDown(self):
+        pass
+
+    def __getProvider(self, useCache, **kwargs):
+        return JournalTitleAbbreviationProvider(cachePath=self.__cachePath, urlTargetLtwa=self.__ltwaPath, useCache=useCache, lemmatizer=SuffixLemmatizer(), **kwargs)
+
+    def __getLatencyStats(self, latencyL):
+        """Return the title count, throughput and p50/p99 latency (milliseconds) of the input latencies (seconds)."""
+        sL = sorted(latencyL)
+        totalTime = sum(sL)
+        return {
+            "titles": len(sL),
+            "titlesPerSec": len(sL) / totalTime if totalTime else 0.0,
+            "p50Msec": 1000.0 * sL[int(round(0.50 * (len(sL) - 1)))] if sL else 0.0,
+            "p99Msec": 1000.0 * sL[int(round(0.99 * (len(sL) - 1)))] if sL else 0.0,
+        }
+
+    def __timeUncached(self, jtaP, titleL):
+        """Return the total time to abbreviate the input titles without memoized titles or words (best of the rounds)."""
+        timeL = []
+        for _ in range(self.__rounds):
+            startTime = time.perf_counter()
+            for title in titleL:
+                jtaP.getJournalAbbreviation(title, usePunctuation=False)
+            timeL.append(time.perf_counter() - startTime)
+        return min(timeL)
+
+    def __timeConstruction(self, useCache):
+        tracemalloc.start()
+        startTime = time.time()
+        jtaP = self.__getProvider(useCache)
+        elapsed = time.time() - startTime
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return jtaP, {"seconds": elapsed, "peakMemoryMB": peak / 1.0e6}
+
+    def testAbbreviationBenchmark(self):
+        """Benchmark provider construction, cold and warm cache abbreviation latency and ISO abbreviation accuracy"""
+        try:
+            # the Medline journal titles and their ISO abbreviations (read with the provider's Medline parser)
+            crP = CitationReferenceProvider(cachePath=self.__cachePath, urlTargetMedline=self.__medlinePath, useCache=False)
+            recL = sorted(crP.getMedlineJournalIsoAbbreviations().items())
+            self.assertGreater(len(recL), 50)
+            titleL = [title for title, _ in recL]
+            rD = {}
+            #
+            jtaP, rD["constructRebuild"] = self.__timeConstruction(useCache=False)
+            self.assertGreater(len(jtaP.getJournalAbbreviations(titleL[:2])), 0)
+            jtaP, rD["constructCached"] = self.__timeConstruction(useCache=True)
+            #
+            coldL = []
+            warmL = []
+            batchL = []
+            for _ in range(self.__rounds):
+                jtaP.clearCache()
+                for title in titleL:
+                    startTime = time.perf_counter()
+                    jtaP.getJournalAbbreviation(title, usePunctuation=False)
+                    coldL.append(time.perf_counter() - startTime)
+                for title in titleL:
+                    startTime = time.perf_counter()
+                    jtaP.getJournalAbbreviation(title, usePunctuation=False)
+                    warmL.append(time.perf_counter() - startTime)
+                jtaP.clearCache()
+                startTime = time.perf_counter()
+                jtaP.getJournalAbbreviations(titleL, usePunctuation=False)
+                batchL.append(time.perf_counter() - startTime)
+            rD["cold"] = self.__getLatencyStats(coldL)
+            rD["warm"] = self.__getLatencyStats(warmL)
+            rD["batchCold"] = {"titles": len(titleL), "titlesPerSec": len(titleL) * len(batchL) / sum(batchL)}
+            # term lookups on the binary LTWA index and the JSON term data
+            indexD = {}
+            for ky, useBinaryIndex in [("binaryIndex", True), ("jsonIndex", False)]:
+                ixP = self.__getProvider(True, useBinaryIndex=useBinaryIndex, titleCacheSize=0, wordCacheSize=0)
+                indexD[ky] = 1000.0 * self.__timeUncached(ixP, titleL) / len(titleL)
+            rD["uncachedMsecPerTitle"] = indexD
+            #
+            missL = []
+            for title, isoAbbrev in recL:
+                abbrev = jtaP.getJournalAbbreviation(title, usePunctuation=False)
+                # Medline titles are mostly in sentence case so the comparison is case-insensitive
+                if abbrev.lower() != isoAbbrev.lower():
+                    missL.append((title, abbrev, isoAbbrev))
+            rD["accuracy"] = {"titles": len(recL), "matched": len(recL) - len(missL), "fraction": float(len(recL) - len(missL)) / float(len(recL))}
+            #
+            for title, abbrev, isoAbbrev in missL:
+                logger.info("Mismatch %r -> %r (expected %r)", title, abbrev, isoAbbrev)
+            for ky in ["constructRebuild", "constructCached"]:
+                logger.info("Construction %-16s %8.4f seconds peak memory %8.2f MB", ky, rD[ky]["seconds"], rD[ky]["peakMemoryMB"])
+            for ky in ["cold", "warm"]:
+                logger.info("Abbreviation %-16s %10.1f titles/sec p50 %8.4f ms p99 %8.4f ms", ky, rD[ky]["titlesPerSec"], rD[ky]["p50Msec"], rD[ky]["p99Msec"])
+            logger.info("Abbreviation %-16s %10.1f titles/sec", "batchCold", rD["batchCold"]["titlesPerSec"])
+            for ky, msec in rD["uncachedMsecPerTitle"].items():
+                logger.info("Uncached abbreviation %-12s %8.4f ms/title", ky, msec)
+            logger.info("ISO abbreviation accuracy %d/%d (%.3f)", rD["accuracy"]["matched"], rD["accuracy"]["titles"], rD["accuracy"]["fraction"])
+            #
+            MarshalUtil().doExport(self.__resultPath, rD, fmt="json", indent=3)
+            self.assertGreaterEqual(rD["accuracy"]["fraction"], self.__minAccuracy)
+            if self.__checkTimings:
+                self.assertGreater(rD["warm"]["titlesPerSec"], rD["cold"]["titlesPerSec"])
+                self.assertLessEqual(indexD["binaryIndex"], self.__maxBinaryIndexSlowdown * indexD["jsonIndex"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteAbbreviationBenchmarkTests():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(JournalTitleAbbreviationBenchmarkTests("testAbbreviationBenchmark"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    #
+    mySuite = suiteAbbreviationBenchmarkTests()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
+#
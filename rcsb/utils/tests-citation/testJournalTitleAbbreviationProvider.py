@@ -11,12 +11,23 @@ Test cases for journal title abbreviation provider
 """
 
 import logging
+import multiprocessing
 import os
+import shutil
+import sys
+import time
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
 
 import nltk
 
+from rcsb.utils.citation.CacheFileUtil import CacheFileUtil
 from rcsb.utils.citation.JournalTitleAbbreviationProvider import JournalTitleAbbreviationProvider
+from rcsb.utils.citation.LtwaTermIndex import LtwaTermIndex
+from rcsb.utils.citation.MappedStringTable import MappedStringTable
+from rcsb.utils.citation.PubMedReader import PubMedReader
+from rcsb.utils.io.MarshalUtil import MarshalUtil
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
@@ -25,12 +36,82 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
 
+def _hasWordNet():
+    try:
+        nltk.data.find("corpora/wordnet.zip")
+        return True
+    except LookupError:
+        return False
+
+
+class StripLemmatizer(object):
+    """Non-linguistic lemmatizer stripping a trailing 'es' (e.g. 'acidses' -> 'acids')."""
+
+    def lemmatize(self, word):
+        return word[:-2] if word.endswith("es") else word
+
+
+def _getSharedMapCount(sharedTables):
+    """Return the number of mappings of the input shared memory block in this process (None if /proc/self/maps is not available)."""
+    if not os.access("/proc/self/maps", os.R_OK):
+        return None
+    with open("/proc/self/maps", "r", encoding="utf-8") as ifh:
+        return ifh.read().count("/" + sharedTables.lstrip("/"))
+
+
+def _getSharedAbbreviations(sharedTables, cachePath, titleList):
+    """Return title abbreviations from a provider attached to shared LTWA tables and the mapping counts
+    of the shared block while the provider is open and after it is closed (run in a worker process)."""
+    crP = JournalTitleAbbreviationProvider(cachePath=cachePath, urlTargetLtwa="/no/such/LTWA.txt", lemmatizer=None, sharedTables=sharedTables)
+    abbrevL = [crP.getJournalAbbreviation(title) for title in titleList]
+    numOpenMaps = _getSharedMapCount(sharedTables)
+    crP.close()
+    return abbrevL, numOpenMaps, _getSharedMapCount(sharedTables)
+
+
+def _getRebuiltAbbreviations(startQueue, cachePath, ltwaPath, titleList):
+    """Return title abbreviations and the LTWA cache file modification time from a provider rebuilding its cache (run in a worker process)."""
+    startQueue.put(os.getpid())
+    crP = JournalTitleAbbreviationProvider(cachePath=cachePath, urlTargetLtwa=ltwaPath, useCache=False, lemmatizer=None)
+    abbrevL = [crP.getJournalAbbreviation(title) for title in titleList]
+    crP.close()
+    return abbrevL, os.stat(os.path.join(cachePath, "journal-abbreviations", "iso-ltwa.json")).st_mtime_ns
+
+
 class JournalTitleAbbreviationProviderTests(unittest.TestCase):
     def setUp(self):
         self.__export = False
         self.__cachePath = os.path.join(HERE, "test-output", "CACHE")
-        nltk.download("wordnet")
-        nltk.download("omw-1.4")
+        self.__sampleCachePath = os.path.join(HERE, "test-output", "CACHE-SAMPLE")
+        self.__ltwaSamplePath = os.path.join(HERE, "test-data", "LTWA_sample.txt")
+        # Offline providers read the LTWA sample term data (rebuilt for each test) without the WordNet lemmatizer
+        self.__sampleKwargs = {"cachePath": self.__sampleCachePath, "urlTargetLtwa": self.__ltwaSamplePath, "lemmatizer": None}
+        self.__titleList = [
+            "Open Journal of Stomatology",
+            "Journal of Biological Chemistry",
+            "Journal of Molecular Biology",
+            "Nucleic Acids Research",
+            "Biochemistry",
+            "Proceedings of the National Academy of Sciences of the United States of America",
+            "Acta Crystallographica Section D: Structural Biology",
+            "Journal of the American Chemical Society",
+            "Biochemical and Biophysical Research Communications",
+            "Journal of Biological Chemistry",
+        ]
+        # abbreviations of the title list with the LTWA sample term data
+        self.__sampleAbbrevList = [
+            "Open J. Stomatol.",
+            "J. Biol. Chem.",
+            "J. Mol. Biol.",
+            "Nucleic Acids Res.",
+            "Biochemistry",
+            "Proceedings Natl. Acad. Sci. u. s. America",
+            "Acta Crystallogr. Sect. D Struct. Biol.",
+            "J. Am. Chem. Soc.",
+            "Biochem. Biophys. Res. Commun.",
+            "J. Biol. Chem.",
+        ]
+        JournalTitleAbbreviationProvider(useCache=False, **self.__sampleKwargs)
 
     def tearDown(self):
         pass
@@ -38,6 +119,8 @@ class JournalTitleAbbreviationProviderTests(unittest.TestCase):
     def testGetJournalAbbrevs(self):
         """Test get, cache and access resources support journal title abbreviation methods"""
         try:
+            nltk.download("wordnet")
+            nltk.download("omw-1.4")
             crP = JournalTitleAbbreviationProvider(cachePath=self.__cachePath, useCache=False)
             ok = crP.testCache()
             self.assertTrue(ok)
@@ -56,10 +139,355 @@ class JournalTitleAbbreviationProviderTests(unittest.TestCase):
             logger.exception("Failing with %s", str(e))
             self.fail()
 
+    def testLtwaTermIndexRegression(self):
+        """Test indexed prefix and suffix lookups against exhaustive scans over every word of the LTWA vocabulary
+        (the LTWA sample and the full LTWA term data when it has been cached by testGetJournalAbbrevs)
+        """
+        try:
+            mU = MarshalUtil()
+            for cachePath in [self.__sampleCachePath, self.__cachePath]:
+                aD = {}
+                ltwaPath = os.path.join(cachePath, "journal-abbreviations", "iso-ltwa.json")
+                if os.access(ltwaPath, os.R_OK):
+                    aD = mU.doImport(ltwaPath, fmt="json")
+                if not aD or not aD.get("abbrev"):
+                    self.assertNotEqual(cachePath, self.__sampleCachePath)
+                    logger.info("Skipping comparison for uncached LTWA term data in %s", cachePath)
+                    continue
+                prefixD = aD["abbrev"].get("prefix", {})
+                suffixD = aD["abbrev"].get("suffix", {})
+                self.assertTrue(prefixD and suffixD)
+                tIdx = LtwaTermIndex(prefixD=prefixD, suffixD=suffixD)
+                #
+                wordS = set()
+                for wD in aD["abbrev"].values():
+                    wordS.update(wD.keys())
+                wordL = sorted(wordS)
+                logger.info("Comparing indexed lookups for %d LTWA terms in %s", len(wordL), cachePath)
+                for word in wordL:
+                    for tWord in [word, word + "s", "re" + word]:
+                        # scan every prefix and suffix of the word from the longest
+                        tLenL = range(len(tWord), 0, -1)
+                        self.assertEqual(tIdx.getLongestPrefix(tWord), next((tWord[:tLen] for tLen in tLenL if tWord[:tLen] in prefixD), None))
+                        self.assertEqual(tIdx.getLongestSuffix(tWord), next((tWord[-tLen:] for tLen in tLenL if tWord[-tLen:] in suffixD), None))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testGetJournalAbbrevsBatch(self):
+        """Test batch journal title abbreviation matches single title abbreviation"""
+        try:
+            crP = JournalTitleAbbreviationProvider(useCache=True, **self.__sampleKwargs)
+            self.assertEqual(crP.getJournalAbbreviations(self.__titleList), self.__sampleAbbrevList)
+            for usePunctuation in [True, False]:
+                abbrevL = [crP.getJournalAbbreviation(title, usePunctuation=usePunctuation) for title in self.__titleList]
+                for workers in [1, 2]:
+                    self.assertEqual(crP.getJournalAbbreviations(self.__titleList, usePunctuation=usePunctuation, workers=workers), abbrevL)
+            self.assertEqual(crP.getJournalAbbreviations([]), [])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testAbbreviationCache(self):
+        """Test bounded memoization of title and title word abbreviations"""
+        try:
+            crP = JournalTitleAbbreviationProvider(useCache=True, titleCacheSize=4, wordCacheSize=100, **self.__sampleKwargs)
+            abbrevL = [crP.getJournalAbbreviation(title) for title in self.__titleList]
+            self.assertEqual(abbrevL, self.__sampleAbbrevList)
+            self.assertEqual([crP.getJournalAbbreviation(title) for title in self.__titleList[-4:]], abbrevL[-4:])
+            cD = crP.cacheInfo()
+            logger.info("Cache info %r", cD)
+            self.assertEqual(cD["title"]["currentSize"], 4)
+            self.assertGreaterEqual(cD["title"]["hits"], 4)
+            self.assertGreater(cD["word"]["hits"], 0)
+            self.assertLessEqual(cD["word"]["currentSize"], 100)
+            crP.clearCache()
+            cD = crP.cacheInfo()
+            self.assertEqual(cD["title"]["currentSize"] + cD["word"]["currentSize"], 0)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    @unittest.skipUnless(_hasWordNet(), "WordNet corpus is not installed")
+    def testGetJournalAbbrevsNoLemmatizer(self):
+        """Test journal title abbreviation using only the precomputed LTWA lemma table"""
+        try:
+            # the lemma table is built by a rebuild with the WordNet lemmatizer
+            crP = JournalTitleAbbreviationProvider(useCache=False, **dict(self.__sampleKwargs, lemmatizer="wordnet"))
+            self.assertEqual(crP.getJournalAbbreviations(self.__titleList), self.__sampleAbbrevList)
+            ltP = JournalTitleAbbreviationProvider(useCache=True, **self.__sampleKwargs)
+            for title in self.__titleList[:3]:
+                self.assertEqual(ltP.getJournalAbbreviation(title, usePunctuation=False), crP.getJournalAbbreviation(title, usePunctuation=False))
+            self.assertEqual(ltP.getJournalAbbreviation("Open Journal of Stomatology", usePunctuation=False), "Open J Stomatol")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testWithoutNltk(self):
+        """Test cache rebuilds and abbreviation when nltk cannot be imported"""
+        try:
+            kwargs = dict(self.__sampleKwargs, cachePath=os.path.join(self.__sampleCachePath, "no-nltk"))
+            with mock.patch.dict(sys.modules, {"nltk": None, "nltk.stem": None, "nltk.stem.wordnet": None}):
+                for lemmatizer in [None, "wordnet"]:
+                    crP = JournalTitleAbbreviationProvider(useCache=False, **dict(kwargs, lemmatizer=lemmatizer))
+                    self.assertEqual(crP.getJournalAbbreviations(self.__titleList), self.__sampleAbbrevList)
+                    self.assertEqual(crP.getJournalAbbreviation("Nucleic Acidses Research"), "Nucleic Acidses Res.")
+                    crP.close()
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testLemmaTableLemmatizer(self):
+        """Test the lemmas of a custom lemmatizer used in a cache rebuild are not served to other consumers"""
+        try:
+            kwargs = dict(self.__sampleKwargs, cachePath=os.path.join(self.__sampleCachePath, "lemma-table"))
+            title = "Nucleic Acidses Research"
+            for useBinaryIndex in [True, False]:
+                stP = JournalTitleAbbreviationProvider(useCache=False, useBinaryIndex=useBinaryIndex, **dict(kwargs, lemmatizer=StripLemmatizer()))
+                self.assertEqual(stP.getJournalAbbreviation(title), "Nucleic Acids Res.")
+                for useCache in [True, False]:
+                    ltP = JournalTitleAbbreviationProvider(useCache=useCache, useBinaryIndex=useBinaryIndex, **kwargs)
+                    self.assertEqual(ltP.getJournalAbbreviation(title), "Nucleic Acidses Res.")
+                    self.assertEqual(ltP.getJournalAbbreviation("Journal of Molecular Biology"), "J. Mol. Biol.")
+                    ltP.close()
+                stP.close()
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testBinaryIndex(self):
+        """Test journal title abbreviation with the memory-mapped binary LTWA index"""
+        try:
+            crP = JournalTitleAbbreviationProvider(useCache=True, **self.__sampleKwargs)
+            self.assertEqual(crP.getJournalAbbreviations(self.__titleList), self.__sampleAbbrevList)
+            self.assertTrue(os.access(os.path.join(self.__sampleCachePath, "journal-abbreviations", "iso-ltwa.bin"), os.R_OK))
+            jsP = JournalTitleAbbreviationProvider(useCache=True, useBinaryIndex=False, **self.__sampleKwargs)
+            for usePunctuation in [True, False]:
+                for title in self.__titleList:
+                    self.assertEqual(crP.getJournalAbbreviation(title, usePunctuation=usePunctuation), jsP.getJournalAbbreviation(title, usePunctuation=usePunctuation))
+            # the index file stays mapped (pages shared through the page cache) until close()
+            binaryPath = os.path.join(self.__sampleCachePath, "journal-abbreviations", "iso-ltwa.bin")
+            if os.access("/proc/self/maps", os.R_OK):
+                with open("/proc/self/maps", "r", encoding="utf-8") as ifh:
+                    numMaps = ifh.read().count(binaryPath)
+                crP.close()
+                with open("/proc/self/maps", "r", encoding="utf-8") as ifh:
+                    self.assertLess(ifh.read().count(binaryPath), numMaps)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testGetJournalAbbrevsLanguages(self):
+        """Test journal title abbreviation with language specific term mappings"""
+        try:
+            crP = JournalTitleAbbreviationProvider(useCache=True, **self.__sampleKwargs)
+            self.assertEqual(crP.getJournalAbbreviations(self.__titleList), self.__sampleAbbrevList)
+            self.assertEqual(crP.getLanguages(), ["eng"])
+            enP = JournalTitleAbbreviationProvider(useCache=True, languages="eng", **self.__sampleKwargs)
+            self.assertEqual([enP.getJournalAbbreviation(title) for title in self.__titleList], [crP.getJournalAbbreviation(title) for title in self.__titleList])
+            #
+            # terms with mappings in several languages ('archive', 'annal-' eng/ger and '-ologie' fre/ger) take the first requested language -
+            #   the suffix abbreviation replaces only the end of the word, and a title with a term that has no mapping
+            #   in the requested languages ('-ologie' for "eng") is returned unabbreviated
+            titleL = ["Archive of Biology", "Annals of Physics", "Revue de cardiologie"]
+            expectedD = {
+                ("eng",): ["Arch. Biol.", "Ann. Phys.", "Revue de cardiologie"],
+                ("ger", "eng"): ["Archiv. Biol.", "Annal. Phys.", "Revue cardiol."],
+                ("eng", "ger"): ["Arch. Biol.", "Ann. Phys.", "Revue cardiol."],
+                ("fre", "eng"): ["Arch. Biol.", "Ann. Phys.", "Revue cardiol."],
+            }
+            for languages, abbrevL in expectedD.items():
+                lgP = JournalTitleAbbreviationProvider(useCache=True, languages=list(languages), **self.__sampleKwargs)
+                self.assertEqual(lgP.getLanguages(), list(languages))
+                self.assertEqual([lgP.getJournalAbbreviation(title) for title in titleL], abbrevL)
+                self.assertEqual(lgP.getJournalAbbreviations(self.__titleList), self.__sampleAbbrevList)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSuffixInfixTerms(self):
+        """Test suffix and infix term abbreviations retain the part of the word preceding the term"""
+        try:
+            crP = JournalTitleAbbreviationProvider(useCache=True, **self.__sampleKwargs)
+            # '-ology' (-ol.), '-carditis' (-cardit.), '-cardi-' (-card.) and '-bacter-' (-bact.)
+            titleL = ["Journal of Cardiology", "Myocarditis Research", "Myocardial Research", "Enterobacteria Research"]
+            abbrevL = ["J. Cardiol.", "Myocardit. Res.", "Myocard. Res.", "Enterobact. Res."]
+            self.assertEqual([crP.getJournalAbbreviation(title) for title in titleL], abbrevL)
+            self.assertEqual(crP.getJournalAbbreviations(titleL), abbrevL)
+            self.assertEqual(crP.getJournalAbbreviation("Myocardial Research", usePunctuation=False), "Myocard Res")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testPersistentResultCache(self):
+        """Test persistent title abbreviation results saved in the cache directory"""
+        try:
+            crP = JournalTitleAbbreviationProvider(useCache=True, useResultCache=True, **self.__sampleKwargs)
+            self.assertEqual(crP.getJournalAbbreviations(self.__titleList), self.__sampleAbbrevList)
+            abbrevL = crP.getJournalAbbreviations(self.__titleList)
+            self.assertTrue(crP.saveResultCache())
+            self.assertTrue(os.access(os.path.join(self.__sampleCachePath, "journal-abbreviations", "iso-abbrev-results.json"), os.R_OK))
+            #
+            rcP = JournalTitleAbbreviationProvider(useCache=True, useResultCache=True, **self.__sampleKwargs)
+            self.assertEqual([rcP.getJournalAbbreviation(title) for title in self.__titleList], abbrevL)
+            # all titles are served from the persistent results
+            self.assertEqual(rcP.cacheInfo()["title"]["misses"], 0)
+            # results of another rules version are discarded
+            resultPath = os.path.join(self.__sampleCachePath, "journal-abbreviations", "iso-abbrev-results.json")
+            rD = MarshalUtil().doImport(resultPath, fmt="json")
+            rD["rules_version"] = JournalTitleAbbreviationProvider.RULES_VERSION - 1
+            MarshalUtil().doExport(resultPath, rD, fmt="json")
+            rcP = JournalTitleAbbreviationProvider(useCache=True, useResultCache=True, **self.__sampleKwargs)
+            self.assertEqual([rcP.getJournalAbbreviation(title) for title in self.__titleList], abbrevL)
+            self.assertEqual(rcP.cacheInfo()["title"]["misses"], len(set(self.__titleList)))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testKnownAbbreviations(self):
+        """Test known (curated) ISO abbreviations take precedence over LTWA rule-based abbreviation"""
+        try:
+            knownD = {
+                "Proceedings of the National Academy of Sciences of the United States of America": "Proc Natl Acad Sci U S A",
+                "Acta crystallographica. Section D, Biological crystallography": "Acta Crystallogr D Biol Crystallogr",
+                "The journal of physical chemistry. B": "J Phys Chem B",
+                "Zeitschrift für Naturforschung": "Z Naturforsch",
+                "Genes + Development": "Genes Dev",
+            }
+            crP = JournalTitleAbbreviationProvider(useCache=True, knownAbbreviations=knownD, **self.__sampleKwargs)
+            self.assertEqual(crP.getKnownAbbreviationCount(), 5)
+            title = "Proceedings of the National Academy of Sciences of the United States of America"
+            self.assertEqual(crP.getJournalAbbreviation(title, usePunctuation=False), "Proc Natl Acad Sci U S A")
+            self.assertEqual(crP.getJournalAbbreviation(title), "Proc. Natl. Acad. Sci. U. S. A.")
+            self.assertEqual(crP.getJournalAbbreviation("Acta Crystallographica Section D: Biological Crystallography"), "Acta Crystallogr. D Biol. Crystallogr.")
+            self.assertEqual(crP.getJournalAbbreviation("Journal of Physical Chemistry B"), "J. Phys. Chem. B")
+            # title keys are shared with CitationReferenceProvider (diacritics and symbols are ignored)
+            for title in ["Zeitschrift fur Naturforschung", "ZEITSCHRIFT FÜR NATURFORSCHUNG"]:
+                self.assertEqual(crP.getJournalAbbreviation(title), "Z. Naturforsch.")
+            self.assertEqual(crP.getJournalAbbreviation("Genes Development"), "Genes Dev.")
+            # unknown titles fall back to rule-based abbreviation
+            self.assertEqual(crP.getJournalAbbreviation("Journal of Molecular Biology"), "J. Mol. Biol.")
+            titleL = list(knownD.keys()) + ["Journal of Molecular Biology"]
+            self.assertEqual(crP.getJournalAbbreviations(titleL), [crP.getJournalAbbreviation(title) for title in titleL])
+            #
+            prd = PubMedReader()
+            with open(os.path.join(TOPDIR, "rcsb", "utils", "citation", "pubmed-example.xml"), "r", encoding="utf-8") as ifh:
+                pubMedD = prd.readString(ifh.read())
+            self.assertEqual(crP.addPubMedAbbreviations(pubMedD), 1)
+            self.assertEqual(crP.getJournalAbbreviation("Journal of Biological Chemistry", usePunctuation=False), "J Biol Chem")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testConditionalRefresh(self):
+        """Test conditional refresh reuses the cached LTWA term data when the source is unchanged"""
+        try:
+            cachePath = os.path.join(HERE, "test-output", "CACHE-SAMPLE")
+            ltwaPath = os.path.join(HERE, "test-output", "LTWA_sample_copy.txt")
+            binaryPath = os.path.join(cachePath, "journal-abbreviations", "iso-ltwa.bin")
+            with open(os.path.join(HERE, "test-data", "LTWA_sample.txt"), "rb") as ifh, open(ltwaPath, "wb") as ofh:
+                ofh.write(ifh.read())
+            crP = JournalTitleAbbreviationProvider(cachePath=cachePath, urlTargetLtwa=ltwaPath, useCache=False, lemmatizer=None, conditionalRefresh=True)
+            self.assertEqual(crP.getJournalAbbreviation("Journal of Molecular Biology"), "J. Mol. Biol.")
+            self.assertTrue(os.access(os.path.join(cachePath, "journal-abbreviations", "ltwa-source-state.json"), os.R_OK))
+            mTime = os.stat(binaryPath).st_mtime_ns
+            # unchanged source
+            crP = JournalTitleAbbreviationProvider(cachePath=cachePath, urlTargetLtwa=ltwaPath, useCache=False, lemmatizer=None, conditionalRefresh=True)
+            self.assertEqual(os.stat(binaryPath).st_mtime_ns, mTime)
+            self.assertEqual(crP.getJournalAbbreviation("Journal of Molecular Biology"), "J. Mol. Biol.")
+            # changed source
+            with open(ltwaPath, "ab") as ofh:
+                ofh.write("zzyzxology\tzzyzxol.\teng\r\n".encode("utf-16-le"))
+            crP = JournalTitleAbbreviationProvider(cachePath=cachePath, urlTargetLtwa=ltwaPath, useCache=False, lemmatizer=None, conditionalRefresh=True)
+            self.assertNotEqual(os.stat(binaryPath).st_mtime_ns, mTime)
+            self.assertEqual(crP.getJournalAbbreviation("Journal of Zzyzxology"), "J. Zzyzxol.")
+            os.remove(ltwaPath)
+            # failed fetch and no cached data
+            emptyPath = os.path.join(cachePath, "no-source")
+            shutil.rmtree(emptyPath, ignore_errors=True)
+            crP = JournalTitleAbbreviationProvider(cachePath=emptyPath, urlTargetLtwa=ltwaPath, useCache=False, lemmatizer=None, conditionalRefresh=True)
+            self.assertFalse(crP.testCache())
+            self.assertFalse(os.access(os.path.join(emptyPath, "journal-abbreviations", "iso-ltwa.json"), os.R_OK))
+            self.assertFalse(os.access(os.path.join(emptyPath, "journal-abbreviations", "ltwa-source-state.json"), os.R_OK))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSharedTables(self):
+        """Test LTWA tables published in shared memory and read by providers in worker processes"""
+        shm = None
+        try:
+            crP = JournalTitleAbbreviationProvider(useCache=True, **self.__sampleKwargs)
+            abbrevL = [crP.getJournalAbbreviation(title) for title in self.__titleList]
+            self.assertEqual(abbrevL[2], "J. Mol. Biol.")
+            shm = crP.publishSharedTables()
+            workerCachePath = os.path.join(self.__sampleCachePath, "worker-cache")
+            with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+                rL = list(executor.map(_getSharedAbbreviations, [shm.name] * 2, [workerCachePath] * 2, [self.__titleList] * 2))
+            self.assertEqual([abL for abL, _, _ in rL], [abbrevL] * 2)
+            # workers search the shared block in place (it stays mapped until close()) including the published term tries
+            for _, numOpenMaps, numClosedMaps in rL:
+                if numOpenMaps is not None:
+                    self.assertGreater(numOpenMaps, numClosedMaps)
+            msT = MappedStringTable(sharedMemoryName=shm.name)
+            self.assertEqual(sorted(msT.getBlobNames()), ["trie.prefix", "trie.suffix"])
+            msT.close()
+            self.assertFalse(os.access(os.path.join(workerCachePath, "journal-abbreviations", "iso-ltwa.json"), os.R_OK))
+            shP = JournalTitleAbbreviationProvider(cachePath=workerCachePath, lemmatizer=None, sharedTables=shm.name)
+            self.assertEqual(shP.getJournalAbbreviations(self.__titleList), abbrevL)
+            shP.close()
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+        finally:
+            if shm:
+                shm.close()
+                shm.unlink()
+
+    def testConcurrentCacheRebuild(self):
+        """Test LTWA cache rebuilds by concurrent worker processes waiting on a held cache lock (the cache is rebuilt once)"""
+        try:
+            cachePath = os.path.join(HERE, "test-output", "CACHE-SAMPLE", "concurrent-ltwa")
+            ltwaPath = os.path.join(HERE, "test-data", "LTWA_sample.txt")
+            shutil.rmtree(cachePath, ignore_errors=True)
+            dirPath = os.path.join(cachePath, "journal-abbreviations")
+            MarshalUtil().mkdir(dirPath)
+            numWorkers = 3
+            with multiprocessing.get_context("spawn").Manager() as manager:
+                startQueue = manager.Queue()
+                with ProcessPoolExecutor(max_workers=numWorkers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                    with CacheFileUtil().lock(os.path.join(dirPath, "iso-ltwa.json")) as locked:
+                        self.assertTrue(locked)
+                        futureL = [executor.submit(_getRebuiltAbbreviations, startQueue, cachePath, ltwaPath, self.__titleList) for _ in range(numWorkers)]
+                        for _ in range(numWorkers):
+                            startQueue.get(timeout=60)
+                        time.sleep(1.0)
+                    rL = [future.result() for future in futureL]
+            self.assertEqual(rL[0][0][2], "J. Mol. Biol.")
+            self.assertEqual(rL, [rL[0]] * numWorkers)
+            self.assertEqual([fn for fn in os.listdir(dirPath) if fn.endswith(".tmp")], [])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def suiteIsoAbbreviationTests():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testGetJournalAbbrevs"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testLtwaTermIndexRegression"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testGetJournalAbbrevsBatch"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testAbbreviationCache"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testGetJournalAbbrevsNoLemmatizer"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testWithoutNltk"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testLemmaTableLemmatizer"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testBinaryIndex"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testGetJournalAbbrevsLanguages"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testSuffixInfixTerms"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testPersistentResultCache"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testKnownAbbreviations"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testConditionalRefresh"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testSharedTables"))
+    suiteSelect.addTest(JournalTitleAbbreviationProviderTests("testConcurrentCacheRebuild"))
     return suiteSelect
 
 
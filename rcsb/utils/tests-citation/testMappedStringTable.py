@@ -0,0 +1,135 @@
+##
+# File:    testMappedStringTable.py
+# Date:    18-Oct-2026
+#
+# Update:
+##
+"""
+Test cases for memory-mapped string tables.
+"""
+
+import logging
+import multiprocessing
+import os
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from rcsb.utils.citation.MappedStringTable import MappedStringTable
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+
+def _readSharedTables(sharedMemoryName):
+    """Return the string tables in the named shared memory block (run in a worker process)."""
+    mst = MappedStringTable(sharedMemoryName=sharedMemoryName)
+    rD = {name: dict(mst.getTable(name).items()) for name in mst.getTableNames()}
+    mst.close()
+    return rD
+
+
+class MappedStringTableTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output")
+        self.__filePath = os.path.join(self.__workPath, "test-string-tables.bin")
+        self.__tableD = {
+            "full": {"journal": "j.", "biology": "biol.", "société": "soc.", "acta": "", "b": "b"},
+            "prefix": {"biochemi": "biochem.", "crystallogr": "crystallogr."},
+            "empty": {},
+        }
+
+    def tearDown(self):
+        pass
+
+    def testRoundTrip(self):
+        """Test write and memory-mapped read of string tables"""
+        try:
+            os.makedirs(self.__workPath, exist_ok=True)
+            ok = MappedStringTable.write(self.__filePath, self.__tableD)
+            self.assertTrue(ok)
+            mst = MappedStringTable(filePath=self.__filePath)
+            self.assertEqual(sorted(mst.getTableNames()), sorted(self.__tableD.keys()))
+            for name, tD in self.__tableD.items():
+                tV = mst.getTable(name)
+                self.assertEqual(len(tV), len(tD))
+                self.assertEqual(dict(tV), tD)
+                self.assertEqual(list(tV), sorted(tD.keys(), key=lambda k: k.encode("utf-8")))
+                for ky, val in tD.items():
+                    self.assertIn(ky, tV)
+                    self.assertEqual(tV[ky], val)
+            fullV = mst.getTable("full")
+            self.assertNotIn("journals", fullV)
+            self.assertNotIn(1, fullV)
+            self.assertIsNone(fullV.get("zzz"))
+            self.assertEqual(fullV.get("société"), "soc.")
+            self.assertIsNone(mst.getTable("suffix"))
+            with self.assertRaises(KeyError):
+                _ = fullV["zzz"]
+            # every key is found by its hash slot in a larger table
+            bigD = {"k%d" % ii: "v%d" % (ii * 7) for ii in range(5000)}
+            self.assertTrue(MappedStringTable.write(self.__filePath, {"big": bigD}, blobD={"blob": b"\x00\x01binary", "empty": b""}))
+            mst.close()
+            mst = MappedStringTable(filePath=self.__filePath)
+            bigV = mst.getTable("big")
+            self.assertTrue(all(bigV.get(ky) == val for ky, val in bigD.items()))
+            self.assertIsNone(bigV.get("k5000"))
+            self.assertEqual(sorted(mst.getBlobNames()), ["blob", "empty"])
+            self.assertEqual(bytes(mst.getBlob("blob")), b"\x00\x01binary")
+            self.assertEqual(bytes(mst.getBlob("empty")), b"")
+            self.assertIsNone(mst.getBlob("zzz"))
+            mst.close()
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testBufferInput(self):
+        """Test reading string tables from an in-memory buffer"""
+        try:
+            mst = MappedStringTable(buffer=bytearray(MappedStringTable.toBytes(self.__tableD)))
+            self.assertEqual(dict(mst.getTable("prefix")), self.__tableD["prefix"])
+            mst.close()
+            with self.assertRaises(ValueError):
+                MappedStringTable(buffer=b"NOTATABLE" + bytes(16))
+            # string tables of the prior format (without hash slots) are not read
+            with self.assertRaises(ValueError):
+                MappedStringTable(buffer=b"MSTABLE1" + bytes(16))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSharedMemory(self):
+        """Test publishing string tables in shared memory and reading them in worker processes"""
+        shm = None
+        try:
+            shm = MappedStringTable.toSharedMemory(self.__tableD)
+            mst = MappedStringTable(sharedMemoryName=shm.name)
+            self.assertEqual(mst.getTable("full")["société"], "soc.")
+            self.assertEqual(list(mst.getTable("prefix").items()), sorted(self.__tableD["prefix"].items()))
+            mst.close()
+            with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+                rL = list(executor.map(_readSharedTables, [shm.name] * 2))
+            self.assertEqual(rL, [self.__tableD] * 2)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+        finally:
+            if shm:
+                shm.close()
+                shm.unlink()
+
+
+def suiteMappedStringTableTests():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(MappedStringTableTests("testRoundTrip"))
+    suiteSelect.addTest(MappedStringTableTests("testBufferInput"))
+    suiteSelect.addTest(MappedStringTableTests("testSharedMemory"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    #
+    mySuite = suiteMappedStringTableTests()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
+#